@@ -5,37 +5,161 @@ import os
 import json
 import re
 import random
+import math
 import logging
+import logging.handlers
+import contextvars
+import atexit
 import base64
+import gzip
+import hashlib
+import zlib
 import pickle
+import shutil
+import signal
+import socket
+import subprocess
 import threading
+import queue
+import argparse
+import csv
+import dbm
+import itertools
+import bisect
+import heapq
+import cProfile
+import pstats
+import tracemalloc
+import importlib
+from concurrent.futures import ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+import sys
+import traceback
+import html
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
 from bs4 import BeautifulSoup
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
-from datetime import datetime, timedelta
+from datetime import datetime, date
+from enum import Enum, IntEnum
+from collections import OrderedDict, Counter, deque, defaultdict
+from array import array
+from functools import lru_cache
+from contextlib import contextmanager
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        WebDriverException)
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from fake_useragent import UserAgent
 from cryptography.fernet import Fernet
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("job_bot.log"),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger("JobBot")
 
+# Platform, job id and phase of the work in progress, attached to every log record
+_log_context = contextvars.ContextVar("log_context", default={})
+
+@contextmanager
+def log_context(**fields):
+    """Tag log records emitted inside the block with the given fields"""
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+class _LogContextFilter(logging.Filter):
+    """Copies the current log context onto records in the emitting thread"""
+    
+    def filter(self, record):
+        for name, value in _log_context.get().items():
+            if not hasattr(record, name):
+                setattr(record, name, value)
+        return True
+
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per record, with the context fields when present"""
+    
+    CONTEXT_FIELDS = ("phase", "profile", "platform", "job_id")
+    
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage()
+        }
+        for name in self.CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queues records as they are, so %-style messages are only rendered on the listener thread"""
+    
+    def prepare(self, record):
+        return record
+
+class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Size-based rotation that gzips each rotated file"""
+    
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self._rotate
+    
+    @staticmethod
+    def _rotate(source, dest):
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+_log_listener = None
+
+def configure_logging(level="INFO", levels=None, path="job_bot.log", max_bytes=10 * 1024 * 1024,
+                      backups=5, json_file=True):
+    """Route all logging through a queue to a listener thread that writes the file and console"""
+    global _log_listener
+    if _log_listener:
+        _log_listener.stop()
+    
+    file_handler = CompressedRotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups,
+                                                 encoding="utf-8")
+    file_handler.setFormatter(JsonLogFormatter() if json_file else
+                              logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(_LogContextFilter())
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+    
+    # Per-logger levels, e.g. {"selenium": "WARNING", "JobBot": "DEBUG"}
+    for name, logger_level in (levels or {}).items():
+        logging.getLogger(name).setLevel(logger_level)
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler,
+                                                   respect_handler_level=True)
+    _log_listener.start()
+
+@atexit.register
+def _stop_logging():
+    """Flush queued records on exit"""
+    if _log_listener:
+        _log_listener.stop()
+
 class CredentialManager:
     """Handles secure storage and retrieval of credentials"""
     
@@ -80,29 +204,346 @@ class CredentialManager:
             return credentials["username"], credentials["password"]
             
         except FileNotFoundError:
-            logger.error(f"No credentials found for {platform}")
+            logger.error("No credentials found for %s", platform)
             return None, None
         except Exception as e:
-            logger.error(f"Error retrieving credentials for {platform}: {str(e)}")
+            logger.error("Error retrieving credentials for %s: %s", platform, e)
             return None, None
 
+class BrowserDaemon:
+    """Keeps a long-lived Chrome process with a persistent profile that runs can attach to"""
+    
+    def __init__(self, profile_dir="chrome_profile", port=9222, chrome_binary=None, headless=False,
+                 state_file="browser_daemon.json", startup_timeout=30, stop_timeout=10):
+        self.profile_dir = os.path.abspath(profile_dir)
+        self.port = port
+        self.chrome_binary = chrome_binary
+        self.headless = headless
+        self.state_file = state_file
+        self.startup_timeout = startup_timeout
+        self.stop_timeout = stop_timeout
+        
+    @property
+    def debugger_address(self):
+        return f"127.0.0.1:{self.port}"
+    
+    def load_state(self):
+        """Load the saved daemon state (pid, user agent, driver path)"""
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error("Error reading browser daemon state: %s", e)
+        return {}
+    
+    def save_state(self, state):
+        """Persist daemon state for later runs"""
+        with open(self.state_file, 'w') as f:
+            json.dump(state, f)
+    
+    def is_healthy(self, timeout=1):
+        """Check that the browser answers on its remote-debugging endpoint"""
+        try:
+            response = requests.get(f"http://{self.debugger_address}/json/version", timeout=timeout)
+            return response.status_code == 200 and "webSocketDebuggerUrl" in response.json()
+        except Exception:
+            return False
+    
+    def _port_open(self):
+        """Whether anything still listens on the debugging port"""
+        try:
+            with socket.create_connection(("127.0.0.1", self.port), timeout=0.5):
+                return True
+        except OSError:
+            return False
+    
+    def _owns_process(self, pid):
+        """Whether pid is the Chrome started with our profile and debugging port (not a reused pid)"""
+        try:
+            with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                command = f.read().decode(errors="replace").replace("\0", " ")
+        except OSError:
+            # No procfs (macOS): fall back to ps
+            try:
+                command = subprocess.run(["ps", "-p", str(pid), "-o", "args="], capture_output=True,
+                                         text=True, timeout=5).stdout.strip() + " "
+            except (OSError, subprocess.SubprocessError):
+                return False
+        return (f"--user-data-dir={self.profile_dir} " in command
+                and f"--remote-debugging-port={self.port} " in command)
+    
+    @staticmethod
+    def _exited(pid):
+        """Whether the process is gone, reaping it if it was started from this run"""
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                return True
+        except ChildProcessError:
+            pass
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return True
+        return False
+    
+    def _wait_for_exit(self, pid, timeout):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self._exited(pid) and not self._port_open():
+                return True
+            time.sleep(0.2)
+        return False
+    
+    def _find_chrome_binary(self):
+        """Locate a Chrome/Chromium executable"""
+        if self.chrome_binary:
+            return self.chrome_binary
+        for name in ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]:
+            path = shutil.which(name)
+            if path:
+                return path
+        raise RuntimeError("Chrome executable not found - set chrome_binary in the daemon config")
+    
+    def start(self):
+        """Launch the browser process detached from this run"""
+        if self.is_healthy():
+            logger.info("Browser daemon already running on port %s", self.port)
+            return True
+        os.makedirs(self.profile_dir, exist_ok=True)
+        
+        args = [
+            self._find_chrome_binary(),
+            f"--remote-debugging-port={self.port}",
+            f"--user-data-dir={self.profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-blink-features=AutomationControlled",
+            "--window-size=1920,1080",
+        ]
+        if self.headless:
+            args.append("--headless=new")
+        
+        process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   start_new_session=True)
+        
+        # Keep the user agent and driver path from earlier runs so sessions stay consistent
+        state = self.load_state()
+        state.update({
+            "pid": process.pid,
+            "port": self.port,
+            "profile_dir": self.profile_dir,
+            "started": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })
+        self.save_state(state)
+        
+        # Wait for the debugging endpoint to come up
+        deadline = time.time() + self.startup_timeout
+        while time.time() < deadline:
+            if self.is_healthy():
+                logger.info("Browser daemon started on port %s (pid %s)", self.port, process.pid)
+                return True
+            if process.poll() is not None:
+                break
+            time.sleep(0.5)
+        
+        logger.error("Browser daemon failed to start")
+        self.stop()
+        return False
+    
+    def stop(self):
+        """Terminate the daemon browser process and wait until it and its port are gone"""
+        state = self.load_state()
+        pid = state.pop("pid", None)
+        if not pid:
+            return
+        if self._exited(pid) or not self._owns_process(pid):
+            # Saved by an earlier session; the pid may now belong to another process
+            logger.info("Dropping stale browser daemon pid %s", pid)
+            self.save_state(state)
+            return
+        
+        try:
+            os.kill(pid, signal.SIGTERM)
+            if not self._wait_for_exit(pid, self.stop_timeout):
+                logger.warning("Browser daemon (pid %s) did not exit - killing it", pid)
+                # The daemon leads its own process group, so this takes its renderers too
+                os.killpg(pid, signal.SIGKILL)
+                self._wait_for_exit(pid, self.stop_timeout)
+            logger.info("Browser daemon stopped (pid %s)", pid)
+        except OSError:
+            pass
+        self.save_state(state)
+    
+    def ensure_running(self):
+        """Health-check the daemon and restart it if needed"""
+        if self.is_healthy():
+            return True
+        
+        logger.warning("Browser daemon not responding - restarting")
+        self.stop()
+        return self.start()
+    
+    def status(self):
+        """Return daemon state along with its current health"""
+        state = self.load_state()
+        state["healthy"] = self.is_healthy()
+        return state
+
+class BrowserWatchdog:
+    """Keeps a long-running browser healthy: command deadlines, stray windows and recycling"""
+    
+    def __init__(self, enabled=True, command_timeout=120, page_load_timeout=60, script_timeout=30,
+                 recycle_after=40, max_memory_mb=1024, memory_check_every=5):
+        self.enabled = enabled
+        self.command_timeout = command_timeout
+        self.page_load_timeout = page_load_timeout
+        self.script_timeout = script_timeout
+        self.recycle_after = recycle_after
+        self.max_memory_mb = max_memory_mb
+        self.memory_check_every = max(1, memory_check_every)
+        self.applications = 0
+        self.stats = {"recycles": 0, "stray_handles_closed": 0, "unresponsive": 0, "peak_memory_mb": 0.0}
+    
+    def arm(self, driver):
+        """Put deadlines on every command of a fresh driver so a hung call raises instead of blocking"""
+        self.applications = 0
+        if not self.enabled:
+            return
+        driver.set_page_load_timeout(self.page_load_timeout)
+        driver.set_script_timeout(self.script_timeout)
+        # The HTTP timeout to chromedriver bounds calls that never return at all
+        client_config = getattr(driver.command_executor, "_client_config", None)
+        if client_config is not None:
+            client_config.timeout = self.command_timeout
+        else:
+            driver.command_executor.set_timeout(self.command_timeout)
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+        except Exception as e:
+            logger.debug("Renderer metrics unavailable: %s", e)
+    
+    def responsive(self, driver):
+        """Whether the driver still answers a trivial command"""
+        try:
+            driver.current_url
+            return True
+        except Exception as e:
+            logger.warning("Browser not responding: %s", e)
+            self.stats["unresponsive"] += 1
+            return False
+    
+    def close_stray_handles(self, driver):
+        """Close every window but the first and leave any iframe the last job switched into"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.switch_to.default_content()
+        if len(handles) > 1:
+            self.stats["stray_handles_closed"] += len(handles) - 1
+            logger.info("Closed %s stray browser windows", len(handles) - 1)
+    
+    def memory_mb(self, driver):
+        """JS heap of the current page's renderer, from the DevTools performance metrics"""
+        try:
+            metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        except Exception as e:
+            logger.debug("Could not read renderer metrics: %s", e)
+            return None
+        values = {metric["name"]: metric["value"] for metric in metrics}
+        memory = values.get("JSHeapTotalSize", 0) / (1024 * 1024)
+        self.stats["peak_memory_mb"] = round(max(self.stats["peak_memory_mb"], memory), 1)
+        return memory
+    
+    def after_job(self, driver):
+        """Tidy up after one application; return why the browser needs recycling, if it does"""
+        self.applications += 1
+        if not self.responsive(driver):
+            return "unresponsive"
+        self.close_stray_handles(driver)
+        
+        if self.recycle_after and self.applications >= self.recycle_after:
+            return f"{self.applications} applications"
+        if self.max_memory_mb and self.applications % self.memory_check_every == 0:
+            memory = self.memory_mb(driver)
+            if memory is not None and memory > self.max_memory_mb:
+                return f"{memory:.0f} MB renderer memory"
+        return None
+    
+    def report(self):
+        return dict(self.stats, applications_since_recycle=self.applications)
+
+def _extension_patterns(*extensions):
+    """Wildcards matching a file extension only at the end of a URL's path, with or without a query"""
+    return [pattern for extension in extensions for pattern in (f"*.{extension}", f"*.{extension}?*")]
+
+class ResourcePolicy:
+    """Which asset types each kind of page may load; pages read only for text skip images, fonts and media"""
+    
+    # Network.setBlockedURLs wildcard patterns per asset type; a pattern must match the whole URL
+    PATTERNS = {
+        "image": _extension_patterns("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico") +
+                 ["*media.licdn.com/dms/image/*"],
+        "font": _extension_patterns("woff", "woff2", "ttf", "otf", "eot"),
+        "media": _extension_patterns("mp4", "webm", "ogg", "mp3", "m4a", "wav", "m3u8")
+    }
+    
+    def __init__(self, enabled=True, page_load_strategy="eager", block=("image", "font", "media"),
+                 pages=None, patterns=None):
+        self.enabled = enabled
+        self.page_load_strategy = page_load_strategy if enabled else "normal"
+        self.block = list(block)
+        # Login pages keep every asset so captcha images still render
+        self.pages = {"login": []}
+        self.pages.update(pages or {})
+        self.patterns = {asset: list(defaults) for asset, defaults in self.PATTERNS.items()}
+        for asset, extra in (patterns or {}).items():
+            self.patterns.setdefault(asset, []).extend(extra)
+        
+        for assets in [self.block] + list(self.pages.values()):
+            unknown = set(assets) - set(self.patterns)
+            if unknown:
+                raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+    
+    def blocked_urls(self, page_type):
+        """URL patterns to block while a page of this type loads"""
+        if not self.enabled:
+            return []
+        assets = self.pages.get(page_type, self.block)
+        return [pattern for asset in assets for pattern in self.patterns[asset]]
+
 class BrowserManager:
     """Manages browser session with anti-detection measures"""
     
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, daemon=None, watchdog=None, resource_policy=None):
         self.headless = headless
+        self.daemon = daemon
+        self.watchdog = watchdog or BrowserWatchdog(enabled=False)
+        self.resource_policy = resource_policy or ResourcePolicy(enabled=False)
+        self.page_type = None
         self.driver = None
+        # Picked once, so a restarted browser keeps presenting the same user agent
+        self.user_agent = None
         
     def start_browser(self):
         """Initialize and configure browser with anti-detection measures"""
+        if self.daemon:
+            self._attach_to_daemon()
+            self._prepare_driver()
+            return self.driver
+        
         chrome_options = Options()
+        chrome_options.page_load_strategy = self.resource_policy.page_load_strategy
         
         if self.headless:
             chrome_options.add_argument("--headless")
         
         # Anti-bot detection settings
-        user_agent = UserAgent().random
-        chrome_options.add_argument(f'--user-agent={user_agent}')
+        if not self.user_agent:
+            self.user_agent = UserAgent().random
+        chrome_options.add_argument(f'--user-agent={self.user_agent}')
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
@@ -112,7 +553,74 @@ class BrowserManager:
         service = Service(ChromeDriverManager().install())
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         
-        # Further anti-detection measures
+        self._apply_anti_detection(self.user_agent)
+        self._prepare_driver()
+        
+        return self.driver
+    
+    def _prepare_driver(self):
+        """Deadlines and request blocking for a freshly connected driver"""
+        self.watchdog.arm(self.driver)
+        self.page_type = None
+        if self.resource_policy.enabled:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+    
+    def use_page_type(self, page_type):
+        """Apply the resource policy for the kind of page about to be loaded"""
+        if not self.driver or not self.resource_policy.enabled or page_type == self.page_type:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs",
+                                        {"urls": self.resource_policy.blocked_urls(page_type)})
+            self.page_type = page_type
+        except Exception as e:
+            logger.warning("Could not apply the %s resource policy: %s", page_type, e)
+    
+    def restart_browser(self):
+        """Replace the browser with a fresh one; a daemon browser is restarted as well"""
+        try:
+            self.close_browser()
+        except Exception as e:
+            # A hung driver may not quit cleanly; its service process is gone either way
+            logger.warning("Error closing browser for restart: %s", e)
+            self.driver = None
+        if self.daemon:
+            # stop() waits for the old browser to exit so we never re-attach to it while it shuts down
+            self.daemon.stop()
+            if self.daemon.is_healthy():
+                logger.warning("Browser daemon was not started by this bot and cannot be recycled - reattaching")
+        self.watchdog.stats["recycles"] += 1
+        return self.start_browser()
+    
+    def _attach_to_daemon(self):
+        """Attach to the long-lived daemon browser over its remote-debugging endpoint"""
+        if not self.daemon.ensure_running():
+            raise RuntimeError("Browser daemon is not available")
+        
+        # Reuse the resolved driver and user agent so attaching skips the lookups
+        state = self.daemon.load_state()
+        driver_path = state.get("driver_path")
+        if not driver_path or not os.path.exists(driver_path):
+            driver_path = ChromeDriverManager().install()
+            state["driver_path"] = driver_path
+        user_agent = state.get("user_agent")
+        if not user_agent:
+            user_agent = UserAgent().random
+            state["user_agent"] = user_agent
+        self.daemon.save_state(state)
+        
+        chrome_options = Options()
+        chrome_options.page_load_strategy = self.resource_policy.page_load_strategy
+        chrome_options.add_experimental_option("debuggerAddress", self.daemon.debugger_address)
+        
+        self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+        self._apply_anti_detection(user_agent)
+        
+        logger.info("Attached to browser daemon at %s", self.daemon.debugger_address)
+        return self.driver
+    
+    def _apply_anti_detection(self, user_agent):
+        """Further anti-detection measures once the driver is connected"""
         self.driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
@@ -120,12 +628,12 @@ class BrowserManager:
         
         # Set reasonable cookies and local storage to appear like a returning user
         self.driver.execute_script("localStorage.setItem('returning_visitor', 'true');")
-        
-        return self.driver
     
     def close_browser(self):
         """Close browser safely"""
         if self.driver:
+            # When attached to the daemon this only ends the driver session;
+            # the browser itself keeps running for the next run
             self.driver.quit()
             self.driver = None
     
@@ -153,178 +661,34 @@ class BrowserManager:
                 self.driver.add_cookie(cookie)
             return True
         except Exception as e:
-            logger.error(f"Error loading cookies for {platform}: {str(e)}")
+            logger.error("Error loading cookies for %s: %s", platform, e)
             return False
 
 class AuthenticationManager:
     """Handles authentication for different job platforms"""
     
-    def __init__(self, credential_manager, browser_manager):
+    def __init__(self, credential_manager, browser_manager, adapters):
         self.credential_manager = credential_manager
         self.browser_manager = browser_manager
-        self.auth_status = {
-            "linkedin": False,
-            "indeed": False,
-            "glassdoor": False
-        }
+        self.adapters = adapters
+        self.auth_status = {platform: False for platform in adapters}
     
     def authenticate(self, platform):
         """Authenticate with a specific platform"""
         username, password = self.credential_manager.get_credentials(platform)
         
         if not username or not password:
-            logger.error(f"Missing credentials for {platform}")
+            logger.error("Missing credentials for %s", platform)
             return False
         
-        driver = self.browser_manager.driver
-        
-        # Platform-specific login processes
-        if platform == "linkedin":
-            try:
-                # Navigate to login page
-                driver.get("https://www.linkedin.com/login")
-                
-                # Check if cookies can be used
-                if self.browser_manager.load_cookies(platform):
-                    driver.get("https://www.linkedin.com/feed/")
-                    if "feed" in driver.current_url:
-                        self.auth_status[platform] = True
-                        logger.info("LinkedIn authenticated with cookies")
-                        return True
-                
-                # If cookies don't work, login manually
-                username_field = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.ID, "username"))
-                )
-                password_field = driver.find_element(By.ID, "password")
-                
-                # Add natural typing behavior
-                self._natural_type(username_field, username)
-                self._natural_type(password_field, password)
-                
-                # Submit login form
-                driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-                
-                # Wait for successful login
-                WebDriverWait(driver, 15).until(
-                    lambda d: "feed" in d.current_url
-                )
-                
-                # Save cookies for future use
-                self.browser_manager.save_cookies(platform)
-                self.auth_status[platform] = True
-                logger.info("LinkedIn authentication successful")
-                return True
-                
-            except Exception as e:
-                logger.error(f"LinkedIn authentication failed: {str(e)}")
-                return False
-                
-        elif platform == "indeed":
-            try:
-                driver.get("https://secure.indeed.com/account/login")
-                
-                # Check if cookies can be used
-                if self.browser_manager.load_cookies(platform):
-                    driver.get("https://www.indeed.com/")
-                    # Check for sign-in element to verify if we're logged in
-                    try:
-                        sign_in = driver.find_element(By.CSS_SELECTOR, "[data-gnav-element-name='SignIn']")
-                        # If sign-in element exists, we're not logged in
-                    except NoSuchElementException:
-                        self.auth_status[platform] = True
-                        logger.info("Indeed authenticated with cookies")
-                        return True
-                
-                # Login with email first
-                email_field = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.ID, "ifl-InputFormField-3"))
-                )
-                self._natural_type(email_field, username)
-                
-                # Click continue
-                driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-                
-                # Now enter password
-                password_field = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.ID, "ifl-InputFormField-7"))
-                )
-                self._natural_type(password_field, password)
-                
-                # Submit password
-                driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-                
-                # Wait for successful login
-                WebDriverWait(driver, 15).until(
-                    lambda d: "captcha" not in d.current_url and "login" not in d.current_url
-                )
-                
-                # Save cookies for future use
-                self.browser_manager.save_cookies(platform)
-                self.auth_status[platform] = True
-                logger.info("Indeed authentication successful")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Indeed authentication failed: {str(e)}")
-                return False
-                
-        elif platform == "glassdoor":
-            try:
-                driver.get("https://www.glassdoor.com/profile/login_input.htm")
-                
-                # Check if cookies can be used
-                if self.browser_manager.load_cookies(platform):
-                    driver.get("https://www.glassdoor.com/member/home/index.htm")
-                    if "home" in driver.current_url:
-                        self.auth_status[platform] = True
-                        logger.info("Glassdoor authenticated with cookies")
-                        return True
-                
-                # Sometimes Glassdoor shows email field first, sometimes both
-                try:
-                    # Try email-first approach
-                    email_field = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.ID, "modalUserEmail"))
-                    )
-                    self._natural_type(email_field, username)
-                    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-                    
-                    # Then enter password
-                    password_field = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.ID, "modalUserPassword"))
-                    )
-                    self._natural_type(password_field, password)
-                    
-                except TimeoutException:
-                    # Try combined approach
-                    email_field = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.ID, "username"))
-                    )
-                    password_field = driver.find_element(By.ID, "password")
-                    
-                    self._natural_type(email_field, username)
-                    self._natural_type(password_field, password)
-                
-                # Submit login
-                driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-                
-                # Wait for successful login
-                WebDriverWait(driver, 15).until(
-                    lambda d: "member" in d.current_url
-                )
-                
-                # Save cookies for future use
-                self.browser_manager.save_cookies(platform)
-                self.auth_status[platform] = True
-                logger.info("Glassdoor authentication successful")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Glassdoor authentication failed: {str(e)}")
-                return False
-        
-        return False
+        adapter = self.adapters[platform]
+        self.browser_manager.use_page_type("login")
+        try:
+            self.auth_status[platform] = adapter.authenticate(self, self.browser_manager.driver, username, password)
+        except Exception as e:
+            logger.error("%s authentication failed: %s", adapter.label, e)
+            return False
+        return self.auth_status[platform]
     
     def _natural_type(self, element, text):
         """Type text in a human-like manner with variable speed"""
@@ -390,971 +754,3335 @@ class CaptchaSolver:
         
         return True
 
-class JobApplicationBot:
-    """Main bot class for searching and applying to jobs"""
+# Platform name -> adapter class in this module, or "package.module:Class" for adapters shipped
+# elsewhere. Entries are only resolved (and their modules imported) when a run enables the platform.
+PLATFORM_ADAPTERS = {
+    "linkedin": "LinkedInAdapter",
+    "indeed": "IndeedAdapter",
+    "glassdoor": "GlassdoorAdapter"
+}
+
+def load_adapters(enabled=None, adapters=None):
+    """Resolve the enabled platforms to adapter instances; extra adapter paths extend the built-in registry"""
+    global JobSource
+    registry = dict(PLATFORM_ADAPTERS, **(adapters or {}))
+    # Extra platforms need a posting source before their adapters or saved postings are created
+    known = [source.value for source in JobSource if source.value != "import"]
+    if not set(registry) <= set(known):
+        JobSource = _build_job_source(dict.fromkeys(known + list(registry)))
     
-    def __init__(self, email, resume_path, keywords, locations, exclude_keywords=None, headless=False):
-        self.email = email
-        self.resume_path = os.path.abspath(resume_path)
-        self.keywords = keywords
-        self.locations = locations
-        self.exclude_keywords = exclude_keywords or []
-        self.applied_jobs = self._load_applied_jobs()
-        self.job_boards = {
-            "linkedin": {
-                "search_url": "https://www.linkedin.com/jobs/search/",
-                "params": {"keywords": "", "location": "", "f_E": "1,2", "sortBy": "DD"}
-            },
-            "indeed": {
-                "search_url": "https://www.indeed.com/jobs",
-                "params": {"q": "", "l": "", "fromage": "7", "sort": "date"}
-            },
-            "glassdoor": {
-                "search_url": "https://www.glassdoor.com/Job/jobs.htm",
-                "params": {"sc.keyword": "", "locT": "C", "locId": 0}
-            }
-        }
-        
-        # Initialize managers
-        self.credential_manager = CredentialManager()
-        self.browser_manager = BrowserManager(headless=headless)
-        self.auth_manager = AuthenticationManager(self.credential_manager, self.browser_manager)
-        self.driver = None
-        self.captcha_solver = None
-        
-        # Resume text for matching
-        self.resume_text = self._extract_resume_text()
+    loaded = {}
+    for name in (registry if enabled is None else enabled):
+        spec = registry.get(name)
+        if spec is None:
+            logger.warning("No adapter registered for %s - platform disabled", name)
+            continue
+        if ":" in spec:
+            module_name, _, class_name = spec.partition(":")
+            adapter_class = getattr(importlib.import_module(module_name), class_name)
+        else:
+            adapter_class = globals()[spec]
+        loaded[name] = adapter_class()
+    return loaded
+
+class PlatformAdapter:
+    """A job board described as data plus hooks: URLs, selectors, search parsing and the apply flow"""
+    
+    name = None
+    label = None
+    LOGIN_URL = None
+    HOME_URL = None  # Page that only loads inside a session; used to test restored cookies
+    LOGGED_IN_MARK = None  # Url fragment present once logged in
+    SEARCH_URL = None
+    SEARCH_PARAMS = {}
+    KEYWORD_PARAM = None
+    LOCATION_PARAM = None
+    
+    # Selector name -> "strategy:value"; compiled to locator tuples once per adapter class
+    SELECTORS = {}
+    # Card element clicked to load a posting's description: card_title, card_link or card
+    DETAIL_TRIGGER = "card_title"
+    DETAIL_PAUSE = 0
+    
+    STRATEGIES = {
+        "css": By.CSS_SELECTOR,
+        "id": By.ID,
+        "tag": By.TAG_NAME,
+        "name": By.NAME,
+        "xpath": By.XPATH
+    }
+    
+    def __init__(self):
+        cls = type(self)
+        if "_locators" not in cls.__dict__:
+            cls._locators = {key: self._compile(spec) for key, spec in cls.SELECTORS.items()}
+        self.source = JobSource(self.name)
+    
+    @classmethod
+    def _compile(cls, spec):
+        strategy, _, value = spec.partition(":")
+        if strategy not in cls.STRATEGIES or not value:
+            raise ValueError(f"Bad selector {spec!r} for {cls.__name__}")
+        return (cls.STRATEGIES[strategy], value)
+    
+    def loc(self, key):
+        """Locator tuple for a declared selector"""
+        return self._locators[key]
+    
+    def board(self):
+        """Search endpoint and default query parameters"""
+        return {"search_url": self.SEARCH_URL, "params": dict(self.SEARCH_PARAMS)}
+    
+    # Authentication
+    
+    def authenticate(self, auth_manager, driver, username, password):
+        """Restore a session from cookies or log in with credentials"""
+        driver.get(self.LOGIN_URL)
+        if auth_manager.browser_manager.load_cookies(self.name):
+            driver.get(self.HOME_URL)
+            if self.session_active(driver):
+                logger.info("%s authenticated with cookies", self.label)
+                return True
         
-        # Stats tracking
-        self.stats = {
-            "jobs_found": 0,
-            "jobs_filtered": 0,
-            "applications_attempted": 0,
-            "applications_completed": 0,
-            "applications_failed": 0
-        }
+        self.login(auth_manager, driver, username, password)
+        WebDriverWait(driver, 15).until(self.logged_in)
+        auth_manager.browser_manager.save_cookies(self.name)
+        logger.info("%s authentication successful", self.label)
+        return True
     
-    def _extract_resume_text(self):
-        """Extract text from resume for matching purposes"""
-        # For PDF resume
-        try:
-            import PyPDF2
-            with open(self.resume_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text()
-                return text.lower()
-        except Exception as e:
-            logger.error(f"Error extracting text from resume: {str(e)}")
-            logger.warning("Using basic resume text extraction. Install PyPDF2 for better results.")
-            # Fallback to provided resume text
-            return """computer engineer python java c++ software developer embedded systems
-                      mathematics physics flask arduino machine learning sql mysql database
-                      raspberrypi linux github digital systems data structures algorithms
-                      vlsi transistors circuits microcontroller programming entry level new grad"""
+    def session_active(self, driver):
+        return self.logged_in(driver)
     
-    def _load_applied_jobs(self):
-        """Load previously applied jobs from JSON file"""
-        if os.path.exists('applied_jobs.json'):
-            with open('applied_jobs.json', 'r') as f:
-                return json.load(f)
-        return []
+    def logged_in(self, driver):
+        return self.LOGGED_IN_MARK in driver.current_url
     
-    def _save_applied_jobs(self):
-        """Save applied jobs to JSON file"""
-        with open('applied_jobs.json', 'w') as f:
-            json.dump(self.applied_jobs, f)
+    def login(self, auth_manager, driver, username, password):
+        """Fill and submit the login form"""
+        raise NotImplementedError
     
-    def initialize(self):
-        """Initialize browser and authenticate with job platforms"""
-        self.driver = self.browser_manager.start_browser()
-        self.captcha_solver = CaptchaSolver(self.driver)
+    # Search
+    
+    def search_url(self, board, keyword, location):
+        params = board["params"].copy()
+        params[self.KEYWORD_PARAM] = keyword
+        if self.LOCATION_PARAM:
+            params[self.LOCATION_PARAM] = location
+        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        return f"{board['search_url']}?{query_string}"
+    
+    def search(self, bot, board, keyword, location):
+        """Load one results page and parse its cards into jobs"""
+        bot.driver.get(self.search_url(board, keyword, location))
+        if "no_results" in self.SELECTORS:
+            bot._wait(10).until(EC.any_of(EC.presence_of_element_located(self.loc("results")),
+                                          EC.presence_of_element_located(self.loc("no_results"))))
+            # An empty search is an answer, not a failure
+            if not bot.driver.find_elements(*self.loc("results")):
+                logger.info("No %s results for %s in %s", self.label, keyword, location)
+                return []
+        else:
+            bot._wait(10).until(EC.presence_of_element_located(self.loc("results")))
+        self.prepare_results(bot)
         
-        # Store authentication results
-        auth_results = {}
+        jobs = []
+        for card in bot.driver.find_elements(*self.loc("card")):
+            try:
+                job = self.parse_card(bot, card, keyword, location)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                logger.error("Error parsing %s job card: %s", self.label, e)
         
-        for platform in self.job_boards.keys():
-            auth_success = self.auth_manager.authenticate(platform)
-            auth_results[platform] = auth_success
-            
-            if not auth_success:
-                logger.warning(f"Authentication failed for {platform}. Some features might be limited.")
-            
-        # Return authentication status
-        return auth_results
+        # A page without a single Easy Apply badge says more about changed markup than about the jobs
+        if not any(job.apply_type == ApplyType.EASY for job in jobs):
+            for job in jobs:
+                job.apply_type = None
+        return jobs
     
-    def search_jobs(self, days=7):
-        """Search for jobs across multiple job boards"""
-        all_jobs = []
-        
-        for board_name, board_info in self.job_boards.items():
-            # Skip platforms we couldn't authenticate with
-            if not self.auth_manager.auth_status[board_name]:
-                logger.warning(f"Skipping job search on {board_name} due to authentication failure")
-                continue
-                
-            logger.info(f"Searching jobs on {board_name}...")
-            
-            for keyword in self.keywords:
-                for location in self.locations:
-                    try:
-                        jobs = self._search_platform(board_name, keyword, location)
-                        all_jobs.extend(jobs)
-                        
-                        # Randomized delay between searches (3-7 seconds)
-                        time.sleep(random.uniform(3, 7))
-                        
-                    except Exception as e:
-                        logger.error(f"Error searching {board_name} for {keyword} in {location}: {str(e)}")
-        
-        self.stats["jobs_found"] = len(all_jobs)
-        
-        # Filter jobs
-        filtered_jobs = self._filter_jobs(all_jobs)
-        self.stats["jobs_filtered"] = len(filtered_jobs)
-        
-        logger.info(f"Found {len(all_jobs)} jobs, filtered to {len(filtered_jobs)} relevant positions")
-        return filtered_jobs
+    def prepare_results(self, bot):
+        """Hook for expanding or uncovering results before cards are read"""
     
-    def _search_platform(self, platform, keyword, location):
-        """Search for jobs on a specific platform"""
-        jobs = []
+    def parse_card(self, bot, card, keyword, location):
+        """Build a job from a result card, or None for a known reject"""
+        elements = {
+            "card": card,
+            "card_title": card.find_element(*self.loc("card_title")),
+            "card_link": card.find_element(*self.loc("card_link"))
+        }
+        job_url = elements["card_link"].get_attribute("href")
+        if bot._known_reject(job_url):
+            return None
         
-        if platform == "linkedin":
-            # Build search URL with parameters
-            params = self.job_boards[platform]["params"].copy()
-            params["keywords"] = keyword
-            params["location"] = location
-            
-            # Construct query string
-            query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-            search_url = f"{self.job_boards[platform]['search_url']}?{query_string}"
-            
-            # Navigate to search page
-            self.driver.get(search_url)
-            
-            # Wait for results to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-search__results-list"))
-            )
-            
-            # Handle "Show more jobs" button if present to load more results
-            try:
-                show_more = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button.infinite-scroller__show-more-button"))
-                )
-                show_more.click()
-                time.sleep(2)  # Wait for more jobs to load
-            except:
-                pass
-            
-            # Parse job listings
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-search-card")
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__title")
-                    company_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__subtitle")
-                    link_elem = card.find_element(By.CSS_SELECTOR, "a.job-search-card__link")
-                    
-                    job = {
-                        'title': title_elem.text.strip(),
-                        'company': company_elem.text.strip(),
-                        'url': link_elem.get_attribute('href'),
-                        'source': 'linkedin',
-                        'date_found': datetime.now().strftime('%Y-%m-%d'),
-                        'keywords': [keyword],
-                        'location': location
-                    }
-                    
-                    # Try to get job description
-                    try:
-                        # Click on job to see details
-                        title_elem.click()
-                        
-                        # Wait for description to load
-                        description_elem = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".job-details-jobs-unified-description__content"))
-                        )
-                        
-                        job['description'] = description_elem.text
-                    except:
-                        job['description'] = ""
-                    
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.error(f"Error parsing LinkedIn job card: {str(e)}")
+        job = Job(
+            title=elements["card_title"].text.strip(),
+            company=card.find_element(*self.loc("card_company")).text.strip(),
+            url=job_url,
+            source=self.source,
+            keywords=[keyword],
+            location=location
+        )
+        if "card_easy_apply" in self.SELECTORS:
+            job.apply_type = ApplyType.EASY if card.find_elements(*self.loc("card_easy_apply")) else ApplyType.EXTERNAL
         
-        elif platform == "indeed":
-            # Similar implementation for Indeed
-            params = self.job_boards[platform]["params"].copy()
-            params["q"] = keyword
-            params["l"] = location
-            
-            query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-            search_url = f"{self.job_boards[platform]['search_url']}?{query_string}"
-            
-            self.driver.get(search_url)
-            
-            # Wait for results
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobsearch-ResultsList"))
-            )
-            
-            # Parse job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job_seen_beacon")
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, "h2.jobTitle")
-                    company_elem = card.find_element(By.CSS_SELECTOR, "span.companyName")
-                    
-                    # Get job link
-                    link_elem = title_elem.find_element(By.TAG_NAME, "a")
-                    job_url = link_elem.get_attribute("href")
-                    
-                    job = {
-                        'title': title_elem.text.strip(),
-                        'company': company_elem.text.strip(),
-                        'url': job_url,
-                        'source': 'indeed',
-                        'date_found': datetime.now().strftime('%Y-%m-%d'),
-                        'keywords': [keyword],
-                        'location': location
-                    }
-                    
-                    # Try to get description
-                    try:
-                        link_elem.click()
-                        description_elem = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.ID, "jobDescriptionText"))
-                        )
-                        job['description'] = description_elem.text
-                    except:
-                        job['description'] = ""
-                    
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.error(f"Error parsing Indeed job card: {str(e)}")
+        # Only postings that survive the title stage are worth a click and a wait
+        if bot._title_rejected(job):
+            return job
         
-        elif platform == "glassdoor":
-            # Glassdoor implementation
-            params = self.job_boards[platform]["params"].copy()
-            params["sc.keyword"] = keyword
-            
-            # Glassdoor uses location IDs, simplified here
-            search_url = f"{self.job_boards[platform]['search_url']}?{params['sc.keyword']}={keyword}"
-            
-            self.driver.get(search_url)
-            
-            # Wait for results
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".react-job-listing"))
+        # Open the posting to read its description
+        try:
+            elements[self.DETAIL_TRIGGER].click()
+            if self.DETAIL_PAUSE:
+                bot._pause(self.DETAIL_PAUSE)
+            description_elem = bot._wait(5).until(
+                EC.presence_of_element_located(self.loc("description"))
             )
-            
-            # Close any popups
-            try:
-                close_button = WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".modal_closeIcon"))
-                )
-                close_button.click()
-            except:
-                pass
-            
-            # Parse job listings
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".react-job-listing")
-            
-            for card in job_cards:
-                try:
-                    card.click()  # Click to load details
-                    time.sleep(1)
-                    
-                    # Get job details
-                    title_elem = card.find_element(By.CSS_SELECTOR, "a.jobLink")
-                    company_elem = card.find_element(By.CSS_SELECTOR, ".css-1nqghjk")
-                    
-                    # Get job link
-                    job_url = title_elem.get_attribute("href")
-                    
-                    job = {
-                        'title': title_elem.text.strip(),
-                        'company': company_elem.text.strip(),
-                        'url': job_url,
-                        'source': 'glassdoor',
-                        'date_found': datetime.now().strftime('%Y-%m-%d'),
-                        'keywords': [keyword],
-                        'location': location
-                    }
-                    
-                    # Try to get description
-                    try:
-                        description_elem = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".jobDescriptionContent"))
-                        )
-                        job['description'] = description_elem.text
-                    except:
-                        job['description'] = ""
-                    
-                    jobs.append(job)
-                    
-                except Exception as e:
-                    logger.error(f"Error parsing Glassdoor job card: {str(e)}")
-        
-        # Check for and handle captchas
-        if self.captcha_solver.detect_captcha():
-            self.captcha_solver.handle_captcha()
-        
-        return jobs
+            job.description = description_elem.text
+        except Exception:
+            job.description = ""
+            bot._description_failed(job)
+        return job
     
-    def _filter_jobs(self, jobs):
-        """Filter jobs based on criteria and previously applied jobs"""
-        filtered_jobs = []
-        
-        # Add skills for matching from resume
-        skills = [
-            "python", "java", "c++", "javascript", "sql", "mysql", 
-            "embedded", "linux", "algorithms", "data structures",
-            "machine learning", "software development", "github",
-            "circuit", "vlsi", "microcontroller", "digital systems"
-        ]
-        
-        for job in jobs:
-            # Skip if already applied
-            if any(applied['url'] == job['url'] for applied in self.applied_jobs):
-                continue
-            
-            title = job['title'].lower()
-            description = job.get('description', '').lower()
-            
-            # Check for new grad/entry level indicators in title
-            is_entry_level = any(kw.lower() in title for kw in [
-                'entry level', 'entry-level', 'new grad', 'junior', 
-                'associate', 'university grad', 'recent graduate'
-            ])
-            
-            # If not found in title, check description
-            if not is_entry_level and description:
-                is_entry_level = any(kw.lower() in description for kw in [
-                    'entry level', 'entry-level', 'new grad', 'junior', 
-                    'associate', 'university grad', 'recent graduate',
-                    '0-2 years', '0-1 years', '1-2 years'
-                ])
+    # Application
+    
+    def apply(self, bot, job):
+        """Open a posting and walk its application steps, noting steps and outcome in bot.attempt"""
+        try:
+            bot.driver.get(job.url)
+            bot._wait(10).until(EC.presence_of_element_located(self.loc("job_page")))
             
-            # Skip if not entry level
-            if not is_entry_level:
-                continue
-                
-            # Check for excluded keywords
-            if any(exclude.lower() in title for exclude in self.exclude_keywords):
-                continue
-                
-            if description and any(exclude.lower() in description for exclude in self.exclude_keywords):
-                continue
+            if self.already_applied(bot):
+                logger.info("Already applied to %s at %s", job.title, job.company)
+                bot.attempt["reason"] = "already_applied"
+                return True
             
-            # Calculate skill match score
-            skill_matches = 0
-            for skill in skills:
-                if skill in title or (description and skill in description):
-                    skill_matches += 1
+            bot._wait(10).until(EC.element_to_be_clickable(self.loc("apply_button"))).click()
+            if not self.open_form(bot, job):
+                bot.attempt["reason"] = bot.attempt["reason"] or "no_form"
+                return False
             
-            # Only include jobs with at least 2 skill matches
-            if skill_matches >= 2:
-                # Add skill match score to job data
-                job['skill_score'] = skill_matches
-                filtered_jobs.append(job)
+            if bot.captcha_solver.detect_captcha():
+                bot.captcha_solver.handle_captcha()
             
-        # Sort by skill match score (highest first)
-        filtered_jobs.sort(key=lambda x: x.get('skill_score', 0), reverse=True)
-        
-        return filtered_jobs
-    
-    def apply_for_jobs(self, jobs, max_applications=10):
-        """Apply for filtered jobs with rate limiting"""
-        applied_count = 0
-        failed_count = 0
-        
-        # Limit number of applications per run
-        jobs_to_apply = jobs[:max_applications]
-        self.stats["applications_attempted"] = len(jobs_to_apply)
-        
-        for job in jobs_to_apply:
             try:
-                logger.info(f"Attempting to apply for: {job['title']} at {job['company']} ({job['source']})")
-                
-                # Apply based on source platform
-                if job['source'] == 'linkedin':
-                    success = self._apply_linkedin(job)
-                elif job['source'] == 'indeed':
-                    success = self._apply_indeed(job)
-                elif job['source'] == 'glassdoor':
-                    success = self._apply_glassdoor(job)
-                else:
-                    logger.warning(f"Unknown source: {job['source']}")
-                    success = False
-                
-                if success:
-                    # Record successful application
-                    job['date_applied'] = datetime.now().strftime('%Y-%m-%d')
-                    job['application_status'] = 'applied'
-                    self.applied_jobs.append(job)
-                    applied_count += 1
-# Record successful application
-                    job['date_applied'] = datetime.now().strftime('%Y-%m-%d')
-                    job['application_status'] = 'applied'
-                    self.applied_jobs.append(job)
-                    applied_count += 1
-                    self.stats["applications_completed"] += 1
-                    logger.info(f"Successfully applied to {job['title']} at {job['company']}")
-                    
-                    # Save progress after each successful application
-                    self._save_applied_jobs()
-                    
-                    # Random delay between applications (20-45 seconds)
-                    time.sleep(random.uniform(20, 45))
-                else:
-                    failed_count += 1
-                    self.stats["applications_failed"] += 1
-                    logger.warning(f"Failed to apply to {job['title']} at {job['company']}")
-            
-            except Exception as e:
-                logger.error(f"Error applying to job: {str(e)}")
-                failed_count += 1
-                self.stats["applications_failed"] += 1
-                
-                # Take screenshot of error for debugging
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                screenshot_path = f"error_screenshots/{timestamp}.png"
-                os.makedirs("error_screenshots", exist_ok=True)
-                try:
-                    self.driver.save_screenshot(screenshot_path)
-                    logger.info(f"Error screenshot saved to {screenshot_path}")
-                except:
-                    pass
+                return self.run_steps(bot, job)
+            finally:
+                self.close_form(bot)
         
-        logger.info(f"Application run completed: {applied_count} successful, {failed_count} failed")
-        return applied_count, failed_count
+        except Exception as e:
+            logger.error("Error during %s application: %s", self.label, e)
+            bot.attempt["reason"] = f"error:{e.__class__.__name__}"
+            bot._capture_failure(job, e)
+            return False
     
-    def _apply_linkedin(self, job):
-        """Apply for a job on LinkedIn"""
+    def already_applied(self, bot):
+        if "applied_status" not in self.SELECTORS:
+            return False
         try:
-            # Navigate to job page
-            self.driver.get(job['url'])
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-unified-top-card"))
-            )
-            
-            # Check if already applied
+            status = bot.driver.find_element(*self.loc("applied_status"))
+        except NoSuchElementException:
+            return False
+        return "applied" in status.text.lower()
+    
+    def open_form(self, bot, job):
+        """Bring the application form up after the apply click; False when it can't be done here"""
+        return True
+    
+    def close_form(self, bot):
+        """Hook for leaving popups or frames the form opened"""
+    
+    def run_steps(self, bot, job):
+        """Fill and advance each form step until the application is submitted"""
+        while True:
             try:
-                applied_text = self.driver.find_element(By.CSS_SELECTOR, ".jobs-s-apply__applied-status")
-                if "applied" in applied_text.text.lower():
-                    logger.info(f"Already applied to {job['title']} at {job['company']}")
-                    return True
-            except NoSuchElementException:
-                pass
-            
-            # Find and click the Apply button
-            apply_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".jobs-apply-button"))
-            )
-            apply_button.click()
-            
-            # Wait for application form
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-easy-apply-content"))
-            )
-            
-            # Check for captcha
-            if self.captcha_solver.detect_captcha():
-                self.captcha_solver.handle_captcha()
+                next_button = bot._wait(5).until(EC.element_to_be_clickable(self.loc("next_button")))
+                self.fill_form(bot)
+                next_button.click()
+                bot.attempt["steps"] += 1
+                bot._pause(2)
             
-            # Process application steps
-            while True:
-                # Look for Next/Submit buttons
+            except TimeoutException:
                 try:
-                    # Check for next button first
-                    next_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((
-                            By.CSS_SELECTOR, 
-                            "button[aria-label='Continue to next step']"
-                        ))
-                    )
-                    
-                    # Fill in fields on current step
-                    self._fill_linkedin_form()
-                    
-                    # Click next
-                    next_button.click()
-                    time.sleep(2)
-                    
+                    submit_button = bot._wait(5).until(EC.element_to_be_clickable(self.loc("submit_button")))
+                    self.fill_form(bot)
+                    submit_button.click()
+                    bot.attempt["steps"] += 1
+                    bot._wait(10).until(self.submitted)
+                    bot.attempt["reason"] = "submitted"
+                    return True
+                
                 except TimeoutException:
-                    # No next button, look for submit button
-                    try:
-                        submit_button = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((
-                                By.CSS_SELECTOR, 
-                                "button[aria-label='Submit application']"
-                            ))
-                        )
-                        
-                        # Fill final form fields
-                        self._fill_linkedin_form()
-                        
-                        # Submit application
-                        submit_button.click()
-                        
-                        # Wait for confirmation
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".artdeco-modal__content"))
-                        )
-                        
-                        return True
-                        
-                    except TimeoutException:
-                        # Check if we're stuck on complex questions or external application
-                        if self._check_for_complex_application():
-                            logger.info(f"Complex application detected for {job['title']} - skipping")
-                            return False
-                        
-                        # Something unexpected happened
-                        logger.error(f"Neither next nor submit button found for {job['title']}")
+                    # Stuck on long-form questions or an external application
+                    if bot._check_for_complex_application():
+                        logger.info("Complex application detected for %s - skipping", job.title)
+                        bot.attempt["reason"] = "complex"
                         return False
-            
-        except Exception as e:
-            logger.error(f"Error during LinkedIn application: {str(e)}")
-            return False
+                    
+                    logger.error("Neither next nor submit button found for %s", job.title)
+                    bot.attempt["reason"] = "no_buttons"
+                    return False
+    
+    def submitted(self, driver):
+        return driver.find_elements(*self.loc("confirmation"))
+    
+    def fill_form(self, bot):
+        """Answer the fields on the current form step"""
+    
+    @staticmethod
+    def _choose_option(bot, dropdown, choices):
+        """Open a dropdown and click the first option containing one of the choices"""
+        dropdown.click()
+        for option in bot.driver.find_elements(By.TAG_NAME, "option"):
+            if any(x in option.text.lower() for x in choices):
+                option.click()
+                break
+
+# Dropdown answers for the profile being applied with
+ENTRY_LEVEL_OPTIONS = ("0-1", "entry", "less than 1", "<1")
+EDUCATION_OPTIONS = ("bachelor",)
+
+class LinkedInAdapter(PlatformAdapter):
+    name = "linkedin"
+    label = "LinkedIn"
+    LOGIN_URL = "https://www.linkedin.com/login"
+    HOME_URL = "https://www.linkedin.com/feed/"
+    LOGGED_IN_MARK = "feed"
+    SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+    SEARCH_PARAMS = {"keywords": "", "location": "", "f_E": "1,2", "sortBy": "DD"}
+    KEYWORD_PARAM = "keywords"
+    LOCATION_PARAM = "location"
+    
+    SELECTORS = {
+        "username": "id:username",
+        "password": "id:password",
+        "login_submit": "css:button[type='submit']",
+        "results": "css:.jobs-search__results-list",
+        "no_results": "css:.jobs-search-no-results-banner, .jobs-search__no-results",
+        "show_more": "css:button.infinite-scroller__show-more-button",
+        "card": "css:.job-search-card",
+        "card_title": "css:.job-search-card__title",
+        "card_company": "css:.job-search-card__subtitle",
+        "card_link": "css:a.job-search-card__link",
+        "card_easy_apply": "css:.job-search-card__easy-apply-label",
+        "description": "css:.job-details-jobs-unified-description__content",
+        "job_page": "css:.jobs-unified-top-card",
+        "applied_status": "css:.jobs-s-apply__applied-status",
+        "apply_button": "css:.jobs-apply-button",
+        "form": "css:.jobs-easy-apply-content",
+        "next_button": "css:button[aria-label='Continue to next step']",
+        "submit_button": "css:button[aria-label='Submit application']",
+        "confirmation": "css:.artdeco-modal__content",
+        "phone": "css:input[name='phoneNumber']",
+        "experience": "css:select[name='urn:li:form:workExperienceFormElement']",
+        "education": "css:select[name*='education']",
+        "resume": "css:input[type='file']",
+        "yes_radio": "css:input[type='radio'][value='yes']"
+    }
     
-    def _fill_linkedin_form(self):
-        """Fill form fields on LinkedIn application"""
+    def login(self, auth_manager, driver, username, password):
+        username_field = WebDriverWait(driver, 10).until(EC.element_to_be_clickable(self.loc("username")))
+        password_field = driver.find_element(*self.loc("password"))
+        auth_manager._natural_type(username_field, username)
+        auth_manager._natural_type(password_field, password)
+        driver.find_element(*self.loc("login_submit")).click()
+    
+    def prepare_results(self, bot):
+        # Load the next batch of results when LinkedIn offers it
+        try:
+            show_more = bot._wait(5).until(EC.element_to_be_clickable(self.loc("show_more")))
+            show_more.click()
+            bot._pause(2)
+        except Exception:
+            pass
+    
+    def open_form(self, bot, job):
+        bot._wait(10).until(EC.presence_of_element_located(self.loc("form")))
+        return True
+    
+    def fill_form(self, bot):
+        driver = bot.driver
         try:
-            # Look for common input fields
-            
-            # Phone number
             try:
-                phone_input = self.driver.find_element(By.CSS_SELECTOR, "input[name='phoneNumber']")
+                phone_input = driver.find_element(*self.loc("phone"))
                 if not phone_input.get_attribute('value'):
-                    self._natural_type(phone_input, "5555551234")  # Replace with actual phone
+                    bot._natural_type(phone_input, "5555551234")  # Replace with actual phone
             except NoSuchElementException:
                 pass
             
-            # Work experience (years)
             try:
-                exp_dropdown = self.driver.find_element(By.CSS_SELECTOR, 
-                                                     "select[name='urn:li:form:workExperienceFormElement']")
-                exp_dropdown.click()
-                # Select 0-1 or entry level option
-                options = self.driver.find_elements(By.CSS_SELECTOR, "option")
-                for option in options:
-                    if any(x in option.text.lower() for x in ["0-1", "entry", "less than 1", "<1"]):
-                        option.click()
-                        break
+                self._choose_option(bot, driver.find_element(*self.loc("experience")), ENTRY_LEVEL_OPTIONS)
             except NoSuchElementException:
                 pass
             
-            # Education dropdown
             try:
-                edu_dropdown = self.driver.find_element(By.CSS_SELECTOR, 
-                                                     "select[name*='education']")
-                edu_dropdown.click()
-                # Select bachelor's degree
-                options = self.driver.find_elements(By.CSS_SELECTOR, "option")
-                for option in options:
-                    if "bachelor" in option.text.lower():
-                        option.click()
-                        break
+                self._choose_option(bot, driver.find_element(*self.loc("education")), EDUCATION_OPTIONS)
             except NoSuchElementException:
                 pass
             
-            # Resume upload
             try:
-                resume_upload = self.driver.find_element(By.CSS_SELECTOR, "input[type='file']")
-                resume_upload.send_keys(self.resume_path)
-                time.sleep(3)  # Wait for upload
+                resume_upload = driver.find_element(*self.loc("resume"))
+                resume_upload.send_keys(bot.resume_path)
+                bot._pause(3)  # Wait for upload
             except NoSuchElementException:
                 pass
             
             # Yes/No questions - typically answer "Yes" to qualified questions
-            yes_no_buttons = self.driver.find_elements(By.CSS_SELECTOR, 
-                                                   "input[type='radio'][value='yes']")
-            for button in yes_no_buttons:
+            for button in driver.find_elements(*self.loc("yes_radio")):
                 button.click()
-            
+        
         except Exception as e:
-            logger.error(f"Error filling LinkedIn form: {str(e)}")
+            logger.error("Error filling LinkedIn form: %s", e)
+
+class IndeedAdapter(PlatformAdapter):
+    name = "indeed"
+    label = "Indeed"
+    LOGIN_URL = "https://secure.indeed.com/account/login"
+    HOME_URL = "https://www.indeed.com/"
+    SEARCH_URL = "https://www.indeed.com/jobs"
+    SEARCH_PARAMS = {"q": "", "l": "", "fromage": "7", "sort": "date"}
+    KEYWORD_PARAM = "q"
+    LOCATION_PARAM = "l"
+    DETAIL_TRIGGER = "card_link"
     
-    def _check_for_complex_application(self):
-        """Check if application requires complex inputs or external redirect"""
-        # Check for text area (long-form questions)
-        textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
-        if len(textareas) > 0:
-            return True
-        
-        # Look for external application indicators
-        external_indicators = [
-            "complete application on company website",
-            "external site",
-            "company's website",
-            "continue on company site"
-        ]
-        
-        page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-        for indicator in external_indicators:
-            if indicator in page_text:
-                return True
+    SELECTORS = {
+        "sign_in": "css:[data-gnav-element-name='SignIn']",
+        "email": "id:ifl-InputFormField-3",
+        "password": "id:ifl-InputFormField-7",
+        "login_submit": "css:button[type='submit']",
+        "results": "css:.jobsearch-ResultsList",
+        "no_results": "css:.jobsearch-NoResult-messageContainer, .jobsearch-NoResult",
+        "card": "css:.job_seen_beacon",
+        "card_title": "css:h2.jobTitle",
+        "card_company": "css:span.companyName",
+        "card_link": "css:h2.jobTitle a",
+        "card_easy_apply": "css:.iaLabel",
+        "description": "id:jobDescriptionText",
+        "job_page": "css:.jobsearch-JobInfoHeader",
+        "applied_status": "css:.jobsearch-ResponseIndicators",
+        "apply_button": "css:.jobsearch-IndeedApplyButton",
+        "apply_frame": "id:indeedapply-iframe",
+        "next_button": "css:button[data-testid='continueButton'], button.ia-continueButton",
+        "submit_button": "css:button[data-testid='submitButton'], button.ia-SubmitButton",
+        "name": "css:input[name*='name']",
+        "email_field": "css:input[type='email']",
+        "phone": "css:input[type='tel']",
+        "resume": "css:input[type='file']",
+        "dropdown": "css:select",
+        "label": "css:label"
+    }
+    
+    def session_active(self, driver):
+        # A sign-in link in the header means the cookies are stale
+        return not driver.find_elements(*self.loc("sign_in"))
+    
+    def logged_in(self, driver):
+        return "captcha" not in driver.current_url and "login" not in driver.current_url
+    
+    def login(self, auth_manager, driver, username, password):
+        # Email first, then password on a second screen
+        email_field = WebDriverWait(driver, 10).until(EC.element_to_be_clickable(self.loc("email")))
+        auth_manager._natural_type(email_field, username)
+        driver.find_element(*self.loc("login_submit")).click()
         
-        return False
+        password_field = WebDriverWait(driver, 10).until(EC.element_to_be_clickable(self.loc("password")))
+        auth_manager._natural_type(password_field, password)
+        driver.find_element(*self.loc("login_submit")).click()
     
-    def _apply_indeed(self, job):
-        """Apply for a job on Indeed"""
-        try:
-            # Navigate to job page
-            self.driver.get(job['url'])
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobsearch-JobInfoHeader"))
-            )
-            
-            # Check if already applied
+    def open_form(self, bot, job):
+        # The form opens in a new window or an iframe
+        bot._pause(3)
+        windows = bot.driver.window_handles
+        if len(windows) > 1:
+            bot.driver.switch_to.window(windows[1])
+        else:
             try:
-                applied_text = self.driver.find_element(By.CSS_SELECTOR, ".jobsearch-ResponseIndicators")
-                if "applied" in applied_text.text.lower():
-                    logger.info(f"Already applied to {job['title']} at {job['company']}")
-                    return True
-            except NoSuchElementException:
+                bot.driver.switch_to.frame(bot.driver.find_element(*self.loc("apply_frame")))
+            except Exception:
                 pass
-            
-            # Find and click Apply button
-            try:
-                apply_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".jobsearch-IndeedApplyButton"))
-                )
-                apply_button.click()
-                
-                # Wait for application to load in new window or iframe
-                time.sleep(3)
-                
-                # Check if new window opened
-                windows = self.driver.window_handles
-                if len(windows) > 1:
-                    self.driver.switch_to.window(windows[1])
-                else:
-                    # Check for iframe
-                    try:
-                        iframe = self.driver.find_element(By.ID, "indeedapply-iframe")
-                        self.driver.switch_to.frame(iframe)
-                    except:
-                        pass
-                
-                # Check for captcha
-                if self.captcha_solver.detect_captcha():
-                    self.captcha_solver.handle_captcha()
-                
-                # Process application steps
-                while True:
-                    # Look for continue/next button
-                    try:
-                        continue_button = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((
-                                By.CSS_SELECTOR, 
-                                "button[data-testid='continueButton'], button.ia-continueButton"
-                            ))
-                        )
-                        
-                        # Fill fields on current step
-                        self._fill_indeed_form()
-                        
-                        # Click continue
-                        continue_button.click()
-                        time.sleep(2)
-                        
-                    except TimeoutException:
-                        # No continue button, look for submit button
-                        try:
-                            submit_button = WebDriverWait(self.driver, 5).until(
-                                EC.element_to_be_clickable((
-                                    By.CSS_SELECTOR, 
-                                    "button[data-testid='submitButton'], button.ia-SubmitButton"
-                                ))
-                            )
-                            
-                            # Fill final form fields
-                            self._fill_indeed_form()
-                            
-                            # Submit application
-                            submit_button.click()
-                            
-                            # Wait for confirmation
-                            WebDriverWait(self.driver, 10).until(
-                                lambda d: "applied" in d.current_url.lower() or 
-                                          "thank" in d.current_url.lower() or
-                                          "success" in d.current_url.lower()
-                            )
-                            
-                            # Return to main window if needed
-                            if len(self.driver.window_handles) > 1:
-                                self.driver.close()
-                                self.driver.switch_to.window(self.driver.window_handles[0])
-                            
-                            return True
-                            
-                        except TimeoutException:
-                            # Check if we're stuck on complex questions or external application
-                            if self._check_for_complex_application():
-                                logger.info(f"Complex application detected for {job['title']} - skipping")
-                                
-                                # Return to main window if needed
-                                if len(self.driver.window_handles) > 1:
-                                    self.driver.close()
-                                    self.driver.switch_to.window(self.driver.window_handles[0])
-                                
-                                return False
-                            
-                            # Something unexpected happened
-                            logger.error(f"Neither continue nor submit button found for {job['title']}")
-                            
-                            # Return to main window if needed
-                            if len(self.driver.window_handles) > 1:
-                                self.driver.close()
-                                self.driver.switch_to.window(self.driver.window_handles[0])
-                            
-                            return False
-                
-            except Exception as e:
-                logger.error(f"Error applying on Indeed: {str(e)}")
-                return False
-            
-        except Exception as e:
-            logger.error(f"Error during Indeed application: {str(e)}")
-            return False
+        return True
+    
+    def close_form(self, bot):
+        # Return to the main window if the form opened its own
+        if len(bot.driver.window_handles) > 1:
+            bot.driver.close()
+            bot.driver.switch_to.window(bot.driver.window_handles[0])
+    
+    def submitted(self, driver):
+        url = driver.current_url.lower()
+        return "applied" in url or "thank" in url or "success" in url
     
-    def _fill_indeed_form(self):
-        """Fill form fields on Indeed application"""
+    def fill_form(self, bot):
+        driver = bot.driver
         try:
-            # Name fields
             try:
-                name_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[name*='name']")
-                for field in name_fields:
+                for field in driver.find_elements(*self.loc("name")):
                     placeholder = field.get_attribute("placeholder").lower()
                     if "first" in placeholder and not field.get_attribute("value"):
-                        self._natural_type(field, "John")  # Replace with actual first name
+                        bot._natural_type(field, "John")  # Replace with actual first name
                     elif "last" in placeholder and not field.get_attribute("value"):
-                        self._natural_type(field, "Doe")  # Replace with actual last name
+                        bot._natural_type(field, "Doe")  # Replace with actual last name
             except:
                 pass
             
-            # Email field
             try:
-                email_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='email']")
+                email_field = driver.find_element(*self.loc("email_field"))
                 if not email_field.get_attribute("value"):
-                    self._natural_type(email_field, self.email)
+                    bot._natural_type(email_field, bot.email)
             except:
                 pass
             
-            # Phone field
             try:
-                phone_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='tel']")
+                phone_field = driver.find_element(*self.loc("phone"))
                 if not phone_field.get_attribute("value"):
-                    self._natural_type(phone_field, "5555551234")  # Replace with actual phone
+                    bot._natural_type(phone_field, "5555551234")  # Replace with actual phone
             except:
                 pass
             
-            # Resume upload
             try:
-                resume_upload = self.driver.find_element(By.CSS_SELECTOR, "input[type='file']")
-                resume_upload.send_keys(self.resume_path)
-                time.sleep(3)  # Wait for upload
+                resume_upload = driver.find_element(*self.loc("resume"))
+                resume_upload.send_keys(bot.resume_path)
+                bot._pause(3)  # Wait for upload
             except:
                 pass
             
-            # Experience dropdowns
             try:
-                dropdowns = self.driver.find_elements(By.CSS_SELECTOR, "select")
-                for dropdown in dropdowns:
+                for dropdown in driver.find_elements(*self.loc("dropdown")):
                     if "experience" in dropdown.get_attribute("name").lower():
-                        dropdown.click()
-                        options = self.driver.find_elements(By.TAG_NAME, "option")
-                        for option in options:
-                            if any(x in option.text.lower() for x in ["0-1", "entry", "less than 1", "<1"]):
-                                option.click()
-                                break
+                        self._choose_option(bot, dropdown, ENTRY_LEVEL_OPTIONS)
             except:
                 pass
             
             # Radio buttons for simple yes/no questions - typically answer "Yes" to qualified questions
             try:
-                labels = self.driver.find_elements(By.CSS_SELECTOR, "label")
-                for label in labels:
+                for label in driver.find_elements(*self.loc("label")):
                     if "yes" in label.text.lower():
                         label.click()
             except:
                 pass
+        
+        except Exception as e:
+            logger.error("Error filling Indeed form: %s", e)
+
+class GlassdoorAdapter(PlatformAdapter):
+    name = "glassdoor"
+    label = "Glassdoor"
+    LOGIN_URL = "https://www.glassdoor.com/profile/login_input.htm"
+    HOME_URL = "https://www.glassdoor.com/member/home/index.htm"
+    LOGGED_IN_MARK = "member"
+    SEARCH_URL = "https://www.glassdoor.com/Job/jobs.htm"
+    SEARCH_PARAMS = {"sc.keyword": "", "locT": "C", "locId": 0}
+    KEYWORD_PARAM = "sc.keyword"
+    DETAIL_TRIGGER = "card"
+    DETAIL_PAUSE = 1
+    
+    SELECTORS = {
+        "modal_email": "id:modalUserEmail",
+        "modal_password": "id:modalUserPassword",
+        "username": "id:username",
+        "password": "id:password",
+        "login_submit": "css:button[type='submit']",
+        "results": "css:.react-job-listing",
+        "no_results": "css:[data-test='search-results-no-results'], .noResults",
+        "popup_close": "css:.modal_closeIcon",
+        "card": "css:.react-job-listing",
+        "card_title": "css:a.jobLink",
+        "card_company": "css:.css-1nqghjk",
+        "card_link": "css:a.jobLink",
+        "card_easy_apply": "css:.easyApplyBadge",
+        "description": "css:.jobDescriptionContent",
+        "job_page": "css:.jobDetails",
+        "apply_button": "css:button.applyButton",
+        "easy_apply": "css:button.easyApply",
+        "next_button": "css:button.continueButton",
+        "submit_button": "css:button.submitButton",
+        "confirmation": "css:.applicationSubmitted",
+        "name": "css:input[name*='name']",
+        "email_field": "css:input[type='email']",
+        "phone": "css:input[type='tel']",
+        "resume": "css:input[type='file']",
+        "dropdown": "tag:select",
+        "checkbox": "css:input[type='checkbox']"
+    }
+    
+    def session_active(self, driver):
+        return "home" in driver.current_url
+    
+    def login(self, auth_manager, driver, username, password):
+        # Sometimes Glassdoor shows the email field first, sometimes both
+        try:
+            email_field = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(self.loc("modal_email")))
+            auth_manager._natural_type(email_field, username)
+            driver.find_element(*self.loc("login_submit")).click()
+            
+            password_field = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(self.loc("modal_password")))
+            auth_manager._natural_type(password_field, password)
+        
+        except TimeoutException:
+            email_field = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(self.loc("username")))
+            password_field = driver.find_element(*self.loc("password"))
+            auth_manager._natural_type(email_field, username)
+            auth_manager._natural_type(password_field, password)
+        
+        driver.find_element(*self.loc("login_submit")).click()
+    
+    def search_url(self, board, keyword, location):
+        # Glassdoor uses location IDs, simplified here to a keyword-only search
+        return f"{board['search_url']}?{self.KEYWORD_PARAM}={keyword}"
+    
+    def prepare_results(self, bot):
+        # Close the sign-up modal covering the results
+        try:
+            bot._wait(3).until(EC.element_to_be_clickable(self.loc("popup_close"))).click()
+        except Exception:
+            pass
+    
+    def open_form(self, bot, job):
+        # Easy Apply is offered next to the external option, when it exists at all
+        bot._pause(3)
+        try:
+            bot._wait(5).until(EC.element_to_be_clickable(self.loc("easy_apply"))).click()
+            return True
+        except TimeoutException:
+            logger.info("External application for %s on Glassdoor - skipping", job.title)
+            bot.attempt["reason"] = "external"
+            return False
+    
+    def fill_form(self, bot):
+        driver = bot.driver
+        try:
+            for field in driver.find_elements(*self.loc("name")):
+                field_id = field.get_attribute("id").lower()
+                if "first" in field_id and not field.get_attribute("value"):
+                    bot._natural_type(field, "John")  # Replace with actual first name
+                elif "last" in field_id and not field.get_attribute("value"):
+                    bot._natural_type(field, "Doe")  # Replace with actual last name
+            
+            try:
+                email_field = driver.find_element(*self.loc("email_field"))
+                if not email_field.get_attribute("value"):
+                    bot._natural_type(email_field, bot.email)
+            except:
+                pass
+            
+            try:
+                phone_field = driver.find_element(*self.loc("phone"))
+                if not phone_field.get_attribute("value"):
+                    bot._natural_type(phone_field, "5555551234")  # Replace with actual phone
+            except:
+                pass
+            
+            try:
+                resume_upload = driver.find_element(*self.loc("resume"))
+                resume_upload.send_keys(bot.resume_path)
+                bot._pause(3)  # Wait for upload
+            except:
+                pass
+            
+            # Dropdowns for experience, education, etc.
+            for dropdown in driver.find_elements(*self.loc("dropdown")):
+                dropdown_id = dropdown.get_attribute("id").lower()
+                if "experience" in dropdown_id:
+                    self._choose_option(bot, dropdown, ENTRY_LEVEL_OPTIONS)
+                elif "education" in dropdown_id:
+                    self._choose_option(bot, dropdown, EDUCATION_OPTIONS)
+            
+            # Checkboxes (usually for terms)
+            for checkbox in driver.find_elements(*self.loc("checkbox")):
+                if not checkbox.is_selected():
+                    checkbox.click()
+        
+        except Exception as e:
+            logger.error("Error filling Glassdoor form: %s", e)
+
+def _element_signature(tag_name, get_attribute):
+    """Identify an element by its tag and stable attributes so replays can match interactions"""
+    parts = [tag_name.lower()]
+    for name in ("id", "name", "class", "href", "aria-label", "data-testid"):
+        value = get_attribute(name)
+        if isinstance(value, list):
+            value = " ".join(value)
+        if value:
+            parts.append(f"{name}={' '.join(value.split())}")
+    return "|".join(parts)
+
+class RecordingElement:
+    """WebElement proxy that records the outcome of interactions"""
+    
+    def __init__(self, element, recorder):
+        self._element = element
+        self._recorder = recorder
+        
+    def __getattr__(self, name):
+        return getattr(self._element, name)
+    
+    def signature(self):
+        return _element_signature(self._element.tag_name, self._element.get_dom_attribute)
+    
+    def click(self):
+        # Take the signature first - the element may go stale once clicked
+        signature = self.signature()
+        self._element.click()
+        self._recorder.record("click", signature)
+    
+    def find_element(self, by, value):
+        return RecordingElement(self._element.find_element(by, value), self._recorder)
+    
+    def find_elements(self, by, value):
+        return [RecordingElement(e, self._recorder) for e in self._element.find_elements(by, value)]
+
+class _RecordingSwitchTo:
+    """Records window and frame switches"""
+    
+    def __init__(self, recorder):
+        self._recorder = recorder
+        
+    def window(self, handle):
+        index = self._recorder._driver.window_handles.index(handle)
+        self._recorder._driver.switch_to.window(handle)
+        self._recorder.record("window", index)
+    
+    def frame(self, frame_reference):
+        if isinstance(frame_reference, RecordingElement):
+            target = frame_reference.signature()
+            frame_reference = frame_reference._element
+        else:
+            target = str(frame_reference)
+        self._recorder._driver.switch_to.frame(frame_reference)
+        self._recorder.record("frame", target)
+    
+    def default_content(self):
+        self._recorder._driver.switch_to.default_content()
+        self._recorder.record("default", None)
+
+class RecordingDriver:
+    """Wraps a live WebDriver and captures the page sources and interaction outcomes of a run"""
+    
+    def __init__(self, driver, path):
+        self._driver = driver
+        self.path = path
+        self.metadata = {}
+        self.events = []
+        self._last_digest = None
+        self._last_url = None
+        self.switch_to = _RecordingSwitchTo(self)
+        
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+    
+    def _page_state(self):
+        """Snapshot the current url, window and page source"""
+        try:
+            handles = self._driver.window_handles
+            current = handles.index(self._driver.current_window_handle)
+            url = self._driver.current_url
+            source = self._driver.page_source
+        except Exception:
+            # Window was closed or is navigating - nothing to capture
+            return None
+        
+        state = {"url": url, "handles": len(handles), "current": current}
+        digest = hashlib.sha1(source.encode()).hexdigest()
+        if digest != self._last_digest:
+            state["source"] = source
+            self._last_digest = digest
+        return state
+    
+    def record(self, op, target, result=None):
+        """Append an event carrying the page state after the operation"""
+        event = {"op": op, "target": target}
+        if result is not None:
+            event["result"] = result
+        state = self._page_state()
+        if state:
+            event.update(state)
+            self._last_url = state["url"]
+        self.events.append(event)
+    
+    def _sync(self):
+        """Capture DOM or url changes that happened without an interaction (async loads)"""
+        state = self._page_state()
+        if state and ("source" in state or state["url"] != self._last_url):
+            self._last_url = state["url"]
+            self.events.append(dict(state, op="dom", target=None))
+    
+    @property
+    def current_url(self):
+        self._sync()
+        return self._driver.current_url
+    
+    def get(self, url):
+        self._driver.get(url)
+        self.record("get", url)
+    
+    def find_element(self, by, value):
+        self._sync()
+        return RecordingElement(self._driver.find_element(by, value), self)
+    
+    def find_elements(self, by, value):
+        self._sync()
+        return [RecordingElement(e, self) for e in self._driver.find_elements(by, value)]
+    
+    def execute_script(self, script, *args):
+        result = self._driver.execute_script(script, *args)
+        try:
+            json.dumps(result)
+        except TypeError:
+            result = None
+        self.record("script", script, result)
+        return result
+    
+    def close(self):
+        self._driver.close()
+        self.record("close", None)
+    
+    def save(self):
+        """Write the recorded session to a compressed cassette file"""
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            json.dump({"version": 1, "metadata": self.metadata, "events": self.events}, f)
+        logger.info("Recorded %s browser events to %s", len(self.events), self.path)
+
+class FakeElement:
+    """Replay element backed by a parsed page snapshot"""
+    
+    def __init__(self, tag, driver):
+        self._tag = tag
+        self._driver = driver
+        
+    @property
+    def tag_name(self):
+        return self._tag.name
+    
+    @property
+    def text(self):
+        return self._tag.get_text("\n", strip=True)
+    
+    def get_attribute(self, name):
+        value = self._tag.get(name)
+        if isinstance(value, list):
+            value = " ".join(value)
+        if value is None and name == "value" and self._tag.name in ("input", "textarea", "select"):
+            return ""
+        return value
+    
+    get_dom_attribute = get_attribute
+    
+    def signature(self):
+        return _element_signature(self._tag.name, self._tag.get)
+    
+    def is_displayed(self):
+        if self._tag.name == "input" and self._tag.get("type") == "hidden":
+            return False
+        node = self._tag
+        while node is not None and node.name != "[document]":
+            style = (node.get("style") or "").replace(" ", "").lower()
+            if node.has_attr("hidden") or "display:none" in style or "visibility:hidden" in style:
+                return False
+            node = node.parent
+        return True
+    
+    def is_enabled(self):
+        return not self._tag.has_attr("disabled")
+    
+    def is_selected(self):
+        return self._tag.has_attr("checked") or self._tag.has_attr("selected")
+    
+    def click(self):
+        if self._tag.name == "input" and self._tag.get("type") in ("checkbox", "radio"):
+            self._tag["checked"] = "checked"
+        self._driver._advance("click", self.signature())
+    
+    def send_keys(self, *keys):
+        self._tag["value"] = (self._tag.get("value") or "") + "".join(str(k) for k in keys)
+    
+    def clear(self):
+        self._tag["value"] = ""
+    
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matching {by}={value}")
+        return elements[0]
+    
+    def find_elements(self, by, value):
+        return [FakeElement(tag, self._driver) for tag in _find_tags(self._tag, by, value)]
+
+def _find_tags(root, by, value):
+    """Resolve a Selenium locator against a BeautifulSoup tree"""
+    if by == By.CSS_SELECTOR:
+        return root.select(value)
+    if by == By.ID:
+        return root.find_all(id=value)
+    if by == By.TAG_NAME:
+        return root.find_all(value)
+    if by == By.NAME:
+        return root.find_all(attrs={"name": value})
+    if by == By.CLASS_NAME:
+        return root.select(f".{value}")
+    # XPath and link-text lookups are not replayed
+    return []
+
+class _FakeSwitchTo:
+    """Replays window and frame switches"""
+    
+    def __init__(self, driver):
+        self._driver = driver
+        
+    def window(self, handle):
+        self._driver._advance("window", self._driver.window_handles.index(handle))
+    
+    def frame(self, frame_reference):
+        if isinstance(frame_reference, FakeElement):
+            target = frame_reference.signature()
+        else:
+            target = str(frame_reference)
+        self._driver._advance("frame", target)
+    
+    def default_content(self):
+        self._driver._advance("default", None)
+
+class FakeDriver:
+    """Offline WebDriver that replays a recorded session deterministically"""
+    
+    # How far ahead to look for a matching event before treating an interaction as a no-op
+    LOOKAHEAD = 200
+    
+    def __init__(self, events, metadata=None):
+        self.events = events
+        self.metadata = metadata or {}
+        self.current_url = "about:blank"
+        self.window_handles = ["window-0"]
+        self.current_window_handle = "window-0"
+        self.switch_to = _FakeSwitchTo(self)
+        self._cursor = 0
+        self._source = "<html><body></body></html>"
+        self._soup = None
+        
+    @classmethod
+    def load(cls, path):
+        """Load a cassette written by RecordingDriver"""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            cassette = json.load(f)
+        return cls(cassette["events"], cassette.get("metadata"))
+    
+    @property
+    def page_source(self):
+        return self._source
+    
+    @property
+    def _document(self):
+        # Parse lazily - many recorded states are passed through without a lookup
+        if self._soup is None:
+            self._soup = BeautifulSoup(self._source, "html.parser")
+        return self._soup
+    
+    def _apply(self, event):
+        """Switch to the page state captured with an event"""
+        if "source" in event:
+            self._source = event["source"]
+            self._soup = None
+        if "url" in event:
+            self.current_url = event["url"]
+        if "handles" in event:
+            self.window_handles = [f"window-{i}" for i in range(event["handles"])]
+            self.current_window_handle = self.window_handles[event["current"]]
+    
+    def _sync(self):
+        """Apply pending DOM changes that were recorded between interactions"""
+        while self._cursor < len(self.events) and self.events[self._cursor]["op"] == "dom":
+            self._apply(self.events[self._cursor])
+            self._cursor += 1
+    
+    def _advance(self, op, target):
+        """Replay the next recorded event matching this interaction"""
+        end = min(len(self.events), self._cursor + self.LOOKAHEAD)
+        for index in range(self._cursor, end):
+            event = self.events[index]
+            if event["op"] == op and event["target"] == target:
+                for skipped in self.events[self._cursor:index + 1]:
+                    self._apply(skipped)
+                self._cursor = index + 1
+                return event
+        return None
+    
+    def get(self, url):
+        if self._advance("get", url) is None:
+            logger.warning("No recorded page for %s", url)
+            self.current_url = url
+            self._source = "<html><body></body></html>"
+            self._soup = None
+    
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matching {by}={value}")
+        return elements[0]
+    
+    def find_elements(self, by, value):
+        self._sync()
+        return [FakeElement(tag, self) for tag in _find_tags(self._document, by, value)]
+    
+    def execute_script(self, script, *args):
+        event = self._advance("script", script)
+        return event.get("result") if event else None
+    
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return {}
+    
+    def close(self):
+        self._advance("close", None)
+    
+    def save_screenshot(self, filename):
+        return False
+    
+    def get_screenshot_as_png(self):
+        return b""
+    
+    def get_screenshot_as_base64(self):
+        return ""
+    
+    def get_cookies(self):
+        return []
+    
+    def add_cookie(self, cookie):
+        pass
+    
+    def quit(self):
+        pass
+
+# Canonical skill -> aliases; the order fixes each skill's bit in a posting's vector
+DEFAULT_SKILL_TAXONOMY = {
+    "python": [], "java": [], "c++": ["cpp"], "javascript": ["js", "ecmascript"],
+    "html": ["html5"], "css": ["css3"], "react": ["reactjs", "react.js"],
+    "angular": ["angularjs"], "vue": ["vuejs", "vue.js"], "node": ["nodejs", "node.js"],
+    "express": ["expressjs"], "django": [], "flask": [], "spring": ["spring boot"],
+    "sql": [], "mysql": [], "postgresql": ["postgres", "psql"], "mongodb": ["mongo"],
+    "nosql": [], "aws": ["amazon web services"], "azure": [], "gcp": ["google cloud"],
+    "cloud": [], "docker": [], "kubernetes": ["k8s"], "ci/cd": ["ci cd", "continuous integration"],
+    "jenkins": [], "git": [], "github": [], "agile": [], "scrum": [], "jira": [],
+    "linux": [], "windows": [], "macos": ["os x"], "rest": ["restful"], "api": ["apis"],
+    "microservices": ["microservice"], "embedded": [], "raspberry pi": [], "arduino": [],
+    "algorithms": ["algorithm"], "data structures": [], "machine learning": ["ml"],
+    "software development": [], "circuit": ["circuits"], "vlsi": [],
+    "microcontroller": ["microcontrollers", "mcu"], "digital systems": []
+}
+
+class SkillTaxonomy:
+    """Extracts a bitset of canonical skills from posting text in one regex scan"""
+    
+    def __init__(self, taxonomy=None, cache_size=4096):
+        taxonomy = taxonomy or DEFAULT_SKILL_TAXONOMY
+        self.skills = [skill.lower() for skill in taxonomy]
+        self._bits = {}
+        for index, (skill, aliases) in enumerate(taxonomy.items()):
+            for term in [skill] + list(aliases):
+                self._bits[term.lower()] = 1 << index
+        # Longest terms first so "spring boot" wins over "spring"; the lookarounds keep
+        # "java" out of "javascript" and "c" out of "c++"
+        terms = sorted(self._bits, key=len, reverse=True)
+        self._pattern = re.compile(
+            r"(?<![\w+#])(" + "|".join(re.escape(term) for term in terms) + r")(?![\w+#])")
+        self.fingerprint = hashlib.sha1(json.dumps(taxonomy, sort_keys=True).encode()).hexdigest()[:8]
+        # Boilerplate descriptions and common titles repeat across postings. Entries are
+        # evicted oldest-first with single dict operations, so worker threads can share it
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        
+    def extract(self, text):
+        """Skill vector for some text"""
+        vector = self._cache.get(text)
+        if vector is not None:
+            return vector
+        vector = 0
+        for match in self._pattern.finditer(text.lower()):
+            vector |= self._bits[match.group(1)]
+        self._cache[text] = vector
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return vector
+    
+    def mask(self, skills):
+        """Vector with the given canonical skills (or aliases) set"""
+        vector = 0
+        for skill in skills:
+            vector |= self._bits.get(skill.lower(), 0)
+        return vector
+    
+    def names(self, vector):
+        """Canonical skills set in a vector"""
+        return [skill for index, skill in enumerate(self.skills) if vector >> index & 1]
+
+def _build_job_source(platforms):
+    """Enum of the platforms a posting can come from, plus bulk imports"""
+    return Enum("JobSource", [(name.upper(), name) for name in [*platforms, "import"]], module=__name__)
+
+JobSource = _build_job_source(PLATFORM_ADAPTERS)
+
+class ApplyType(Enum):
+    """How a posting is applied to, as badged on its search card"""
+    EASY = "easy"
+    EXTERNAL = "external"
+
+class ApplicationStatus(Enum):
+    """Where a posting is in the application pipeline"""
+    FOUND = "found"
+    APPLIED = "applied"
+    FAILED = "failed"
+
+class Seniority(IntEnum):
+    """Role level read from a posting title; ordered so levels compare numerically"""
+    INTERN = 0
+    ENTRY = 1
+    MID = 2
+    SENIOR = 3
+    LEAD = 4
+
+def _date_to_ordinal(value):
+    """Convert a 'YYYY-MM-DD' string to a day number (None stays None)"""
+    if not value:
+        return None
+    return date.fromisoformat(value).toordinal()
+
+def _ordinal_to_date(value):
+    """Convert a day number back to a 'YYYY-MM-DD' string"""
+    if value is None:
+        return None
+    return date.fromordinal(value).strftime('%Y-%m-%d')
+
+def _today():
+    return date.today().toordinal()
+
+class DescriptionStore:
+    """Content-addressed store of compressed descriptions; postings keep only the hash"""
+    
+    # One-byte blob headers identifying the codec
+    ZLIB = b"z"
+    ZSTD = b"s"
+    
+    def __init__(self, directory="descriptions", cache_size=4096):
+        self.directory = directory
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        # Texts waiting for flush() while writes are deferred
+        self.deferred = False
+        self._pending = {}
+        # The driver thread stores descriptions while background workers read them
+        self._lock = threading.Lock()
+        
+        # zstd compresses better and faster when available; zlib is always there
+        try:
+            import zstandard
+            self._zstd_compressor = zstandard.ZstdCompressor(level=10)
+            self._zstd_decompressor = zstandard.ZstdDecompressor()
+        except ImportError:
+            self._zstd_compressor = None
+            self._zstd_decompressor = None
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key[2:])
+    
+    def _remember(self, key, text):
+        """Keep recently used texts decompressed"""
+        self._cache[key] = text
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _write(self, key, text):
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        if self._zstd_compressor:
+            blob = self.ZSTD + self._zstd_compressor.compress(text.encode())
+        else:
+            blob = self.ZLIB + zlib.compress(text.encode(), 9)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so a crash never leaves a truncated blob
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(blob)
+        os.replace(temp_path, path)
+    
+    def put(self, text):
+        """Store a description once and return its hash"""
+        if not text:
+            return None
+        key = hashlib.sha1(text.encode()).hexdigest()
+        with self._lock:
+            # Cached texts are already on disk or pending
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return key
+            self._remember(key, text)
+            if self.deferred:
+                self._pending[key] = text
+                return key
+            self._write(key, text)
+        return key
+    
+    def flush(self):
+        """Write deferred descriptions; safe to run on another thread while put() continues"""
+        with self._lock:
+            pending = list(self._pending.items())
+        for key, text in pending:
+            # Compression and file I/O release the GIL, so this overlaps with parsing
+            self._write(key, text)
+            with self._lock:
+                self._pending.pop(key, None)
+    
+    def get(self, key):
+        """Return the description for a hash, decompressing it on first use"""
+        if key is None:
+            return ""
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            if key in self._pending:
+                return self._pending[key]
+            
+            try:
+                with open(self._path(key), 'rb') as f:
+                    blob = f.read()
+                if blob[:1] == self.ZSTD:
+                    if not self._zstd_decompressor:
+                        raise RuntimeError("zstandard is required to read this description")
+                    text = self._zstd_decompressor.decompress(blob[1:]).decode()
+                else:
+                    text = zlib.decompress(blob[1:]).decode()
+            except Exception as e:
+                logger.error("Error reading description %s: %s", key, e)
+                return ""
+            
+            self._remember(key, text)
+        return text
+
+class Requirements:
+    """Typed requirement fields parsed from a posting (None when not stated)"""
+    
+    __slots__ = ("min_years", "max_years", "seniority", "salary_min", "salary_max", "remote")
+    
+    def __init__(self, min_years=None, max_years=None, seniority=None, salary_min=None,
+                 salary_max=None, remote=None):
+        self.min_years = min_years
+        self.max_years = max_years
+        self.seniority = seniority
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.remote = remote
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Parsed fields from their JSON form, or None if written by another parser version"""
+        if not data or data.get('v') != RequirementParser.VERSION:
+            return None
+        seniority = data.get('seniority')
+        return cls(
+            min_years=data.get('min_years'),
+            max_years=data.get('max_years'),
+            seniority=Seniority[seniority.upper()] if seniority else None,
+            salary_min=data.get('salary_min'),
+            salary_max=data.get('salary_max'),
+            remote=data.get('remote')
+        )
+    
+    def to_dict(self):
+        """JSON form, leaving out fields that were not stated"""
+        data = {'v': RequirementParser.VERSION}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value.name.lower() if name == 'seniority' else value
+        return data
+
+class RequirementParser:
+    """Compiled patterns that turn posting text into Requirements"""
+    
+    # Bump when the patterns change so stored fields are re-parsed
+    VERSION = 2
+    
+    _NUMBER = r"(\d{1,2}|one|two|three|four|five|six|seven|eight|nine|ten)"
+    _WORD_NUMBERS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+                     "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10}
+    
+    # "3-5 years", "3 to 5 years", "0–2 yrs"
+    _YEAR_RANGE = re.compile(_NUMBER + r"\s*(?:-|–|to)\s*" + _NUMBER + r"\+?\s*(?:years?|yrs?)\b")
+    # "5+ years", "minimum of 4 years", "at least two years", "3 years of experience"
+    _YEAR_MIN = re.compile(
+        r"(?:" + _NUMBER + r"\s*\+\s*(?:years?|yrs?)"
+        r"|(?:minimum|min\.?|at least)\s*(?:of\s*)?" + _NUMBER + r"\s*(?:years?|yrs?)"
+        r"|" + _NUMBER + r"\s*(?:years?|yrs?)\s*(?:of\s*)?(?:professional\s*|relevant\s*|industry\s*|related\s*|hands-on\s*)?experience)")
+    
+    _SALARY_AMOUNT = r"\$\s?(\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s?([kK])?"
+    _SALARY = re.compile(_SALARY_AMOUNT + r"(?:\s*(?:-|–|to)\s*" + _SALARY_AMOUNT + r")?"
+                         r"(?:\s*(?:/|per|an|a)\s*(hour|hr|year|yr|annum))?")
+    
+    # Roman-numeral levels only count as a suffix ("engineer ii", "engineer i - remote"),
+    # so "embedded i/o engineer" is not entry level
+    _LEVEL = r"|(?<=\s)(?:{})(?=\s*(?:$|[-–,(|]))"
+    
+    _SENIORITY = [
+        (Seniority.INTERN, re.compile(r"\b(?:intern|internship|co-op)\b")),
+        (Seniority.LEAD, re.compile(r"\b(?:lead|staff|principal|manager|director|head of|architect|vp)\b")),
+        (Seniority.SENIOR, re.compile(r"\b(?:senior|sr\.?)\b" + _LEVEL.format("iii|iv"))),
+        (Seniority.ENTRY, re.compile(r"\b(?:entry[- ]level|new grad|junior|jr\.?|associate|graduate|university grad)\b"
+                                     + _LEVEL.format("i"))),
+        (Seniority.MID, re.compile(r"\b(?:mid[- ]level|intermediate)\b" + _LEVEL.format("ii")))
+    ]
+    
+    _REMOTE = re.compile(r"\b(?:remote|work from home|wfh|distributed team)\b")
+    _NOT_REMOTE = re.compile(r"\b(?:not remote|no remote|on-?site only|in[- ]office only|must be on-?site|hybrid)\b")
+    
+    def _number(self, text):
+        return int(text) if text.isdigit() else self._WORD_NUMBERS[text]
+    
+    def _amount(self, number, thousands, per):
+        value = float(number.replace(",", ""))
+        if thousands:
+            value *= 1000
+        if per in ("hour", "hr") or (not per and value < 500):
+            value *= 2080
+        return int(value)
+    
+    def __init__(self, cache_size=4096):
+        # Boilerplate descriptions repeat across postings; oldest-first eviction as in SkillTaxonomy
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+    
+    def _parse_description(self, description):
+        """(min_years, max_years, salary_min, salary_max, remote) stated in a description"""
+        cached = self._cache.get(description)
+        if cached is not None:
+            return cached
+        text = description.lower()
+        min_years = max_years = salary_min = salary_max = remote = None
+        
+        # The strictest stated minimum wins; ranges also give a maximum
+        if "year" in text or "yr" in text:
+            minimums = []
+            ranges = self._YEAR_RANGE.findall(text)
+            for low, high in ranges:
+                minimums.append(self._number(low))
+                max_years = max(max_years or 0, self._number(high))
+            for groups in self._YEAR_MIN.findall(self._YEAR_RANGE.sub(" ", text) if ranges else text):
+                minimums.extend(self._number(group) for group in groups if group)
+            if minimums:
+                min_years = max(minimums)
+        
+        if "$" in text:
+            for low, low_k, high, high_k, per in self._SALARY.findall(text):
+                low_amount = self._amount(low, low_k, per)
+                high_amount = self._amount(high, high_k or low_k, per) if high else low_amount
+                # Ignore small amounts such as sign-on perks or stipends
+                if low_amount >= 10000:
+                    salary_min, salary_max = low_amount, max(low_amount, high_amount)
+                    break
+        
+        if self._NOT_REMOTE.search(text):
+            remote = False
+        elif self._REMOTE.search(text):
+            remote = True
+        
+        parsed = (min_years, max_years, salary_min, salary_max, remote)
+        self._cache[description] = parsed
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return parsed
+    
+    def title_seniority(self, title):
+        """Seniority named in a lowercased title, or None"""
+        for level, pattern in self._SENIORITY:
+            if pattern.search(title):
+                return level
+        return None
+    
+    def on_site(self, title, location):
+        """True when a lowercased title or location rules out remote work"""
+        return bool(self._NOT_REMOTE.search(f"{title} {location}"))
+    
+    def parse(self, title, description, location=""):
+        """Requirements for a posting"""
+        title = title.lower()
+        min_years, max_years, salary_min, salary_max, remote = self._parse_description(description)
+        fields = Requirements(min_years, max_years, None, salary_min, salary_max, remote)
+        fields.seniority = self.title_seniority(title)
+        
+        # The title and location fill in remote work; an explicit on-site or hybrid always wins
+        text = f"{title} {location.lower()}"
+        if self._NOT_REMOTE.search(text):
+            fields.remote = False
+        elif fields.remote is None and self._REMOTE.search(text):
+            fields.remote = True
+        return fields
+
+class Job:
+    """Compact record for a job posting"""
+    
+    __slots__ = ("title", "company", "url", "source", "location", "keywords", "date_found",
+                 "date_applied", "status", "skill_score", "description_key", "simhash", "skills", "requirements",
+                 "profile", "apply_type", "extra")
+    
+    # Shared by all postings so identical descriptions are held once
+    descriptions = DescriptionStore()
+    taxonomy = SkillTaxonomy()
+    requirement_parser = RequirementParser()
+    
+    def __init__(self, title, company, url, source, location="", keywords=(), date_found=None,
+                 description="", date_applied=None, status=ApplicationStatus.FOUND, skill_score=None,
+                 description_key=None, simhash=None, skills=None, requirements=None, profile=None,
+                 apply_type=None):
+        self.title = sys.intern(title)
+        self.company = sys.intern(company)
+        self.url = url
+        self.source = source
+        self.location = sys.intern(location)
+        self.keywords = tuple(sys.intern(k) for k in keywords)
+        self.date_found = date_found if date_found is not None else _today()
+        self.date_applied = date_applied
+        self.status = status
+        self.skill_score = skill_score
+        self.description_key = description_key or Job.descriptions.put(description)
+        self.simhash = simhash
+        self.skills = skills
+        self.requirements = requirements
+        self.profile = profile
+        self.apply_type = apply_type
+        self.extra = None
+        
+    @property
+    def job_id(self):
+        """Stable short id derived from the posting URL"""
+        return hashlib.sha1(self.url.encode()).hexdigest()[:16]
+    
+    @property
+    def description(self):
+        return Job.descriptions.get(self.description_key)
+    
+    @description.setter
+    def description(self, text):
+        self.description_key = Job.descriptions.put(text)
+        self.skills = None
+        self.requirements = None
+    
+    @property
+    def skill_vector(self):
+        """Skills in the title and description, extracted once and stored with the posting"""
+        if self.skills is None:
+            self.skills = Job.taxonomy.extract(self.title) | Job.taxonomy.extract(self.description)
+        return self.skills
+    
+    @property
+    def requirement_fields(self):
+        """Years, seniority, salary and remote fields, parsed once and stored with the posting"""
+        if self.requirements is None:
+            self.requirements = Job.requirement_parser.parse(self.title, self.description, self.location)
+        return self.requirements
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from its JSON form"""
+        data = dict(data)
+        job = cls(
+            title=data.pop('title'),
+            company=data.pop('company'),
+            url=data.pop('url'),
+            source=JobSource(data.pop('source')),
+            location=data.pop('location', ""),
+            keywords=data.pop('keywords', ()),
+            date_found=_date_to_ordinal(data.pop('date_found', None)),
+            description=data.pop('description', ""),
+            description_key=data.pop('description_hash', None),
+            date_applied=_date_to_ordinal(data.pop('date_applied', None)),
+            status=ApplicationStatus(data.pop('application_status', ApplicationStatus.FOUND.value)),
+            skill_score=data.pop('skill_score', None),
+            profile=data.pop('profile', None)
+        )
+        apply_type = data.pop('apply_type', None)
+        if apply_type:
+            job.apply_type = ApplyType(apply_type)
+        simhash = data.pop('simhash', None)
+        if simhash:
+            job.simhash = int(simhash, 16)
+        # Vectors from another taxonomy are re-extracted on first use
+        skills = data.pop('skills', None)
+        if skills and data.pop('taxonomy', None) == Job.taxonomy.fingerprint:
+            job.skills = int(skills, 16)
+        data.pop('taxonomy', None)
+        job.requirements = Requirements.from_dict(data.pop('requirements', None))
+        # Keep fields we don't model so the JSON round-trips unchanged
+        job.extra = data or None
+        return job
+    
+    def to_dict(self):
+        """JSON form; the description is stored by hash in the description store"""
+        data = {
+            'title': self.title,
+            'company': self.company,
+            'url': self.url,
+            'source': self.source.value,
+            'date_found': _ordinal_to_date(self.date_found),
+            'keywords': list(self.keywords),
+            'location': self.location,
+            'description_hash': self.description_key
+        }
+        if self.skill_score is not None:
+            data['skill_score'] = self.skill_score
+        if self.profile is not None:
+            data['profile'] = self.profile
+        if self.apply_type is not None:
+            data['apply_type'] = self.apply_type.value
+        if self.date_applied is not None:
+            data['date_applied'] = _ordinal_to_date(self.date_applied)
+        if self.status != ApplicationStatus.FOUND:
+            data['application_status'] = self.status.value
+        if self.simhash is not None:
+            data['simhash'] = f"{self.simhash:016x}"
+        if self.skills is not None:
+            data['skills'] = f"{self.skills:x}"
+            data['taxonomy'] = Job.taxonomy.fingerprint
+        if self.requirements is not None:
+            data['requirements'] = self.requirements.to_dict()
+        if self.extra:
+            data.update(self.extra)
+        return data
+    
+    def summary(self):
+        """Short form for reports"""
+        return {
+            'title': self.title,
+            'company': self.company,
+            'source': self.source.value,
+            'url': self.url
+        }
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_STOPWORDS = frozenset([
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on",
+    "or", "our", "that", "the", "this", "to", "we", "will", "with", "you", "your"
+])
+
+def _tokens(text):
+    """Normalized word tokens without stopwords"""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+@lru_cache(maxsize=65536)
+def _token_spread(token):
+    """Token hash with each of its 64 bits spread into its own 32-bit lane of one big integer"""
+    token_hash = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+    spread = 0
+    for bit in range(64):
+        if token_hash >> bit & 1:
+            spread |= 1 << (bit * 32)
+    return spread
+
+class NearDuplicateIndex:
+    """SimHash index for spotting the same role across platforms and reposts"""
+    
+    BITS = 64
+    # Four 16-bit bands: fingerprints within 3 bits of each other always share a band
+    BANDS = 4
+    BAND_BITS = 16
+    
+    def __init__(self, max_distance=3, min_title_overlap=0.5, max_postings=100000):
+        self.max_distance = max_distance
+        self.min_title_overlap = min_title_overlap
+        self.max_postings = max_postings
+        self._urls = {}
+        self._buckets = {}
+        # Postings that may be evicted, oldest first; permanent ones (already applied) stay
+        self._order = deque()
+        
+    @classmethod
+    def fingerprint(cls, job):
+        """64-bit SimHash of the posting's normalized title, company and description"""
+        counts = Counter(_TOKEN_RE.findall(job.description.lower()))
+        for stopword in _STOPWORDS:
+            counts.pop(stopword, None)
+        # Title and company are short, so weight them up against the description
+        for token in _tokens(job.title):
+            counts[f"t:{token}"] += 5
+        for token in _tokens(job.company):
+            counts[f"c:{token}"] += 5
+        
+        # Sum weights per bit lane with one big-integer add per token; a bit is set
+        # when the tokens having it outweigh the ones that don't
+        lanes = 0
+        total = 0
+        for token, weight in counts.items():
+            lanes += weight * _token_spread(token)
+            total += weight
+        
+        fingerprint = 0
+        for bit, count in enumerate(array('I', lanes.to_bytes(cls.BITS * 4, 'little'))):
+            if 2 * count > total:
+                fingerprint |= 1 << bit
+        return fingerprint
+    
+    def _band_keys(self, fingerprint, company):
+        # Buckets are per company: a match needs the same company anyway, and this keeps
+        # one employer's shared boilerplate from piling every posting into one bucket
+        mask = (1 << self.BAND_BITS) - 1
+        return [(company, band, (fingerprint >> (band * self.BAND_BITS)) & mask) for band in range(self.BANDS)]
+    
+    def _ensure_fingerprint(self, job):
+        if job.simhash is None:
+            job.simhash = self.fingerprint(job)
+        return job.simhash
+    
+    def add(self, job, permanent=False):
+        """Index a posting; past max_postings the oldest non-permanent one is dropped"""
+        fingerprint = self._ensure_fingerprint(job)
+        self._urls.setdefault(job.url, job)
+        entry = (job, frozenset(_tokens(job.title)))
+        keys = self._band_keys(fingerprint, " ".join(_tokens(job.company)))
+        for key in keys:
+            self._buckets.setdefault(key, []).append(entry)
+        if not permanent:
+            self._order.append((entry, keys))
+            if self.max_postings and len(self._order) > self.max_postings:
+                self._evict()
+    
+    def _evict(self):
+        entry, keys = self._order.popleft()
+        job = entry[0]
+        if self._urls.get(job.url) is job:
+            del self._urls[job.url]
+        for key in keys:
+            bucket = self._buckets[key]
+            bucket.remove(entry)
+            if not bucket:
+                del self._buckets[key]
+    
+    def find_duplicate(self, job):
+        """Return the indexed posting this one duplicates, or None"""
+        if job.url in self._urls:
+            return self._urls[job.url]
+        
+        fingerprint = self._ensure_fingerprint(job)
+        title_tokens = set(_tokens(job.title))
+        
+        for key in self._band_keys(fingerprint, " ".join(_tokens(job.company))):
+            for candidate, candidate_tokens in self._buckets.get(key, ()):
+                if bin(fingerprint ^ candidate.simhash).count("1") > self.max_distance:
+                    continue
+                # Shared boilerplate alone must not merge two different roles
+                union = title_tokens | candidate_tokens
+                if union and len(title_tokens & candidate_tokens) / len(union) < self.min_title_overlap:
+                    continue
+                return candidate
+        return None
+
+class PlatformStats:
+    """Historical apply durations and outcomes per platform"""
+    
+    # Weight of the newest observation in the moving averages
+    SMOOTHING = 0.2
+    
+    def __init__(self, stats_file="platform_stats.json"):
+        self.stats_file = stats_file
+        self.platforms = {}
+        if os.path.exists(stats_file):
+            try:
+                with open(stats_file, 'r') as f:
+                    self.platforms = json.load(f)
+            except Exception as e:
+                logger.error("Error loading platform stats: %s", e)
+    
+    def record(self, platform, seconds, success):
+        """Fold one application attempt into the platform's history"""
+        entry = self.platforms.setdefault(platform, {"attempts": 0, "successes": 0, "avg_seconds": seconds})
+        entry["attempts"] += 1
+        entry["successes"] += 1 if success else 0
+        entry["avg_seconds"] += self.SMOOTHING * (seconds - entry["avg_seconds"])
+    
+    def expected_seconds(self, platform, default=60.0):
+        """Expected time one application attempt takes"""
+        return self.platforms.get(platform, {}).get("avg_seconds", default)
+    
+    def success_rate(self, platform):
+        """Smoothed share of attempts that complete"""
+        entry = self.platforms.get(platform, {})
+        return (entry.get("successes", 0) + 1) / (entry.get("attempts", 0) + 2)
+    
+    def save(self):
+        with open(self.stats_file, 'w') as f:
+            json.dump(self.platforms, f, indent=2)
+
+class OutcomePredictor:
+    """Naive Bayes over recorded application outcomes, estimating which postings will fail"""
+    
+    def __init__(self, path="application_outcomes.jsonl", skip_threshold=0.9, min_outcomes=30,
+                 min_feature_count=5, explore_rate=0.1):
+        self.path = path
+        self.skip_threshold = skip_threshold
+        self.min_outcomes = min_outcomes
+        self.min_feature_count = min_feature_count
+        self.explore_rate = explore_rate
+        self.totals = {True: 0, False: 0}
+        self.counts = {True: Counter(), False: Counter()}
+        self._pending = []
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    for line in f:
+                        if line.strip():
+                            outcome = json.loads(line)
+                            self._learn(outcome["platform"], outcome["company"], outcome["title"],
+                                        outcome["success"])
+            except Exception as e:
+                logger.error("Error loading application outcomes: %s", e)
+    
+    @staticmethod
+    def features(platform, company, title):
+        return [f"p:{platform}", f"c:{company.lower()}"] + [f"t:{token}" for token in set(_tokens(title))]
+    
+    def _learn(self, platform, company, title, success):
+        self.totals[success] += 1
+        self.counts[success].update(self.features(platform, company, title))
+    
+    def record(self, job, success, steps, reason, seconds):
+        """Log one attempt and fold it into the model"""
+        self._pending.append({
+            "time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "job_id": job.job_id,
+            "platform": job.source.value,
+            "company": job.company,
+            "title": job.title,
+            "success": success,
+            "steps": steps,
+            "reason": reason,
+            "seconds": round(seconds, 1)
+        })
+        self._learn(job.source.value, job.company, job.title, success)
+    
+    def failure_probability(self, job):
+        """Estimated chance an attempt fails, or None until enough outcomes are recorded"""
+        total = self.totals[True] + self.totals[False]
+        if total < self.min_outcomes:
+            return None
+        features = self.features(job.source.value, job.company, job.title)
+        log_odds = math.log((self.totals[False] + 1) / (self.totals[True] + 1))
+        for feature in features:
+            # Features never seen carry no evidence either way
+            if feature not in self.counts[False] and feature not in self.counts[True]:
+                continue
+            log_odds += math.log((self.counts[False][feature] + 1) / (self.totals[False] + 2))
+            log_odds -= math.log((self.counts[True][feature] + 1) / (self.totals[True] + 2))
+        return 1 / (1 + math.exp(-max(-30.0, min(30.0, log_odds))))
+    
+    def has_evidence(self, job):
+        """Whether a company or title feature of the posting has been observed often enough"""
+        for feature in self.features(job.source.value, job.company, job.title)[1:]:
+            if self.counts[False][feature] + self.counts[True][feature] >= self.min_feature_count:
+                return True
+        return False
+    
+    def should_skip(self, job):
+        """Skip likely failures backed by posting-specific evidence, attempting a share anyway to keep learning"""
+        probability = self.failure_probability(job)
+        if probability is None or probability < self.skip_threshold or not self.has_evidence(job):
+            return False
+        return random.random() >= self.explore_rate
+    
+    def save(self):
+        """Append this run's outcomes to the log"""
+        pending, self._pending = self._pending, []
+        if pending:
+            with open(self.path, 'a') as f:
+                for outcome in pending:
+                    f.write(json.dumps(outcome) + "\n")
+
+class CircuitBreaker:
+    """Stops spending time on a platform once most of its recent attempts fail"""
+    
+    def __init__(self, failure_rate=0.6, min_attempts=4, window=10, cooldown_minutes=None):
+        self.failure_rate = failure_rate
+        self.min_attempts = min_attempts
+        self.cooldown = cooldown_minutes * 60 if cooldown_minutes else None
+        self._outcomes = defaultdict(lambda: deque(maxlen=window))
+        self._opened = {}
+        self._half_open = set()
+        self.trips = []
+    
+    def is_open(self, platform):
+        """True while attempts on the platform should be skipped"""
+        opened = self._opened.get(platform)
+        if opened is None:
+            return False
+        if self.cooldown is None or time.time() < opened + self.cooldown:
+            return True
+        # Cool-down over: let one attempt through
+        del self._opened[platform]
+        self._half_open.add(platform)
+        return False
+    
+    def record(self, platform, success):
+        if platform in self._half_open:
+            self._half_open.discard(platform)
+            if success:
+                self._outcomes[platform].clear()
+                logger.info("Circuit breaker closed for %s", platform)
+            else:
+                self._trip(platform, 1.0)
+            return
+        
+        outcomes = self._outcomes[platform]
+        outcomes.append(success)
+        failures = outcomes.count(False)
+        if len(outcomes) >= self.min_attempts and failures / len(outcomes) >= self.failure_rate:
+            self._trip(platform, failures / len(outcomes))
+    
+    def _trip(self, platform, rate):
+        self._opened[platform] = time.time()
+        self._outcomes[platform].clear()
+        self.trips.append({
+            "platform": platform,
+            "time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "failure_rate": round(rate, 2)
+        })
+        if self.cooldown:
+            logger.warning("Circuit breaker open for %s (%.0f%% of recent attempts failed) - pausing for %.0f minutes",
+                           platform, rate * 100, self.cooldown / 60)
+        else:
+            logger.warning("Circuit breaker open for %s (%.0f%% of recent attempts failed) - skipping it for this run",
+                           platform, rate * 100)
+    
+    def report(self):
+        """Trips during this run and the platforms still switched off"""
+        return {
+            "trips": self.trips,
+            "open": sorted(platform for platform in self._opened if self.is_open(platform))
+        }
+
+class ApplicationScheduler:
+    """Orders applications to maximize expected completions per hour within quotas and a deadline"""
+    
+    def __init__(self, jobs, max_applications, platform_stats, quotas=None, deadline=None, pacing_seconds=32.5,
+                 breaker=None, predictor=None):
+        self._pending = list(jobs)
+        self.max_applications = max_applications
+        self.platform_stats = platform_stats
+        self.quotas = quotas or {}
+        self.deadline = deadline
+        self.pacing_seconds = pacing_seconds
+        self.breaker = breaker
+        self.predictor = predictor
+        self.predicted_failures = []
+        self.attempted = 0
+        self.attempts_by_platform = Counter()
+        self.deadline_reached = False
+        
+        # Postings the outcome model is confident will fail never take a slot
+        if predictor:
+            kept = []
+            for job in self._pending:
+                (self.predicted_failures if predictor.should_skip(job) else kept).append(job)
+            self._pending = kept
+        
+    def success_rate(self, job):
+        """Chance an attempt completes: the outcome model's estimate, else the platform's history"""
+        probability = self.predictor.failure_probability(job) if self.predictor else None
+        if probability is None:
+            return self.platform_stats.success_rate(job.source.value)
+        return 1 - probability
+    
+    def expected_cost(self, job):
+        """Expected seconds an attempt takes, including the pacing delay after a success"""
+        platform = job.source.value
+        return (self.platform_stats.expected_seconds(platform)
+                + self.platform_stats.success_rate(platform) * self.pacing_seconds)
+    
+    def next_job(self):
+        """Pick the job with the best expected completions per second that still fits"""
+        if self.attempted >= self.max_applications:
+            return None
+        remaining = self.deadline - time.time() if self.deadline else None
+        
+        best_index = None
+        best_key = None
+        out_of_time = False
+        for index, job in enumerate(self._pending):
+            platform = job.source.value
+            quota = self.quotas.get(platform)
+            if quota is not None and self.attempts_by_platform[platform] >= quota:
+                continue
+            if self.breaker and self.breaker.is_open(platform):
+                continue
+            
+            cost = self.expected_cost(job)
+            if remaining is not None and cost > remaining:
+                out_of_time = True
+                continue
+            
+            # Rate first; within a platform the better-matching job goes first
+            key = (self.success_rate(job) / cost, job.skill_score or 0, -index)
+            if best_key is None or key > best_key:
+                best_index = index
+                best_key = key
+        
+        if best_index is None:
+            # The deadline counts as reached only once no remaining job fits before it
+            self.deadline_reached = out_of_time
+            return None
+        
+        job = self._pending.pop(best_index)
+        self.attempted += 1
+        self.attempts_by_platform[job.source.value] += 1
+        return job
+
+class FilterProfile:
+    """Compiled filtering and scoring criteria, shared by live runs and offline rescoring"""
+    
+    # Phrases that mark an untitled role as entry level; stated years are checked numerically
+    ENTRY_LEVEL_DESCRIPTION = [
+        'entry level', 'entry-level', 'new grad', 'junior', 
+        'associate', 'university grad', 'recent graduate'
+    ]
+    
+    # Skills for matching from resume
+    SKILLS = [
+        "python", "java", "c++", "javascript", "sql", "mysql", 
+        "embedded", "linux", "algorithms", "data structures",
+        "machine learning", "software development", "github",
+        "circuit", "vlsi", "microcontroller", "digital systems"
+    ]
+    
+    def __init__(self, exclude_keywords=None, skills=None, min_skill_matches=2, taxonomy=None,
+                 max_years=2, min_seniority=Seniority.ENTRY, max_seniority=Seniority.ENTRY,
+                 min_salary=None, remote_only=False):
+        self.exclude_keywords = [k.lower() for k in exclude_keywords or []]
+        self.skills = [s.lower() for s in skills or self.SKILLS]
+        self.min_skill_matches = min_skill_matches
+        self.taxonomy = taxonomy or Job.taxonomy
+        self._skill_mask = self.taxonomy.mask(self.skills)
+        self.max_years = max_years
+        self.min_seniority = Seniority(min_seniority)
+        self.max_seniority = Seniority(max_seniority)
+        self.min_salary = min_salary
+        self.remote_only = remote_only
+        # Changes whenever a verdict could change, so stored verdicts can be invalidated
+        self.fingerprint = hashlib.sha1(json.dumps([
+            self.exclude_keywords, self.skills, self.min_skill_matches, self.taxonomy.fingerprint,
+            self.max_years, int(self.min_seniority), int(self.max_seniority), self.min_salary,
+            self.remote_only, self.ENTRY_LEVEL_DESCRIPTION, RequirementParser.VERSION
+        ]).encode()).hexdigest()[:16]
+        self._entry_description = self._compile(self.ENTRY_LEVEL_DESCRIPTION)
+        self._exclude = self._compile(self.exclude_keywords)
+        
+    @staticmethod
+    def _compile(terms):
+        """One alternation per term list, so each check is a single scan"""
+        if not terms:
+            return None
+        return re.compile("|".join(re.escape(term.lower()) for term in terms))
+    
+    def rejects_title(self, title, location=""):
+        """Card-data stage: True when the lowercased title alone rules a posting out, whatever its description"""
+        seniority = Job.requirement_parser.title_seniority(title)
+        if seniority is not None and not (self.min_seniority <= seniority <= self.max_seniority):
+            return True
+        if self._exclude and self._exclude.search(title):
+            return True
+        return self.remote_only and Job.requirement_parser.on_site(title, location)
+    
+    def passes_requirements(self, fields):
+        """Numeric predicates on parsed requirements; unstated fields never reject"""
+        if fields.seniority is not None and not (self.min_seniority <= fields.seniority <= self.max_seniority):
+            return False
+        if self.max_years is not None and fields.min_years is not None and fields.min_years > self.max_years:
+            return False
+        if self.min_salary and fields.salary_max is not None and fields.salary_max < self.min_salary:
+            return False
+        if self.remote_only and fields.remote is False:
+            return False
+        return True
+    
+    def accepts(self, title, description, fields=None):
+        """Requirement predicates, entry-level and excluded-keyword checks for a posting"""
+        if fields is None:
+            fields = Job.requirement_parser.parse(title, description)
+        return self.accepts_lowered(title.lower(), description.lower(), fields)
+    
+    def accepts_lowered(self, title, description, fields):
+        """accepts() for text that is already lowercased, so several profiles can share the work"""
+        if not self.passes_requirements(fields):
+            return False
+        
+        # Entry level by title, by stated years, then by wording in the description
+        is_entry_level = fields.seniority is not None or (
+            fields.min_years is not None and self.max_years is not None)
+        if not is_entry_level and description:
+            is_entry_level = bool(self._entry_description.search(description))
+        if not is_entry_level:
+            return False
+        
+        # Excluded keywords
+        if self._exclude and (self._exclude.search(title) or
+                              (description and self._exclude.search(description))):
+            return False
+        return True
+    
+    def skill_score(self, skills):
+        """Number of profile skills in a posting's skill vector, or None below the minimum"""
+        skill_matches = bin(skills & self._skill_mask).count("1")
+        if skill_matches < self.min_skill_matches:
+            return None
+        return skill_matches
+    
+    def score(self, title, description, skills=None, fields=None):
+        """Skill-match score for a posting, or None when it is filtered out"""
+        if not self.accepts(title, description, fields):
+            return None
+        if skills is None:
+            skills = self.taxonomy.extract(title) | self.taxonomy.extract(description)
+        return self.skill_score(skills)
+
+class ApplicantProfile:
+    """One resume/role applied for: its filter criteria, search keywords and application budget"""
+    
+    def __init__(self, name=None, resume_path=None, keywords=(), exclude_keywords=None, skills=None,
+                 max_applications=None, requirement_filters=None, filter_profile=None):
+        self.name = name
+        self.resume_path = os.path.abspath(resume_path) if resume_path else None
+        self.keywords = list(keywords)
+        self.max_applications = max_applications
+        self.filter_profile = filter_profile or FilterProfile(exclude_keywords=exclude_keywords, skills=skills,
+                                                              **(requirement_filters or {}))
+        self.stats = {"accepted": 0, "applications_completed": 0, "applications_failed": 0}
+
+class ProfileSet:
+    """Scores each posting against every profile in one pass and hands it to the best match"""
+    
+    def __init__(self, profiles):
+        self.profiles = list(profiles)
+        self._masks = [profile.filter_profile._skill_mask for profile in self.profiles]
+        self._minimums = [profile.filter_profile.min_skill_matches for profile in self.profiles]
+        # A single profile keeps its own fingerprint, so existing ledgers stay valid
+        fingerprints = sorted(profile.filter_profile.fingerprint for profile in self.profiles)
+        self.fingerprint = (fingerprints[0] if len(fingerprints) == 1 else
+                            hashlib.sha1("|".join(fingerprints).encode()).hexdigest()[:16])
+    
+    def __len__(self):
+        return len(self.profiles)
+    
+    def __iter__(self):
+        return iter(self.profiles)
+    
+    def title_candidates(self, title, location):
+        """Indexes of the profiles whose card-data stage keeps a posting"""
+        title, location = title.lower(), location.lower()
+        return [index for index, profile in enumerate(self.profiles)
+                if not profile.filter_profile.rejects_title(title, location)]
+    
+    def best(self, job):
+        """(profile, score) of the highest-scoring profile that accepts the posting, else (None, None)"""
+        # Title stage first, so postings every profile rules out never touch their description
+        candidates = self.title_candidates(job.title, job.location)
+        if not candidates:
+            return None, None
+        
+        # Skill counts next; the text predicates only run for profiles still in contention
+        skills = job.skill_vector
+        counts = {index: bin(skills & self._masks[index]).count("1") for index in candidates}
+        candidates = [index for index in candidates if counts[index] >= self._minimums[index]]
+        if not candidates:
+            return None, None
+        
+        fields = job.requirement_fields
+        title = job.title.lower()
+        description = job.description.lower()
+        candidates.sort(key=lambda index: -counts[index])
+        for index in candidates:
+            profile = self.profiles[index]
+            if profile.filter_profile.accepts_lowered(title, description, fields):
+                return profile, counts[index]
+        return None, None
+    
+    def report(self, applied_jobs):
+        """Per-profile counts and recent applications"""
+        week_ago = _today() - 7
+        return {
+            profile.name: dict(profile.stats, recently_applied=[
+                job.summary() for job in applied_jobs
+                if job.profile == profile.name and job.date_applied is not None and job.date_applied >= week_ago
+            ])
+            for profile in self.profiles
+        }
+
+def extract_resume_text(path):
+    """Lowercased text of a PDF resume (needs PyPDF2)"""
+    import PyPDF2
+    with open(path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        text = ""
+        for page in reader.pages:
+            text += page.extract_text()
+        return text.lower()
+
+class PostingHistory:
+    """Append-only JSONL store of every posting the bot has collected"""
+    
+    # Recent URL hashes are merged into the sorted array once this many have piled up
+    MERGE_SIZE = 65536
+    
+    def __init__(self, path="postings.jsonl"):
+        self.path = path
+        # 64-bit URL hashes, 8 bytes per posting in a sorted array instead of a set of URLs
+        self._keys = None
+        self._recent = set()
+        self._pending = []
+    
+    @staticmethod
+    def _url_key(url):
+        return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "big")
+    
+    def _load_index(self):
+        if self._keys is None:
+            self._keys = array('Q')
+            for entry in self.iter_entries():
+                self._index(self._url_key(entry['url']))
+    
+    def _index(self, key):
+        self._recent.add(key)
+        if len(self._recent) >= self.MERGE_SIZE:
+            self._keys = array('Q', sorted(itertools.chain(self._keys, self._recent)))
+            self._recent = set()
+    
+    def _has(self, key):
+        if key in self._recent:
+            return True
+        index = bisect.bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+    
+    def __contains__(self, url):
+        self._load_index()
+        return self._has(self._url_key(url))
+    
+    def add(self, jobs):
+        """Queue postings not seen before; returns how many were new"""
+        self._load_index()
+        added = 0
+        for job in jobs:
+            key = self._url_key(job.url)
+            if not self._has(key):
+                self._index(key)
+                self._pending.append(job.to_dict())
+                added += 1
+        return added
+    
+    def take_pending(self):
+        """Hand over the queued postings, e.g. to append them from the writer thread"""
+        pending, self._pending = self._pending, []
+        return pending
+    
+    def append(self, entries):
+        """Append postings' JSON forms to disk in one write"""
+        if not entries:
+            return
+        with open(self.path, 'a') as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+    
+    def commit(self):
+        """Append queued postings to disk in one write"""
+        self.append(self.take_pending())
+    
+    def iter_lines(self):
+        """Stream raw JSON lines"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    yield line
+    
+    def iter_entries(self):
+        """Stream stored postings as dicts"""
+        for line in self.iter_lines():
+            yield json.loads(line)
+
+class BloomFilter:
+    """Fixed-size Bloom filter over a bytearray, saved to and loaded from a single file"""
+    
+    def __init__(self, capacity=1000000, error_rate=0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, key):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+    
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+    
+    def load(self, path):
+        with open(path, 'rb') as f:
+            bits = f.read()
+        if len(bits) == len(self.bits):
+            self.bits = bytearray(bits)
+    
+    def save(self, path):
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(self.bits)
+        os.replace(temp_path, path)
+
+class SeenLedger:
+    """Every posting URL ever filtered, with its verdict, in a dbm file fronted by a Bloom filter"""
+    
+    REJECTED = "r"
+    ACCEPTED = "a"
+    DUPLICATE = "d"
+    # Rejected without its description having loaded; tried again next run
+    UNJUDGED = "u"
+    
+    def __init__(self, directory="seen_ledger", profile_fingerprint="", capacity=1000000):
+        self.directory = directory
+        self.profile_fingerprint = profile_fingerprint
+        self.capacity = capacity
+        self._db = None
+        self._bloom = None
+        self._dirty = False
+    
+    def _open(self):
+        if self._db is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        meta_path = os.path.join(self.directory, "meta.json")
+        bloom_path = os.path.join(self.directory, "bloom.bin")
+        db_path = os.path.join(self.directory, "verdicts")
+        
+        meta = {}
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+        self._bloom = BloomFilter(self.capacity)
+        if meta.get("profile") == self.profile_fingerprint and os.path.exists(bloom_path):
+            self._db = dbm.open(db_path, 'c')
+            self._bloom.load(bloom_path)
+        else:
+            # Verdicts from another filter profile no longer hold
+            if meta:
+                logger.info("Filter profile changed - clearing the seen-postings ledger")
+            self._db = dbm.open(db_path, 'n')
+            self._dirty = True
+        with open(meta_path, 'w') as f:
+            json.dump({"profile": self.profile_fingerprint}, f)
+    
+    def verdict(self, url):
+        """Stored verdict for a URL, or None if it was never filtered"""
+        self._open()
+        if url not in self._bloom:
+            return None
+        value = self._db.get(url)
+        return value.decode() if value is not None else None
+    
+    def is_rejected(self, url):
+        return self.verdict(url) == self.REJECTED
+    
+    def record(self, url, verdict):
+        self._open()
+        self._db[url] = verdict
+        self._bloom.add(url)
+        self._dirty = True
+    
+    def commit(self):
+        """Write the Bloom filter next to the dbm file"""
+        if self._db is None or not self._dirty:
+            return
+        if hasattr(self._db, "sync"):
+            self._db.sync()
+        self._bloom.save(os.path.join(self.directory, "bloom.bin"))
+        self._dirty = False
+    
+    def close(self):
+        if self._db is None:
+            return
+        self.commit()
+        self._db.close()
+        self._db = None
+
+# Per-process state for rescoring workers
+_rescore_state = {}
+
+def _init_rescore_worker(profiles, description_dir):
+    """Give each worker the compiled profiles and its own view of the description store"""
+    # The parent's log queue has no listener in this process
+    logging.getLogger().handlers = [logging.StreamHandler()]
+    _rescore_state["profiles"] = profiles
+    _rescore_state["descriptions"] = DescriptionStore(description_dir)
+
+def _rescore_chunk(start, lines):
+    """Score a shard of history lines; returns (line index, score, profile name) for accepted postings"""
+    profiles = _rescore_state["profiles"]
+    descriptions = _rescore_state["descriptions"]
+    results = []
+    for offset, line in enumerate(lines):
+        entry = json.loads(line)
+        # Stored requirement fields and the title stage can rule a posting out for every
+        # profile before its description is loaded
+        fields = Requirements.from_dict(entry.get('requirements'))
+        title = entry['title'].lower()
+        location = (entry.get('location') or "").lower()
+        candidates = [(name, profile) for name, profile in profiles
+                      if (fields is None or profile.passes_requirements(fields))
+                      and not profile.rejects_title(title, location)]
+        if not candidates:
+            continue
+        description = entry.get('description') or descriptions.get(entry.get('description_hash'))
+        if fields is None:
+            fields = Job.requirement_parser.parse(entry['title'], description, entry.get('location', ""))
+        
+        # Best-scoring profile wins, ties going to the earlier one as in a live run
+        best = None
+        for name, profile in candidates:
+            skills = None
+            if entry.get('skills') and entry.get('taxonomy') == profile.taxonomy.fingerprint:
+                skills = int(entry['skills'], 16)
+            score = profile.score(entry['title'], description, skills, fields)
+            if score is not None and (best is None or score > best[0]):
+                best = (score, name)
+        if best is not None:
+            results.append((start + offset, *best))
+    return results
+
+class AnalyticsExporter:
+    """Appends per-run postings, applications, skill hits and stats as partitioned Parquet files"""
+    
+    def __init__(self, directory="analytics", taxonomy=None):
+        self.directory = directory
+        self.taxonomy = taxonomy or Job.taxonomy
+        
+    def _write(self, pa, pq, table_name, rows, schema, run_id, run_date):
+        """Write one run's rows into a hive-style run_date partition"""
+        if not rows:
+            return None
+        partition = os.path.join(self.directory, table_name, f"run_date={run_date}")
+        os.makedirs(partition, exist_ok=True)
+        path = os.path.join(partition, f"{run_id}.parquet")
+        pq.write_table(pa.Table.from_pylist(rows, schema=schema), path, compression="zstd")
+        return path
+    
+    def export_run(self, run_id, postings, applications, stats):
+        """Export one run; returns the written paths, or None when pyarrow is unavailable"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.warning("Install pyarrow to enable the analytics export")
+            return None
+        
+        run_date = datetime.now().strftime('%Y-%m-%d')
+        
+        posting_schema = pa.schema([
+            ("run_id", pa.string()), ("job_id", pa.string()), ("url", pa.string()),
+            ("title", pa.string()), ("company", pa.string()), ("source", pa.string()),
+            ("location", pa.string()), ("date_found", pa.date32()), ("skill_score", pa.int32()),
+            ("simhash", pa.uint64()), ("description_hash", pa.string())
+        ])
+        posting_rows = [{
+            "run_id": run_id,
+            "job_id": job.job_id,
+            "url": job.url,
+            "title": job.title,
+            "company": job.company,
+            "source": job.source.value,
+            "location": job.location,
+            "date_found": date.fromordinal(job.date_found),
+            "skill_score": job.skill_score,
+            "simhash": job.simhash,
+            "description_hash": job.description_key
+        } for job in postings]
+        
+        application_schema = pa.schema([
+            ("run_id", pa.string()), ("job_id", pa.string()), ("source", pa.string()),
+            ("company", pa.string()), ("title", pa.string()), ("status", pa.string()),
+            ("skill_score", pa.int32()), ("date_applied", pa.date32())
+        ])
+        application_rows = [{
+            "run_id": run_id,
+            "job_id": job.job_id,
+            "source": job.source.value,
+            "company": job.company,
+            "title": job.title,
+            "status": job.status.value,
+            "skill_score": job.skill_score,
+            "date_applied": date.fromordinal(job.date_applied) if job.date_applied else None
+        } for job in applications]
+        
+        # One boolean column per skill, one row per posting, read from the stored vectors
+        skills = self.taxonomy.skills
+        skill_schema = pa.schema([("run_id", pa.string()), ("job_id", pa.string())] +
+                                 [(skill, pa.bool_()) for skill in skills])
+        skill_rows = []
+        for job in postings:
+            vector = job.skill_vector
+            row = {"run_id": run_id, "job_id": job.job_id}
+            row.update((skill, bool(vector >> index & 1)) for index, skill in enumerate(skills))
+            skill_rows.append(row)
+        
+        stats_schema = pa.schema([("run_id", pa.string()), ("timestamp", pa.timestamp("s"))] +
+                                 [(name, pa.int64()) for name in stats])
+        stats_row = dict(stats, run_id=run_id, timestamp=datetime.now())
+        
+        paths = [
+            self._write(pa, pq, "postings", posting_rows, posting_schema, run_id, run_date),
+            self._write(pa, pq, "applications", application_rows, application_schema, run_id, run_date),
+            self._write(pa, pq, "skill_hits", skill_rows, skill_schema, run_id, run_date),
+            self._write(pa, pq, "run_stats", [stats_row], stats_schema, run_id, run_date)
+        ]
+        paths = [path for path in paths if path]
+        logger.info("Analytics export written: %s files under %s/", len(paths), self.directory)
+        return paths
+
+class PhaseProfiler:
+    """cProfile and tracemalloc around named run phases, written to a run directory at the end"""
+    
+    def __init__(self, directory="profiles", enabled=True, top_allocations=15, frames=1):
+        self.enabled = enabled
+        self.directory = os.path.join(directory, datetime.now().strftime('%Y%m%d_%H%M%S'))
+        self.top_allocations = top_allocations
+        self.frames = frames
+        self.phases = {}
+        self._stats = {}
+        self._active = None
+        self._baseline = None
+    
+    def start(self):
+        if not self.enabled:
+            return self
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self._baseline = self._snapshot()
+        return self
+    
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, pstats.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")
+        ])
+    
+    @contextmanager
+    def phase(self, name):
+        """Profile the block; nested phases count towards the outer one (one profiler per thread)"""
+        if not self.enabled or self._active is not None:
+            yield
+            return
+        
+        self._active = name
+        profile = cProfile.Profile()
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        started, cpu_started = time.perf_counter(), time.process_time()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            wall, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+            memory_after, peak = tracemalloc.get_traced_memory()
+            self._active = None
+            self._record(name, profile, wall, cpu, memory_after - memory_before, peak - memory_before)
+    
+    def _record(self, name, profile, wall, cpu, retained, peak):
+        entry = self.phases.setdefault(name, {
+            "calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "retained_kb": 0.0, "peak_kb": 0.0
+        })
+        entry["calls"] += 1
+        entry["wall_seconds"] += wall
+        entry["cpu_seconds"] += cpu
+        entry["retained_kb"] += retained / 1024
+        
+        if name in self._stats:
+            self._stats[name].add(profile)
+        else:
+            self._stats[name] = pstats.Stats(profile)
+        
+        # Allocation sites only when a phase sets a new peak, so snapshots stay rare
+        if peak / 1024 > entry["peak_kb"]:
+            entry["peak_kb"] = peak / 1024
+            growth = self._snapshot().compare_to(self._baseline, "lineno")[:self.top_allocations]
+            entry["top_allocations"] = [
+                {"site": str(stat.traceback), "size_kb": round(stat.size / 1024, 1),
+                 "growth_kb": round(stat.size_diff / 1024, 1), "count": stat.count}
+                for stat in growth
+            ]
+    
+    def finish(self):
+        """Write one pstats file per phase and summary.json; returns the run directory"""
+        if not self.enabled:
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        for name, stats in self._stats.items():
+            filename = re.sub(r'[^\w.-]', '_', name) + ".pstats"
+            stats.dump_stats(os.path.join(self.directory, filename))
+        
+        current, peak = tracemalloc.get_traced_memory()
+        summary = {
+            "process_peak_kb": round(peak / 1024, 1),
+            "phases": {name: {key: round(value, 3) if isinstance(value, float) else value
+                              for key, value in entry.items()}
+                       for name, entry in self.phases.items()}
+        }
+        with open(os.path.join(self.directory, "summary.json"), 'w') as f:
+            json.dump(summary, f, indent=2)
+        tracemalloc.stop()
+        
+        slowest = sorted(self.phases.items(), key=lambda item: -item[1]["cpu_seconds"])[:3]
+        logger.info("Profile written to %s (most CPU: %s)", self.directory,
+                    ", ".join(f"{name} {entry['cpu_seconds']:.2f}s" for name, entry in slowest))
+        return self.directory
+
+class BackgroundWorkers:
+    """Parsing/scoring threads plus a single in-order disk writer, keeping work off the driver thread"""
+    
+    def __init__(self, workers=2, queue_size=32):
+        # Bounded queues block the browser loop instead of letting work pile up
+        self._tasks = queue.Queue(maxsize=queue_size)
+        self._writes = queue.Queue(maxsize=queue_size)
+        self._threads = [threading.Thread(target=self._run, args=(self._tasks,),
+                                          name=f"bot-worker-{index}", daemon=True)
+                         for index in range(workers)]
+        self._threads.append(threading.Thread(target=self._run, args=(self._writes,),
+                                              name="bot-writer", daemon=True))
+        self._closed = False
+        for thread in self._threads:
+            thread.start()
+    
+    @staticmethod
+    def _run(tasks):
+        while True:
+            item = tasks.get()
+            try:
+                if item is None:
+                    return
+                future, after, fn, args = item
+                try:
+                    # A write waits for the work it depends on, keeping the writer in order
+                    if after is not None:
+                        after.result()
+                    future.set_result(fn(*args))
+                except Exception as e:
+                    logger.error("Background task %s failed: %s", fn.__name__, e)
+                    future.set_exception(e)
+            finally:
+                tasks.task_done()
+    
+    def submit(self, fn, *args):
+        """Queue CPU work on the pool; returns a Future"""
+        future = Future()
+        self._tasks.put((future, None, self._in_context(fn), args))
+        return future
+    
+    def write(self, fn, *args, after=None):
+        """Queue a write for the serial writer, optionally after another Future completes"""
+        future = Future()
+        self._writes.put((future, after, self._in_context(fn), args))
+        return future
+    
+    @staticmethod
+    def _in_context(fn):
+        """Run fn with the submitter's log context, so its records keep the platform and job id"""
+        context = contextvars.copy_context()
+        def run(*args):
+            return context.run(fn, *args)
+        run.__name__ = fn.__name__
+        return run
+    
+    def drain(self):
+        """Wait until everything queued so far has finished"""
+        self._tasks.join()
+        self._writes.join()
+    
+    def close(self):
+        """Finish queued work and stop the threads"""
+        if self._closed:
+            return
+        self._closed = True
+        self.drain()
+        for thread in self._threads:
+            (self._writes if thread.name == "bot-writer" else self._tasks).put(None)
+        for thread in self._threads:
+            thread.join()
+
+class FailureArtifacts:
+    """Screenshots and compressed page sources of failed applications, stored once per distinct DOM"""
+    
+    # Digit runs (ids, timestamps, tokens) vary between otherwise identical failure pages
+    _VOLATILE = re.compile(r"\d+")
+    
+    def __init__(self, workers, directory="error_artifacts", max_mb=200, max_age_days=14):
+        self.workers = workers
+        self.directory = directory
+        self.max_bytes = max_mb * 1024 * 1024
+        self.max_age_days = max_age_days
+        self.index_path = os.path.join(directory, "index.jsonl")
+    
+    def capture(self, driver, job, error):
+        """Grab the failure state of the page and queue it for writing"""
+        try:
+            screenshot = driver.get_screenshot_as_base64()
+            source = driver.page_source
+            url = driver.current_url
+        except Exception as e:
+            logger.warning("Could not capture failure artifacts: %s", e)
+            return None
+        return self.workers.write(self._store, job.job_id, job.url, url, str(error), screenshot, source)
+    
+    def _store(self, job_id, job_url, page_url, error, screenshot, source):
+        dom_hash = hashlib.sha1(self._VOLATILE.sub("0", source or "").encode()).hexdigest()[:16]
+        artifact_dir = os.path.join(self.directory, dom_hash)
+        is_new = not os.path.isdir(artifact_dir)
+        if is_new:
+            os.makedirs(artifact_dir)
+            if screenshot:
+                with open(os.path.join(artifact_dir, "screenshot.png"), 'wb') as f:
+                    f.write(base64.b64decode(screenshot))
+            with gzip.open(os.path.join(artifact_dir, "dom.html.gz"), 'wt', encoding="utf-8") as f:
+                f.write(source or "")
+        else:
+            # Refresh the age of a failure that keeps happening
+            os.utime(artifact_dir)
+        
+        # The job id matches the posting's id in the history store and the analytics export
+        with open(self.index_path, 'a') as f:
+            f.write(json.dumps({
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "job_id": job_id,
+                "job_url": job_url,
+                "page_url": page_url,
+                "error": error,
+                "artifact": dom_hash,
+                "duplicate": not is_new
+            }) + "\n")
+        
+        if is_new:
+            logger.info("Failure artifacts saved to %s", artifact_dir)
+            self._enforce_retention()
+        return dom_hash
+    
+    def _enforce_retention(self):
+        """Drop artifacts past the age limit, then the oldest until the size limit holds"""
+        cutoff = time.time() - self.max_age_days * 86400
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_dir():
+                continue
+            modified = entry.stat().st_mtime
+            if modified < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                continue
+            size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+            entries.append((modified, size, entry.path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+        
+        self._prune_index(cutoff)
+    
+    def _prune_index(self, cutoff):
+        """Keep only index entries within the age limit whose artifacts are still on disk"""
+        if not os.path.exists(self.index_path):
+            return
+        present = {}
+        kept = []
+        with open(self.index_path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    recent = datetime.fromisoformat(entry["time"]).timestamp() >= cutoff
+                    artifact = entry["artifact"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if artifact not in present:
+                    present[artifact] = os.path.isdir(os.path.join(self.directory, artifact))
+                if recent and present[artifact]:
+                    kept.append(line)
+        
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, 'w') as f:
+            f.writelines(kept)
+        os.replace(temp_path, self.index_path)
+    
+    def enforce_retention(self):
+        """Queue a retention pass, e.g. at startup"""
+        if os.path.isdir(self.directory):
+            self.workers.write(self._enforce_retention)
+
+class JobApplicationBot:
+    """Main bot class for searching and applying to jobs"""
+    
+    def __init__(self, email, resume_path, keywords, locations, exclude_keywords=None, headless=False,
+                 browser_daemon=None, record_path=None, replay_path=None, platform_quotas=None,
+                 time_limit_minutes=None, requirement_filters=None, background_workers=2,
+                 failure_artifacts=None, circuit_breaker=None, retry_policy=None, platforms=None,
+                 profiles=None, profiler=None, outcome_model=None, browser_watchdog=None,
+                 resource_policy=None):
+        self.email = email
+        self.resume_path = os.path.abspath(resume_path)
+        self.keywords = keywords
+        self.locations = locations
+        self.exclude_keywords = exclude_keywords or []
+        
+        # Only the enabled platforms' adapters are loaded; saved postings may come from any of them
+        self.adapters = load_adapters(**(platforms or {}))
+        self.job_boards = {name: adapter.board() for name, adapter in self.adapters.items()}
+        self.applied_jobs = self._load_applied_jobs()
+        
+        # Initialize managers
+        self.credential_manager = CredentialManager()
+        self.browser_manager = BrowserManager(headless=headless, daemon=browser_daemon,
+                                              watchdog=BrowserWatchdog(**(browser_watchdog or {})),
+                                              resource_policy=ResourcePolicy(**(resource_policy or {})))
+        self.auth_manager = AuthenticationManager(self.credential_manager, self.browser_manager, self.adapters)
+        self.driver = None
+        self.captcha_solver = None
+        
+        # Record/replay of browser sessions
+        self.record_path = record_path
+        self.replay_path = replay_path
+        self.persist_history = True
+        
+        # Scale factors for pacing delays and element waits (0 for offline replay)
+        self.pace_scale = 0 if replay_path else 1
+        self.wait_scale = 0 if replay_path else 1
+        
+        # Resume text for matching
+        self.resume_text = self._extract_resume_text()
+        
+        # Filtering criteria and the store of every posting seen
+        self.filter_profile = FilterProfile(exclude_keywords=self.exclude_keywords,
+                                            **(requirement_filters or {}))
+        self.profiles = self._build_profiles(profiles or [], requirement_filters)
+        # Job id -> the profile its posting was queued for in this run
+        self.assigned_profiles = {}
+        self.history = PostingHistory()
+        self.seen_ledger = SeenLedger(profile_fingerprint=self.profiles.fingerprint)
+        
+        # Per-phase CPU and memory profiling (--profile or a sampled share of runs)
+        self.profiler = profiler or PhaseProfiler(enabled=False)
+        
+        # Parsing, scoring and disk writes run beside the browser loop
+        self.workers = BackgroundWorkers(workers=background_workers)
+        self.failure_artifacts = FailureArtifacts(self.workers, **(failure_artifacts or {}))
+        
+        # Application scheduling
+        self.platform_quotas = platform_quotas or {}
+        self.deadline = time.time() + time_limit_minutes * 60 if time_limit_minutes else None
+        self.platform_stats = PlatformStats()
+        
+        # Outcomes of every attempt, and a model of which postings are not worth attempting
+        self.outcomes = OutcomePredictor(**(outcome_model or {}))
+        self.attempt = {"steps": 0, "reason": None}
+        
+        # Give up on failing platforms; retry transient errors a bounded number of times
+        self.breaker = CircuitBreaker(**(circuit_breaker or {}))
+        self.retry_policy = {"attempts": 3, "backoff_seconds": 5, "max_backoff_seconds": 60}
+        self.retry_policy.update(retry_policy or {})
+        
+        # Near-duplicate detection against history and within a run
+        self.duplicate_index = NearDuplicateIndex()
+        for job in self.applied_jobs:
+            self.duplicate_index.add(job, permanent=True)
+        self.duplicate_clusters = {}
+        
+        # Postings and application attempts of this run, for the analytics export
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.run_postings = []
+        # Postings returned from search without their description (rejected on title alone)
+        self.title_rejected = set()
+        # Postings whose description failed to load or timed out
+        self.unloaded_descriptions = set()
+        self.run_applications = []
+        
+        # Matching postings that only take applications on the employer's site
+        self.manual_follow_up = []
+        
+        # Stats tracking
+        self.stats = {
+            "jobs_found": 0,
+            "jobs_filtered": 0,
+            "duplicates_skipped": 0,
+            "known_rejects_skipped": 0,
+            "title_prefiltered": 0,
+            "predicted_failures_skipped": 0,
+            "manual_follow_up": 0,
+            "applications_attempted": 0,
+            "applications_completed": 0,
+            "applications_failed": 0
+        }
+    
+    def _extract_resume_text(self):
+        """Extract text from resume for matching purposes"""
+        # For PDF resume
+        try:
+            return extract_resume_text(self.resume_path)
+        except Exception as e:
+            logger.error("Error extracting text from resume: %s", e)
+            logger.warning("Using basic resume text extraction. Install PyPDF2 for better results.")
+            # Fallback to provided resume text
+            return """computer engineer python java c++ software developer embedded systems
+                      mathematics physics flask arduino machine learning sql mysql database
+                      raspberrypi linux github digital systems data structures algorithms
+                      vlsi transistors circuits microcontroller programming entry level new grad"""
+    
+    def _build_profiles(self, profiles, requirement_filters):
+        """One search pass feeds every profile; without any, the bot's own criteria form the only one"""
+        if not profiles:
+            return ProfileSet([ApplicantProfile(resume_path=self.resume_path, keywords=self.keywords,
+                                                filter_profile=self.filter_profile)])
+        
+        names = [entry.get("name") for entry in profiles]
+        if not all(isinstance(name, str) and name.strip() for name in names):
+            raise ValueError("Every entry in profiles needs a name")
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate profile names: {', '.join(duplicates)}")
+        
+        built = []
+        for entry in profiles:
+            entry = dict(entry)
+            entry.setdefault("keywords", self.keywords)
+            entry.setdefault("exclude_keywords", self.exclude_keywords)
+            entry.setdefault("requirement_filters", requirement_filters)
+            # Match on the skills in the profile's own resume unless they are listed
+            if not entry.get("skills") and entry.get("resume_path"):
+                try:
+                    vector = Job.taxonomy.extract(extract_resume_text(entry["resume_path"]))
+                    entry["skills"] = Job.taxonomy.names(vector) or None
+                except Exception as e:
+                    logger.warning("Could not read resume for profile %s, using default skills: %s",
+                                   entry.get("name"), e)
+            built.append(ApplicantProfile(**entry))
+        
+        # Search each keyword once for all profiles
+        self.keywords = list(dict.fromkeys(k for profile in built for k in profile.keywords))
+        return ProfileSet(built)
+    
+    def _load_applied_jobs(self):
+        """Load previously applied jobs from JSON file"""
+        if os.path.exists('applied_jobs.json'):
+            with open('applied_jobs.json', 'r') as f:
+                return [Job.from_dict(entry) for entry in json.load(f)]
+        return []
+    
+    def _save_applied_jobs(self):
+        """Save applied jobs to JSON file on the background writer"""
+        if not self.persist_history:
+            return
+        self.workers.write(self._write_applied_jobs, [job.to_dict() for job in self.applied_jobs])
+    
+    @staticmethod
+    def _write_applied_jobs(entries):
+        with open('applied_jobs.json', 'w') as f:
+            json.dump(entries, f)
+    
+    def initialize(self):
+        """Initialize browser and authenticate with job platforms"""
+        if self.replay_path:
+            return self._initialize_replay()
+        
+        self.failure_artifacts.enforce_retention()
+        self.driver = self.browser_manager.start_browser()
+        if self.record_path:
+            self.driver = RecordingDriver(self.driver, self.record_path)
+            # Replays start from the same history so filtering takes the same path
+            self.driver.metadata["applied_jobs"] = [job.to_dict() for job in self.applied_jobs]
+        self.captcha_solver = CaptchaSolver(self.driver)
+        
+        # Store authentication results
+        auth_results = {}
+        
+        for platform in self.job_boards.keys():
+            auth_success = self.auth_manager.authenticate(platform)
+            auth_results[platform] = auth_success
+            
+            if not auth_success:
+                logger.warning("Authentication failed for %s. Some features might be limited.", platform)
+        
+        if self.record_path:
+            self.driver.metadata["auth_status"] = auth_results
+            
+        # Return authentication status
+        return auth_results
+    
+    def _initialize_replay(self):
+        """Set up an offline run against a recorded session"""
+        self.driver = FakeDriver.load(self.replay_path)
+        self.captcha_solver = CaptchaSolver(self.driver)
+        
+        # Start from the recorded history and leave the real one untouched
+        self.applied_jobs = [Job.from_dict(entry) for entry in self.driver.metadata.get("applied_jobs", [])]
+        self.persist_history = False
+        
+        auth_results = self.driver.metadata.get("auth_status", {})
+        self.auth_manager.auth_status.update(auth_results)
+        logger.info("Replaying %s recorded browser events from %s",
+                    len(self.driver.events), self.replay_path)
+        return auth_results
+    
+    def _wait(self, timeout):
+        """Create an element wait, scaled for offline runs"""
+        return WebDriverWait(self.driver, timeout * self.wait_scale)
+    
+    def _pause(self, low, high=None):
+        """Sleep for a fixed or random duration, scaled for offline runs"""
+        duration = low if high is None else random.uniform(low, high)
+        if self.pace_scale:
+            time.sleep(duration * self.pace_scale)
+    
+    def search_jobs(self, days=7):
+        """Search for jobs across multiple job boards"""
+        all_jobs = []
+        
+        for board_name, board_info in self.job_boards.items():
+            with log_context(phase="search", platform=board_name):
+                # Skip platforms we couldn't authenticate with
+                if not self.auth_manager.auth_status[board_name]:
+                    logger.warning("Skipping job search on %s due to authentication failure", board_name)
+                    continue
+                    
+                logger.info("Searching jobs on %s...", board_name)
+                
+                for keyword in self.keywords:
+                    for location in self.locations:
+                        if self._past_deadline() or self.breaker.is_open(board_name):
+                            break
+                        
+                        try:
+                            with self.profiler.phase(f"search.{board_name}"):
+                                jobs = self._with_retries(self._search_platform, board_name, keyword, location)
+                            all_jobs.extend(jobs)
+                            self.breaker.record(board_name, True)
+                            
+                            # Parse and persist in the background while the browser moves on; postings
+                            # rejected on title alone have no description to extract from or keep
+                            described = [job for job in jobs if job.job_id not in self.title_rejected]
+                            extracted = self.workers.submit(self._extract_fields, described)
+                            if self.persist_history:
+                                self.workers.write(self._persist_postings, described, after=extracted)
+                            
+                            # Randomized delay between searches (3-7 seconds)
+                            self._pause(3, 7)
+                            
+                        except Exception as e:
+                            logger.error("Error searching %s for %s in %s: %s", board_name, keyword, location, e)
+                            self.breaker.record(board_name, False)
+        
+        if self._past_deadline():
+            logger.warning("Run deadline reached - search stopped early")
+        
+        self.stats["jobs_found"] = len(all_jobs)
+        self.run_postings = [job for job in all_jobs if job.job_id not in self.title_rejected]
+        self.workers.drain()
+        
+        # Filter jobs
+        with self.profiler.phase("filter"):
+            filtered_jobs = self._filter_jobs(all_jobs)
+        self.stats["jobs_filtered"] = len(filtered_jobs)
+        self.stats["manual_follow_up"] = len(self.manual_follow_up)
+        if self.persist_history:
+            self.seen_ledger.commit()
+        
+        logger.info("Found %s jobs, filtered to %s relevant positions (%s known rejects skipped, "
+                    "%s rejected on title alone)", len(all_jobs), len(filtered_jobs),
+                    self.stats['known_rejects_skipped'], self.stats['title_prefiltered'])
+        return filtered_jobs
+    
+    # Errors worth another try: re-rendered elements and dropped connections. A timeout waiting
+    # for results means changed markup, which another try will not fix
+    TRANSIENT_ERRORS = (StaleElementReferenceException, ConnectionError)
+    
+    @classmethod
+    def _is_transient(cls, error):
+        if isinstance(error, cls.TRANSIENT_ERRORS):
+            return True
+        # Chrome reports failed page loads (reset, refused, DNS) as net::ERR_ errors
+        return isinstance(error, WebDriverException) and "net::ERR_" in (error.msg or "")
+    
+    def _with_retries(self, fn, *args):
+        """Call fn, retrying transient errors with exponential backoff"""
+        attempts = max(1, self.retry_policy["attempts"])
+        for attempt in range(1, attempts + 1):
+            try:
+                return fn(*args)
+            except Exception as e:
+                if attempt == attempts or not self._is_transient(e):
+                    raise
+                delay = min(self.retry_policy["backoff_seconds"] * 2 ** (attempt - 1),
+                            self.retry_policy["max_backoff_seconds"])
+                logger.warning("Transient %s in %s, retry %s of %s in about %.0fs",
+                               e.__class__.__name__, fn.__name__, attempt, attempts - 1, delay)
+                self._pause(delay, delay * 1.5)
+    
+    def _title_rejected(self, job):
+        """Card-data filter stage: True when no profile can accept the posting, whatever its description"""
+        if self.profiles.title_candidates(job.title, job.location):
+            return False
+        self.stats["title_prefiltered"] += 1
+        self.title_rejected.add(job.job_id)
+        return True
+    
+    def _description_failed(self, job):
+        """Note a posting whose description did not load, so a rejection of it is not remembered"""
+        self.unloaded_descriptions.add(job.job_id)
+    
+    def _known_reject(self, url):
+        """True for postings the current profile already rejected on an earlier run"""
+        if not self.persist_history or not self.seen_ledger.is_rejected(url):
+            return False
+        self.stats["known_rejects_skipped"] += 1
+        return True
+    
+    def _search_platform(self, platform, keyword, location):
+        """Search for jobs on a specific platform"""
+        self.browser_manager.use_page_type("search")
+        jobs = self.adapters[platform].search(self, self.job_boards[platform], keyword, location)
+        
+        # Check for and handle captchas
+        if self.captcha_solver.detect_captcha():
+            self.captcha_solver.handle_captcha()
+        
+        return jobs
+    
+    def _extract_fields(self, jobs):
+        """Extraction stage: give each posting its stored skill vector and requirement fields"""
+        for job in jobs:
+            job.skill_vector
+            job.requirement_fields
+    
+    def _persist_postings(self, jobs):
+        """Keep every posting for offline rescoring"""
+        self.history.add(jobs)
+        self.history.commit()
+    
+    def _filter_jobs(self, jobs):
+        """Filter jobs based on criteria and previously applied jobs"""
+        filtered_jobs = []
+        verdicts = []
+        
+        for job in jobs:
+            # Skill matches (at least 2), requirement predicates, entry level and excluded keywords,
+            # for every profile at once; the posting goes to the best-scoring profile
+            profile, score = self.profiles.best(job)
+            if score is None:
+                # Only a judgement on the title or a loaded description is worth remembering
+                verdict = SeenLedger.UNJUDGED if job.job_id in self.unloaded_descriptions else SeenLedger.REJECTED
+                verdicts.append((job.url, verdict))
+                continue
             
-        except Exception as e:
-            logger.error(f"Error filling Indeed form: {str(e)}")
-    
-    def _apply_glassdoor(self, job):
-        """Apply for a job on Glassdoor"""
-        try:
-            # Navigate to job page
-            self.driver.get(job['url'])
+            # Skip if already applied or already seen as the same role elsewhere
+            original = self.duplicate_index.find_duplicate(job)
+            if original:
+                if original.url != job.url:
+                    self._record_duplicate(original, job)
+                verdicts.append((job.url, SeenLedger.DUPLICATE))
+                continue
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobDetails"))
-            )
+            job.skill_score = score
+            job.profile = profile.name
+            self.assigned_profiles[job.job_id] = profile
+            profile.stats["accepted"] += 1
+            self.duplicate_index.add(job)
+            verdicts.append((job.url, SeenLedger.ACCEPTED))
             
-            # Find and click Apply button
-            try:
-                apply_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button.applyButton"))
-                )
-                apply_button.click()
-                
-                # Wait for application options
-                time.sleep(3)
-                
-                # Check if there's an "Easy Apply" option vs. external apply
-                try:
-                    easy_apply = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "button.easyApply"))
-                    )
-                    easy_apply.click()
-                    
-                    # Process Glassdoor Easy Apply
-                    return self._process_glassdoor_easy_apply()
-                    
-                except TimeoutException:
-                    # No Easy Apply, likely external application
-                    logger.info(f"External application for {job['title']} on Glassdoor - skipping")
-                    return False
-                
-            except TimeoutException:
-                logger.error(f"Apply button not found for {job['title']} on Glassdoor")
-                return False
+            # External applications are listed for a human instead of being navigated to
+            if job.apply_type == ApplyType.EXTERNAL:
+                self.manual_follow_up.append(job)
+                continue
+            filtered_jobs.append(job)
+        
+        # Remember verdicts so later runs skip known rejects before loading their descriptions
+        if self.persist_history:
+            for url, verdict in verdicts:
+                self.seen_ledger.record(url, verdict)
             
-        except Exception as e:
-            logger.error(f"Error during Glassdoor application: {str(e)}")
-            return False
+        # Sort by skill match score (highest first)
+        filtered_jobs.sort(key=lambda x: x.skill_score or 0, reverse=True)
+        
+        return filtered_jobs
     
-    def _process_glassdoor_easy_apply(self):
-        """Process Glassdoor Easy Apply application flow"""
-        try:
-            # Glassdoor Easy Apply typically has a multi-step form
+    def rescore_history(self, workers=None, chunk_size=2000, output_path="rankings.json"):
+        """Re-rank every stored posting against the current profiles on a process pool"""
+        workers = workers or os.cpu_count() or 1
+        applied_urls = {job.url for job in self.applied_jobs}
+        started = time.time()
+        
+        scores = []
+        total = 0
+        lines_iter = self.history.iter_lines()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_rescore_worker,
+                                 initargs=([(profile.name, profile.filter_profile) for profile in self.profiles],
+                                           Job.descriptions.directory)) as executor:
+            in_flight = set()
             while True:
-                # Fill current form
-                self._fill_glassdoor_form()
+                # Keep a bounded number of shards queued so memory stays flat
+                while len(in_flight) < workers * 2:
+                    chunk = list(itertools.islice(lines_iter, chunk_size))
+                    if not chunk:
+                        break
+                    in_flight.add(executor.submit(_rescore_chunk, total, chunk))
+                    total += len(chunk)
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    scores.extend(future.result())
+        
+        accepted = {index: (score, profile) for index, score, profile in scores}
+        
+        rankings = []
+        for index, entry in enumerate(self.history.iter_entries()):
+            if index in accepted and entry['url'] not in applied_urls:
+                score, profile = accepted[index]
+                ranking = {
+                    'title': entry['title'],
+                    'company': entry['company'],
+                    'source': entry['source'],
+                    'url': entry['url'],
+                    'skill_score': score
+                }
+                if profile is not None:
+                    ranking['profile'] = profile
+                rankings.append(ranking)
+        # Deterministic merge: best score first, ties keep history order
+        rankings.sort(key=lambda item: -item['skill_score'])
+        
+        with open(output_path, 'w') as f:
+            json.dump(rankings, f, indent=2)
+        
+        logger.info("Rescored %s postings with %s workers in %.1fs: %s ranked to %s",
+                    total, workers, time.time() - started, len(rankings), output_path)
+        return rankings
+    
+    def _record_duplicate(self, original, job):
+        """Track a near-duplicate posting under the one that was kept"""
+        cluster = self.duplicate_clusters.setdefault(original.url, {
+            "kept": original.summary(),
+            "duplicates": []
+        })
+        cluster["duplicates"].append(job.summary())
+        self.stats["duplicates_skipped"] += 1
+    
+    def _past_deadline(self):
+        return self.deadline is not None and time.time() >= self.deadline
+    
+    def apply_for_profiles(self, jobs, max_applications=10):
+        """Work through each profile's queue with its own resume and application budget"""
+        if len(self.profiles) == 1:
+            return self.apply_for_jobs(jobs, max_applications=max_applications)
+        
+        applied_count = failed_count = 0
+        default_resume = self.resume_path
+        try:
+            for profile in self.profiles:
+                queue = [job for job in jobs if self.assigned_profiles.get(job.job_id) is profile]
+                if not queue or self._past_deadline():
+                    continue
+                self.resume_path = profile.resume_path or default_resume
+                with log_context(profile=profile.name):
+                    logger.info("Applying for profile %s: %s queued", profile.name, len(queue))
+                    applied, failed = self.apply_for_jobs(
+                        queue, max_applications=profile.max_applications or max_applications
+                    )
+                profile.stats["applications_completed"] += applied
+                profile.stats["applications_failed"] += failed
+                applied_count += applied
+                failed_count += failed
+        finally:
+            self.resume_path = default_resume
+        return applied_count, failed_count
+    
+    def apply_for_jobs(self, jobs, max_applications=10):
+        """Apply for filtered jobs with rate limiting"""
+        applied_count = 0
+        failed_count = 0
+        
+        # Jobs known to apply off-platform go to the follow-up list without a visit
+        external = [job for job in jobs if job.apply_type == ApplyType.EXTERNAL]
+        if external:
+            self.manual_follow_up.extend(external)
+            self.stats["manual_follow_up"] = len(self.manual_follow_up)
+            jobs = [job for job in jobs if job.apply_type != ApplyType.EXTERNAL]
+        
+        # Order by expected completions per hour within the budget, quotas and deadline
+        scheduler = ApplicationScheduler(
+            jobs,
+            max_applications,
+            self.platform_stats,
+            quotas=self.platform_quotas,
+            deadline=self.deadline,
+            pacing_seconds=32.5 * self.pace_scale,
+            breaker=self.breaker,
+            # Offline replays and benchmarks keep the recorded order
+            predictor=self.outcomes if self.persist_history else None
+        )
+        for job in scheduler.predicted_failures:
+            logger.info("Skipping %s at %s: likely to fail (%.0f%%)", job.title, job.company,
+                        self.outcomes.failure_probability(job) * 100)
+        self.stats["predicted_failures_skipped"] += len(scheduler.predicted_failures)
+        
+        while True:
+            job = scheduler.next_job()
+            if job is None:
+                break
+            with log_context(phase="apply", platform=job.source.value, job_id=job.job_id):
+                self.stats["applications_attempted"] += 1
+                self.run_applications.append(job)
+                self.attempt = {"steps": 0, "reason": None}
+                started = time.time()
                 
-                # Look for continue button
                 try:
-                    continue_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "button.continueButton"))
-                    )
-                    continue_button.click()
-                    time.sleep(2)
+                    logger.info("Attempting to apply for: %s at %s (%s)", job.title, job.company, job.source.value)
                     
-                except TimeoutException:
-                    # No continue button, look for submit button
-                    try:
-                        submit_button = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, "button.submitButton"))
-                        )
-                        submit_button.click()
-                        
-                        # Wait for confirmation
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".applicationSubmitted"))
-                        )
-                        
-                        return True
+                    # Apply based on source platform
+                    adapter = self.adapters.get(job.source.value)
+                    if adapter:
+                        self.browser_manager.use_page_type("detail")
+                        with self.profiler.phase(f"apply.{job.source.value}"):
+                            success = adapter.apply(self, job)
+                    else:
+                        logger.warning("No adapter enabled for %s", job.source.value)
+                        self.attempt["reason"] = "no_adapter"
+                        success = False
+                    
+                    self.platform_stats.record(job.source.value, time.time() - started, success)
+                    self._record_outcome(job, success, started)
+                    if self.attempt["reason"] == "external":
+                        job.apply_type = ApplyType.EXTERNAL
+                        self.manual_follow_up.append(job)
+                        self.stats["manual_follow_up"] = len(self.manual_follow_up)
+                    # External, complex or formless postings say nothing about the platform's health
+                    if success or self._platform_failure():
+                        self.breaker.record(job.source.value, success)
+                    
+                    if success:
+                        # Record successful application
+                        job.date_applied = _today()
+                        job.status = ApplicationStatus.APPLIED
+                        self.applied_jobs.append(job)
+                        applied_count += 1
+                        self.stats["applications_completed"] += 1
+                        logger.info("Successfully applied to %s at %s", job.title, job.company)
                         
-                    except TimeoutException:
-                        # Check if we've reached a complex application
-                        if self._check_for_complex_application():
-                            logger.info("Complex application on Glassdoor - skipping")
-                            return False
+                        # Save progress after each successful application
+                        self._save_applied_jobs()
                         
-                        logger.error("Neither continue nor submit button found on Glassdoor")
-                        return False
-            
-        except Exception as e:
-            logger.error(f"Error in Glassdoor Easy Apply process: {str(e)}")
-            return False
+                        # Random delay between applications (20-45 seconds)
+                        self._pause(20, 45)
+                    else:
+                        job.status = ApplicationStatus.FAILED
+                        failed_count += 1
+                        self.stats["applications_failed"] += 1
+                        logger.warning("Failed to apply to %s at %s", job.title, job.company)
+                
+                except Exception as e:
+                    logger.error("Error applying to job: %s", e)
+                    self.platform_stats.record(job.source.value, time.time() - started, False)
+                    self.attempt["reason"] = self.attempt["reason"] or f"error:{e.__class__.__name__}"
+                    self._record_outcome(job, False, started)
+                    self.breaker.record(job.source.value, False)
+                    job.status = ApplicationStatus.FAILED
+                    failed_count += 1
+                    self.stats["applications_failed"] += 1
+                    
+                    # Keep a screenshot and the page source for debugging
+                    self._capture_failure(job, e)
+                
+                self._check_browser_health()
+        
+        if scheduler.deadline_reached:
+            logger.warning("Run deadline reached - remaining applications deferred to the next run")
+        if self.persist_history:
+            self.workers.write(self.platform_stats.save)
+            self.workers.write(self.outcomes.save)
+        self.workers.drain()
+        
+        logger.info("Application run completed: %s successful, %s failed", applied_count, failed_count)
+        return applied_count, failed_count
     
-    def _fill_glassdoor_form(self):
-        """Fill form fields on Glassdoor application"""
+    def _platform_failure(self):
+        """True when the current attempt failed on an error or missing buttons, not on the posting itself"""
+        reason = self.attempt["reason"] or ""
+        return reason == "no_buttons" or reason.startswith("error:")
+    
+    def _record_outcome(self, job, success, started):
+        """Feed one attempt to the outcome model once (live runs only)"""
+        if self.persist_history and not self.attempt.get("recorded"):
+            self.outcomes.record(job, success, self.attempt["steps"], self.attempt["reason"], time.time() - started)
+            self.attempt["recorded"] = True
+    
+    def _check_browser_health(self):
+        """Between applications: close leaked windows and recycle a degraded browser (live runs only)"""
+        watchdog = self.browser_manager.watchdog
+        if not watchdog.enabled or not self.persist_history or not self.driver:
+            return
         try:
-            # Name fields
-            name_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[name*='name']")
-            for field in name_fields:
-                field_id = field.get_attribute("id").lower()
-                if "first" in field_id and not field.get_attribute("value"):
-                    self._natural_type(field, "John")  # Replace with actual first name
-                elif "last" in field_id and not field.get_attribute("value"):
-                    self._natural_type(field, "Doe")  # Replace with actual last name
-            
-            # Email field
-            try:
-                email_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='email']")
-                if not email_field.get_attribute("value"):
-                    self._natural_type(email_field, self.email)
-            except:
-                pass
-            
-            # Phone field
-            try:
-                phone_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='tel']")
-                if not phone_field.get_attribute("value"):
-                    self._natural_type(phone_field, "5555551234")  # Replace with actual phone
-            except:
-                pass
-            
-            # Resume upload
-            try:
-                resume_upload = self.driver.find_element(By.CSS_SELECTOR, "input[type='file']")
-                resume_upload.send_keys(self.resume_path)
-                time.sleep(3)  # Wait for upload
-            except:
-                pass
-            
-            # Dropdowns for experience, education, etc.
-            dropdowns = self.driver.find_elements(By.TAG_NAME, "select")
-            for dropdown in dropdowns:
-                dropdown_id = dropdown.get_attribute("id").lower()
-                if "experience" in dropdown_id:
-                    dropdown.click()
-                    options = self.driver.find_elements(By.TAG_NAME, "option")
-                    for option in options:
-                        if any(x in option.text.lower() for x in ["0-1", "entry", "less than 1", "<1"]):
-                            option.click()
-                            break
-                elif "education" in dropdown_id:
-                    dropdown.click()
-                    options = self.driver.find_elements(By.TAG_NAME, "option")
-                    for option in options:
-                        if "bachelor" in option.text.lower():
-                            option.click()
-                            break
-            
-            # Checkboxes (usually for terms)
-            checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
-            for checkbox in checkboxes:
-                if not checkbox.is_selected():
-                    checkbox.click()
-            
+            reason = watchdog.after_job(self.driver)
         except Exception as e:
-            logger.error(f"Error filling Glassdoor form: {str(e)}")
+            reason = f"cleanup failed: {e.__class__.__name__}"
+        # A recorded session has to stay on one driver to replay
+        if reason and not isinstance(self.driver, RecordingDriver):
+            self._recycle_browser(reason)
+    
+    def _recycle_browser(self, reason):
+        """Start a fresh browser and restore the platform sessions from cookies"""
+        logger.info("Recycling browser: %s", reason)
+        authenticated = [platform for platform, status in self.auth_manager.auth_status.items() if status]
+        if reason != "unresponsive":
+            for platform in authenticated:
+                self.browser_manager.save_cookies(platform)
+        
+        self.driver = self.browser_manager.restart_browser()
+        self.captcha_solver = CaptchaSolver(self.driver)
+        for platform in authenticated:
+            if not self.auth_manager.authenticate(platform):
+                logger.warning("Could not restore the %s session after recycling the browser", platform)
+    
+    def _capture_failure(self, job, error):
+        """Save failure artifacts for a job (never during offline replays)"""
+        if self.persist_history and self.driver:
+            self.failure_artifacts.capture(self.driver, job, error)
+    
+    def _check_for_complex_application(self):
+        """Check if application requires complex inputs or external redirect"""
+        # Check for text area (long-form questions)
+        textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
+        if len(textareas) > 0:
+            return True
+        
+        # Look for external application indicators
+        external_indicators = [
+            "complete application on company website",
+            "external site",
+            "company's website",
+            "continue on company site"
+        ]
+        
+        page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
+        for indicator in external_indicators:
+            if indicator in page_text:
+                return True
+        
+        return False
     
     def _natural_type(self, element, text):
         """Type text in a human-like manner with variable speed"""
         for char in text:
             element.send_keys(char)
             # Random delay between keystrokes (30-100ms)
-            time.sleep(random.uniform(0.03, 0.1))
+            self._pause(0.03, 0.1)
     
     def generate_report(self):
         """Generate a report of the job search and application results"""
@@ -1362,12 +4090,17 @@ class JobApplicationBot:
             "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             "stats": self.stats,
             "recently_applied": [
-                job for job in self.applied_jobs 
-                if datetime.strptime(job['date_applied'], '%Y-%m-%d') >= 
-                   datetime.now() - timedelta(days=7)
+                job.to_dict() for job in self.applied_jobs 
+                if job.date_applied is not None and job.date_applied >= _today() - 7
             ],
-            "most_common_skills": self._analyze_skill_requirements()
+            "most_common_skills": self._analyze_skill_requirements(),
+            "duplicate_clusters": list(self.duplicate_clusters.values()),
+            "circuit_breaker": self.breaker.report(),
+            "browser": self.browser_manager.watchdog.report(),
+            "manual_follow_up": [dict(job.summary(), skill_score=job.skill_score) for job in self.manual_follow_up]
         }
+        if len(self.profiles) > 1:
+            report["profiles"] = self.profiles.report(self.applied_jobs)
         
         # Save report to file
         with open(f"report_{datetime.now().strftime('%Y%m%d')}.json", 'w') as f:
@@ -1377,24 +4110,12 @@ class JobApplicationBot:
     
     def _analyze_skill_requirements(self):
         """Analyze job descriptions to find most common skills required"""
-        skill_keywords = [
-            "python", "java", "c++", "javascript", "html", "css", "react", 
-            "angular", "vue", "node", "express", "django", "flask", "spring",
-            "sql", "mysql", "postgresql", "mongodb", "nosql", "aws", "azure",
-            "gcp", "cloud", "docker", "kubernetes", "ci/cd", "jenkins", "git",
-            "github", "agile", "scrum", "jira", "linux", "windows", "macos",
-            "rest", "api", "microservices", "embedded", "raspberry pi", "arduino"
-        ]
-        
-        skill_counts = {skill: 0 for skill in skill_keywords}
+        skill_counts = {skill: 0 for skill in Job.taxonomy.skills}
         
-        # Count occurrences in job descriptions
+        # Count skills from each posting's stored vector
         for job in self.applied_jobs:
-            description = job.get('description', '').lower()
-            if description:
-                for skill in skill_keywords:
-                    if skill in description:
-                        skill_counts[skill] += 1
+            for skill in Job.taxonomy.names(job.skill_vector):
+                skill_counts[skill] += 1
         
         # Sort by count (descending)
         sorted_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)
@@ -1402,6 +4123,11 @@ class JobApplicationBot:
         # Return top 10 skills
         return dict(sorted_skills[:10])
     
+    def export_analytics(self, directory="analytics"):
+        """Append this run's postings, applications, skill hits and stats to the Parquet export"""
+        exporter = AnalyticsExporter(directory)
+        return exporter.export_run(self.run_id, self.run_postings, self.run_applications, self.stats)
+    
     def send_email_report(self, recipient_email=None):
         """Send email report of job application activity"""
         if not recipient_email:
@@ -1442,12 +4168,18 @@ class JobApplicationBot:
                         <ul>
                             <li>Jobs Found: {report_data['stats']['jobs_found']}</li>
                             <li>Jobs Filtered: {report_data['stats']['jobs_filtered']}</li>
+                            <li>Near-Duplicates Skipped: {report_data['stats']['duplicates_skipped']}</li>
+                            <li>Predicted Failures Skipped: {report_data['stats']['predicted_failures_skipped']}</li>
+                            <li>External Applications for Manual Follow-up: {report_data['stats']['manual_follow_up']}</li>
                             <li>Applications Attempted: {report_data['stats']['applications_attempted']}</li>
                             <li>Applications Completed: {report_data['stats']['applications_completed']}</li>
                             <li>Applications Failed: {report_data['stats']['applications_failed']}</li>
+                            <li>Platforms Paused: {', '.join(trip['platform'] for trip in report_data['circuit_breaker']['trips']) or 'None'}</li>
                         </ul>
                     </div>
                     
+                    {self._profiles_html(report_data)}
+                    {self._follow_up_html(report_data)}
                     <h2>Recently Applied Jobs</h2>
                     <table>
                         <tr>
@@ -1521,21 +4253,607 @@ class JobApplicationBot:
                 server.login(smtp_username, smtp_password)
                 server.send_message(msg)
             
-            logger.info(f"Email report sent to {recipient_email}")
+            logger.info("Email report sent to %s", recipient_email)
             return True
             
         except Exception as e:
-            logger.error(f"Error sending email report: {str(e)}")
+            logger.error("Error sending email report: %s", e)
             return False
     
+    @staticmethod
+    def _profiles_html(report_data):
+        """Per-profile table for the email report, empty for single-profile runs"""
+        if "profiles" not in report_data:
+            return ""
+        rows = "".join(
+            f"<tr><td>{html.escape(name)}</td><td>{entry['accepted']}</td>"
+            f"<td>{entry['applications_completed']}</td><td>{entry['applications_failed']}</td></tr>"
+            for name, entry in report_data["profiles"].items()
+        )
+        return ("<h2>Profiles</h2><table><tr><th>Profile</th><th>Matched</th><th>Applied</th><th>Failed</th></tr>"
+                f"{rows}</table>")
+    
+    @staticmethod
+    def _follow_up_html(report_data):
+        """Table of external-apply matches to handle by hand"""
+        if not report_data["manual_follow_up"]:
+            return ""
+        rows = "".join(
+            f"<tr><td><a href='{html.escape(job['url'])}'>{html.escape(job['title'])}</a></td>"
+            f"<td>{html.escape(job['company'])}</td><td>{job['source']}</td></tr>"
+            for job in report_data["manual_follow_up"][:25]
+        )
+        return ("<h2>Apply Manually</h2><table><tr><th>Job Title</th><th>Company</th><th>Source</th></tr>"
+                f"{rows}</table>")
+    
     def close(self):
         """Close browser and clean up resources"""
+        self.workers.close()
+        self.seen_ledger.close()
+        if isinstance(self.driver, RecordingDriver):
+            self.driver.save()
         if self.browser_manager:
             self.browser_manager.close_browser()
         logger.info("Job application bot closed")
 
+class _MockJobBoardHandler(BaseHTTPRequestHandler):
+    """Routes requests to the synthetic job-board pages"""
+    
+    def do_GET(self):
+        board = self.server.board
+        parsed = urlparse(self.path)
+        parts = [p for p in parsed.path.split("/") if p]
+        query = parse_qs(parsed.query)
+        
+        page_type, body = board.render(parts, query)
+        board.record_request(page_type, len(body) if body else 0)
+        
+        if board.latency:
+            time.sleep(board.latency + random.uniform(0, board.latency_jitter))
+        
+        if body is None:
+            self.send_response(404 if page_type == "missing" else 500)
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header("Content-Type", board.content_type(page_type))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        # Keep benchmark output clean
+        pass
+
+class MockJobBoardServer:
+    """Local HTTP stand-in serving synthetic LinkedIn, Indeed and Glassdoor pages for benchmarks"""
+    
+    TITLES = [
+        "Junior Software Engineer", "Entry Level Python Developer", "Associate Software Developer",
+        "New Grad Embedded Engineer", "Junior Backend Developer", "Software Engineer I",
+        "Senior Software Engineer", "Engineering Manager", "Staff Embedded Engineer"
+    ]
+    COMPANIES = ["Acme Automation", "Initech", "Globex", "Umbrella Systems", "Hooli", "Vandelay Industries"]
+    SKILLS = [
+        "python", "java", "c++", "javascript", "sql", "mysql", "embedded", "linux", "algorithms",
+        "data structures", "machine learning", "github", "docker", "aws", "react", "microcontroller"
+    ]
+    # Static assets the pages reference: content type and default size in KB
+    ASSETS = {
+        "image": ("image/png", 24),
+        "font": ("font/woff2", 96),
+        "media": ("video/mp4", 800)
+    }
+    
+    def __init__(self, jobs_per_page=25, pages=2, latency=0.0, latency_jitter=0.0, form_steps=3,
+                 failure_rate=0.0, complex_rate=0.0, external_rate=0.0, seed=0, port=0,
+                 assets=True, asset_kb=None):
+        self.jobs_per_page = jobs_per_page
+        self.pages = pages
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.form_steps = form_steps
+        self.failure_rate = failure_rate
+        self.complex_rate = complex_rate
+        self.external_rate = external_rate
+        self.seed = seed
+        self.port = port
+        # Logos, a web font and a video like the real boards, to measure what the resource policy saves
+        self.assets = assets
+        self.asset_kb = {asset: kb for asset, (_, kb) in self.ASSETS.items()}
+        self.asset_kb.update(asset_kb or {})
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+        
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+    
+    def start(self):
+        """Serve pages from a background thread"""
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), _MockJobBoardHandler)
+        self._httpd.board = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Mock job board serving on %s", self.base_url)
+        return self
+    
+    def stop(self):
+        """Shut the server down"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+    
+    def job_boards(self):
+        """Board configuration pointing the bot at this server"""
+        return {
+            "linkedin": {
+                "search_url": f"{self.base_url}/linkedin/jobs/search/",
+                "params": {"keywords": "", "location": "", "f_E": "1,2", "sortBy": "DD"}
+            },
+            "indeed": {
+                "search_url": f"{self.base_url}/indeed/jobs",
+                "params": {"q": "", "l": "", "fromage": "7", "sort": "date"}
+            },
+            "glassdoor": {
+                "search_url": f"{self.base_url}/glassdoor/Job/jobs.htm",
+                "params": {"sc.keyword": "", "locT": "C", "locId": 0}
+            }
+        }
+    
+    def record_request(self, page_type, size):
+        """Count requests and bytes served per page type"""
+        with self._stats_lock:
+            entry = self.stats.setdefault(page_type, {"requests": 0, "bytes": 0})
+            entry["requests"] += 1
+            entry["bytes"] += size
+    
+    def content_type(self, page_type):
+        if page_type in self.ASSETS:
+            return self.ASSETS[page_type][0]
+        return "text/html; charset=utf-8"
+    
+    def _job(self, platform, job_id):
+        """Deterministically generate a posting and its failure mode"""
+        rng = random.Random(f"{self.seed}:{platform}:{job_id}")
+        skills = rng.sample(self.SKILLS, rng.randint(2, 6))
+        roll = rng.random()
+        if roll < self.failure_rate:
+            mode = "error"
+        elif roll < self.failure_rate + self.complex_rate:
+            mode = "complex"
+        elif roll < self.failure_rate + self.complex_rate + self.external_rate:
+            mode = "external"
+        else:
+            mode = "easy"
+        return {
+            "id": job_id,
+            "title": rng.choice(self.TITLES),
+            "company": rng.choice(self.COMPANIES),
+            "description": (f"We are hiring an entry level engineer. You will work with "
+                            f"{', '.join(skills)}. 0-2 years of experience. "
+                            + " ".join(rng.choice(self.SKILLS) for _ in range(rng.randint(40, 120)))),
+            "mode": mode
+        }
+    
+    def _search_ids(self, platform, query):
+        """Job ids for a search, stable for the same query"""
+        key = json.dumps(sorted((k, v) for k, v in query.items()))
+        base = int(hashlib.sha1(f"{platform}:{key}".encode()).hexdigest()[:6], 16) * 1000
+        return [base + i for i in range(self.jobs_per_page * self.pages)]
+    
+    def render(self, parts, query):
+        """Return (page type, body bytes) for a path; body is None for error responses"""
+        if len(parts) < 2:
+            return "missing", None
+        platform, route = parts[0], parts[1:]
+        
+        if platform == "static" and route[0] in self.ASSETS:
+            return route[0], b"\0" * (self.asset_kb[route[0]] * 1024)
+        
+        if platform == "linkedin" and route[:2] == ["jobs", "search"]:
+            return "search", self._page(self._linkedin_search(self._search_ids(platform, query)))
+        if platform == "indeed" and route == ["jobs"]:
+            return "search", self._page(self._indeed_search(self._search_ids(platform, query)))
+        if platform == "glassdoor" and route[:2] == ["Job", "jobs.htm"]:
+            return "search", self._page(self._glassdoor_search(self._search_ids(platform, query)))
+        
+        if platform == "indeed" and route[0] == "applied":
+            return "confirmation", self._page("<h1>Application submitted - thank you</h1>")
+        
+        if len(route) >= 2 and route[-1].isdigit():
+            job = self._job(platform, int(route[-1]))
+            if job["mode"] == "error":
+                return "detail", None
+            renderer = {
+                "linkedin": self._linkedin_detail,
+                "indeed": self._indeed_detail,
+                "glassdoor": self._glassdoor_detail
+            }.get(platform)
+            if renderer:
+                return "detail", self._page(renderer(job))
+        
+        return "missing", None
+    
+    def _page(self, content):
+        font = ("<style>@font-face { font-family: Brand; src: url('/static/font/brand.woff2'); }"
+                "body { font-family: Brand, sans-serif; }</style>" if self.assets else "")
+        return (f"<!DOCTYPE html><html><head><title>Jobs</title>{font}</head>"
+                f"<body>{content}</body></html>").encode("utf-8")
+    
+    def _logo(self, job):
+        """Company logo; each posting's URL is distinct, as on the real boards"""
+        return f"<img class='company-logo' src='/static/image/logo-{job['id']}.png' alt=''>" if self.assets else ""
+    
+    def _video(self, job):
+        return (f"<video src='/static/media/intro-{job['id']}.mp4' preload='auto' muted></video>"
+                if self.assets else "")
+    
+    def _steps_script(self, job, continue_html, submit_html, on_submit):
+        """Client-side multi-step form: each step replaces the previous one so only one button set exists"""
+        fields = [
+            "<input name='firstName' id='firstName' placeholder='First name'>"
+            "<input name='lastName' id='lastName' placeholder='Last name'>"
+            "<input type='email' name='email'><input type='tel' name='phone'>"
+            "<input name='phoneNumber' id='phoneNumber'>",
+            "<select name='urn:li:form:workExperienceFormElement' id='experience'>"
+            "<option>Select</option><option>0-1 years</option><option>2-4 years</option></select>"
+            "<select name='education' id='education'><option>Select</option><option>Bachelor's</option></select>",
+            "<label><input type='radio' name='authorized' value='yes'>Yes</label>"
+            "<label><input type='checkbox' name='terms' id='terms'>I agree</label>",
+        ]
+        steps = []
+        for index in range(self.form_steps):
+            step = fields[index % len(fields)]
+            if index == self.form_steps - 1:
+                if job["mode"] == "complex":
+                    step += "<textarea name='essay'></textarea>"
+                else:
+                    step += submit_html
+            else:
+                step += continue_html
+            steps.append(step)
+        return (f"var steps = {json.dumps(steps)}; var step = 0;"
+                f"function renderStep() {{ document.getElementById('apply-form').innerHTML = steps[step]; }}"
+                f"function nextStep() {{ step += 1; renderStep(); }}"
+                f"function submitApplication() {{ {on_submit} }}")
+    
+    @staticmethod
+    def _badge(job, css_class, label):
+        """Easy Apply badge on a search card; external postings have none"""
+        return "" if job["mode"] == "external" else f"<span class='{css_class}'>{label}</span>"
+    
+    def _linkedin_search(self, ids):
+        jobs = [self._job("linkedin", job_id) for job_id in ids]
+        cards = []
+        for index, job in enumerate(jobs):
+            hidden = " style='display:none'" if index >= self.jobs_per_page else ""
+            cards.append(
+                f"<li class='job-search-card'{hidden}>{self._logo(job)}"
+                f"<h3 class='job-search-card__title' onclick='showDetails({index})'>{html.escape(job['title'])}</h3>"
+                f"<h4 class='job-search-card__subtitle'>{html.escape(job['company'])}</h4>"
+                f"{self._badge(job, 'job-search-card__easy-apply-label', 'Easy Apply')}"
+                f"<a class='job-search-card__link' href='/linkedin/jobs/view/{job['id']}'>View</a></li>"
+            )
+        more = ("<button class='infinite-scroller__show-more-button' onclick='showMore()'>See more jobs</button>"
+                if self.pages > 1 else "")
+        descriptions = json.dumps([job["description"] for job in jobs])
+        script = (f"var descriptions = {descriptions};"
+                  "function showDetails(i) { var pane = document.getElementById('details');"
+                  "pane.innerHTML = \"<div class='job-details-jobs-unified-description__content'></div>\";"
+                  "pane.firstChild.textContent = descriptions[i]; }"
+                  "function showMore() { document.querySelectorAll('.job-search-card').forEach("
+                  "function(c) { c.style.display = ''; }); }")
+        return (f"<ul class='jobs-search__results-list'>{''.join(cards)}</ul>{more}"
+                f"<div id='details'></div><script>{script}</script>")
+    
+    def _indeed_search(self, ids):
+        jobs = [self._job("indeed", job_id) for job_id in ids[:self.jobs_per_page]]
+        cards = []
+        for index, job in enumerate(jobs):
+            cards.append(
+                f"<div class='job_seen_beacon'>{self._logo(job)}<h2 class='jobTitle'>"
+                f"<a href='/indeed/viewjob/{job['id']}' onclick='showDetails({index}); return false;'>"
+                f"{html.escape(job['title'])}</a></h2>"
+                f"<span class='companyName'>{html.escape(job['company'])}</span>"
+                f"{self._badge(job, 'iaLabel', 'Easily apply')}</div>"
+            )
+        descriptions = json.dumps([job["description"] for job in jobs])
+        script = (f"var descriptions = {descriptions};"
+                  "function showDetails(i) { var pane = document.getElementById('details');"
+                  "pane.innerHTML = \"<div id='jobDescriptionText'></div>\";"
+                  "pane.firstChild.textContent = descriptions[i]; }")
+        return (f"<div class='jobsearch-ResultsList'>{''.join(cards)}</div>"
+                f"<div id='details'></div><script>{script}</script>")
+    
+    def _glassdoor_search(self, ids):
+        jobs = [self._job("glassdoor", job_id) for job_id in ids[:self.jobs_per_page]]
+        cards = []
+        for index, job in enumerate(jobs):
+            cards.append(
+                f"<li class='react-job-listing' onclick='showDetails({index})'>{self._logo(job)}"
+                f"<a class='jobLink' href='/glassdoor/job-listing/{job['id']}' "
+                f"onclick='event.preventDefault()'>{html.escape(job['title'])}</a>"
+                f"<div class='css-1nqghjk'>{html.escape(job['company'])}</div>"
+                f"{self._badge(job, 'easyApplyBadge', 'Easy Apply')}</li>"
+            )
+        descriptions = json.dumps([job["description"] for job in jobs])
+        script = (f"var descriptions = {descriptions};"
+                  "function showDetails(i) { var pane = document.getElementById('details');"
+                  "pane.innerHTML = \"<div class='jobDescriptionContent'></div>\";"
+                  "pane.firstChild.textContent = descriptions[i]; }")
+        modal = ("<div id='modal'><span class='modal_closeIcon' "
+                 "onclick=\"document.getElementById('modal').remove()\">x</span></div>")
+        return f"{modal}<ul>{''.join(cards)}</ul><div id='details'></div><script>{script}</script>"
+    
+    def _linkedin_detail(self, job):
+        steps = self._steps_script(
+            job,
+            "<button aria-label='Continue to next step' onclick='nextStep()'>Next</button>",
+            "<button aria-label='Submit application' onclick='submitApplication()'>Submit</button>",
+            "document.getElementById('done').innerHTML = \"<div class='artdeco-modal__content'>Application sent</div>\";"
+        )
+        apply = ("<p>Continue on company site</p>" if job["mode"] == "external" else
+                 "<button class='jobs-apply-button' onclick=\"document.getElementById('apply').innerHTML = "
+                 "&quot;<div class='jobs-easy-apply-content'><div id='apply-form'></div></div>&quot;; renderStep();\">"
+                 "Easy Apply</button>")
+        return (f"<div class='jobs-unified-top-card'>{self._logo(job)}<h1>{html.escape(job['title'])}</h1>"
+                f"<span>{html.escape(job['company'])}</span></div>{self._video(job)}{apply}"
+                f"<div id='apply'></div><div id='done'></div>"
+                f"<div class='description'>{html.escape(job['description'])}</div><script>{steps}</script>")
+    
+    def _indeed_detail(self, job):
+        steps = self._steps_script(
+            job,
+            "<button class='ia-continueButton' onclick='nextStep()'>Continue</button>",
+            "<button class='ia-SubmitButton' onclick='submitApplication()'>Submit</button>",
+            f"window.location.href = '/indeed/applied/{job['id']}';"
+        )
+        apply = ("<p>Apply on company site</p>" if job["mode"] == "external" else
+                 "<button class='jobsearch-IndeedApplyButton' onclick='renderStep()'>Apply now</button>")
+        return (f"<div class='jobsearch-JobInfoHeader'>{self._logo(job)}<h1>{html.escape(job['title'])}</h1></div>"
+                f"{self._video(job)}{apply}"
+                f"<div id='apply-form'></div>"
+                f"<div id='jobDescriptionText'>{html.escape(job['description'])}</div><script>{steps}</script>")
+    
+    def _glassdoor_detail(self, job):
+        steps = self._steps_script(
+            job,
+            "<button class='continueButton' onclick='nextStep()'>Continue</button>",
+            "<button class='submitButton' onclick='submitApplication()'>Submit</button>",
+            "document.getElementById('done').innerHTML = \"<div class='applicationSubmitted'>Submitted</div>\";"
+        )
+        options = ("<span>Apply on employer site</span>" if job["mode"] == "external" else
+                   "<button class='easyApply' onclick='renderStep()'>Easy Apply</button>")
+        return (f"<div class='jobDetails'>{self._logo(job)}<h1>{html.escape(job['title'])}</h1></div>{self._video(job)}"
+                f"<button class='applyButton' onclick=\"document.getElementById('options').style.display = ''\">"
+                f"Apply</button><div id='options' style='display:none'>{options}</div>"
+                f"<div id='apply-form'></div><div id='done'></div>"
+                f"<div class='jobDescriptionContent'>{html.escape(job['description'])}</div><script>{steps}</script>")
+
+def run_benchmark(bot, server, max_applications=10):
+    """Run search and apply against a mock job board and report throughput"""
+    server.start()
+    try:
+        bot.job_boards = {name: board for name, board in server.job_boards().items() if name in bot.adapters}
+        bot.applied_jobs = []
+        bot.persist_history = False
+        
+        bot.driver = bot.browser_manager.start_browser()
+        bot.captcha_solver = CaptchaSolver(bot.driver)
+        for platform in bot.job_boards:
+            bot.auth_manager.auth_status[platform] = True
+        
+        search_start = time.time()
+        jobs = bot.search_jobs()
+        search_seconds = time.time() - search_start
+        
+        apply_start = time.time()
+        applied_count, failed_count = bot.apply_for_jobs(jobs, max_applications=max_applications)
+        apply_seconds = time.time() - apply_start
+        
+        policy = bot.browser_manager.resource_policy
+        total_bytes = sum(entry["bytes"] for entry in server.stats.values())
+        results = {
+            "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "jobs_parsed": bot.stats["jobs_found"],
+            "search_seconds": round(search_seconds, 2),
+            "jobs_parsed_per_minute": round(bot.stats["jobs_found"] / search_seconds * 60, 1) if search_seconds else 0,
+            "applications_completed": applied_count,
+            "applications_failed": failed_count,
+            "apply_seconds": round(apply_seconds, 2),
+            "applications_per_hour": round(applied_count / apply_seconds * 3600, 1) if apply_seconds else 0,
+            "manual_follow_up": bot.stats["manual_follow_up"],
+            "resource_policy": {
+                "enabled": policy.enabled,
+                "page_load_strategy": policy.page_load_strategy
+            },
+            "kb_per_posting": round(total_bytes / 1024 / bot.stats["jobs_found"], 1) if bot.stats["jobs_found"] else 0,
+            "requests": server.stats
+        }
+        
+        with open(f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json", 'w') as f:
+            json.dump(results, f, indent=2)
+        
+        return results
+        
+    finally:
+        bot.close()
+        server.stop()
+
+class PostingImporter:
+    """Streams postings from CSV/JSONL exports through the bot's dedup and filtering into history"""
+    
+    # Job field -> column name in the export
+    DEFAULT_MAPPING = {
+        "title": "title",
+        "company": "company",
+        "url": "url",
+        "source": "source",
+        "location": "location",
+        "description": "description",
+        "date_found": "date_found"
+    }
+    
+    def __init__(self, bot, mapping=None, default_source=None, batch_size=2000, max_rankings=10000):
+        self.bot = bot
+        self.mapping = dict(self.DEFAULT_MAPPING, **(mapping or {}))
+        self.default_source = default_source or JobSource.IMPORT
+        self.batch_size = batch_size
+        self.max_rankings = max_rankings
+        self._sequence = itertools.count()
+        
+    def _rows(self, path):
+        """Stream rows as dicts from a CSV or JSONL file"""
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            if path.lower().endswith(".csv"):
+                # Descriptions easily exceed the default field limit
+                csv.field_size_limit(16 * 1024 * 1024)
+                yield from csv.DictReader(f)
+            else:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+    
+    def _to_job(self, row):
+        """Map an export row to a Job, or None when required fields are missing"""
+        values = {field: row.get(column) for field, column in self.mapping.items()}
+        if not values["title"] or not values["url"]:
+            return None
+        try:
+            source = JobSource(str(values["source"]).lower())
+        except ValueError:
+            source = self.default_source
+        try:
+            date_found = _date_to_ordinal(values["date_found"])
+        except ValueError:
+            date_found = None
+        return Job(
+            title=str(values["title"]).strip(),
+            company=str(values["company"] or "").strip(),
+            url=str(values["url"]).strip(),
+            source=source,
+            location=str(values["location"] or ""),
+            date_found=date_found,
+            description=str(values["description"] or "")
+        )
+    
+    def import_file(self, path, output_path="import_rankings.json"):
+        """Import a file in batches; returns accepted, duplicate and rejected counts"""
+        counts = {"rows": 0, "accepted": 0, "duplicate": 0, "rejected": 0}
+        # Best accepted postings as a min-heap of (score, -row order, summary), so memory stays flat
+        rankings = []
+        applied_urls = {job.url for job in self.bot.applied_jobs}
+        started = time.time()
+        
+        # Description blobs are written on the writer thread, overlapping with parsing
+        Job.descriptions.deferred = True
+        try:
+            batch = []
+            batch_urls = set()
+            for row in self._rows(path):
+                counts["rows"] += 1
+                job = self._to_job(row)
+                if job is None:
+                    counts["rejected"] += 1
+                    continue
+                if job.url in batch_urls or job.url in applied_urls or job.url in self.bot.history:
+                    counts["duplicate"] += 1
+                    continue
+                batch.append(job)
+                batch_urls.add(job.url)
+                
+                if len(batch) >= self.batch_size:
+                    self._commit_batch(batch, counts, rankings)
+                    batch = []
+                    batch_urls = set()
+            
+            if batch:
+                self._commit_batch(batch, counts, rankings)
+        finally:
+            self.bot.workers.drain()
+            Job.descriptions.deferred = False
+            Job.descriptions.flush()
+        self.bot.seen_ledger.commit()
+        
+        # Same ordering as a live run: best score first, ties in file order
+        rankings.sort(reverse=True)
+        with open(output_path, 'w') as f:
+            json.dump([summary for _, _, summary in rankings], f, indent=2)
+        
+        elapsed = time.time() - started
+        counts["rows_per_second"] = round(counts["rows"] / elapsed) if elapsed else counts["rows"]
+        logger.info("Imported %s: %s accepted, %s duplicate, %s rejected (%s rows/s)", path,
+                    counts['accepted'], counts['duplicate'], counts['rejected'], counts['rows_per_second'])
+        return counts
+    
+    def _commit_batch(self, batch, counts, rankings):
+        """Filter one batch, then queue all of it for the history store"""
+        # Fields are extracted lazily by the filter's stages, so postings ruled out on their
+        # title never have their description parsed
+        duplicates_before = self.bot.stats["duplicates_skipped"]
+        kept = self.bot._filter_jobs(batch)
+        near_duplicates = self.bot.stats["duplicates_skipped"] - duplicates_before
+        
+        counts["accepted"] += len(kept)
+        counts["duplicate"] += near_duplicates
+        counts["rejected"] += len(batch) - len(kept) - near_duplicates
+        
+        # Rejected postings are kept too, so later rescoring can revisit them. The writer
+        # stores descriptions before the postings that reference them
+        self.bot.history.add(batch)
+        self.bot.workers.write(Job.descriptions.flush)
+        self.bot.workers.write(self.bot.history.append, self.bot.history.take_pending())
+        
+        # An import writes no run report, so per-run bookkeeping need not grow with the file
+        self.bot.assigned_profiles.clear()
+        self.bot.duplicate_clusters.clear()
+        
+        for job in kept:
+            entry = (job.skill_score, -next(self._sequence), dict(job.summary(), skill_score=job.skill_score))
+            if len(rankings) < self.max_rankings:
+                heapq.heappush(rankings, entry)
+            else:
+                heapq.heappushpop(rankings, entry)
+
+def _build_browser_daemon(config):
+    """Create the browser daemon from config, or None when it is disabled"""
+    daemon_config = config.get("browser_daemon", {})
+    if not daemon_config.get("enabled"):
+        return None
+    return BrowserDaemon(
+        profile_dir=daemon_config.get("profile_dir", "chrome_profile"),
+        port=daemon_config.get("port", 9222),
+        chrome_binary=daemon_config.get("chrome_binary"),
+        headless=config["headless"]
+    )
+
 def main():
     """Main function to run the job application bot"""
+    parser = argparse.ArgumentParser(description="Job application bot")
+    parser.add_argument("--daemon", choices=["start", "stop", "restart", "status"],
+                        help="Manage the persistent browser daemon instead of running the bot")
+    parser.add_argument("--record", metavar="CASSETTE",
+                        help="Record page sources and interaction outcomes of this run for offline replay")
+    parser.add_argument("--replay", metavar="CASSETTE",
+                        help="Run offline against a recorded session instead of a live browser")
+    parser.add_argument("--bench", action="store_true",
+                        help="Measure search and apply throughput against a local mock job board")
+    parser.add_argument("--rescore", action="store_true",
+                        help="Rebuild rankings from the posting history without a browser")
+    parser.add_argument("--workers", type=int, help="Worker processes for --rescore (default: all cores)")
+    parser.add_argument("--import", dest="import_path", metavar="FILE",
+                        help="Import postings from a CSV or JSONL export into the history store")
+    parser.add_argument("--mapping", help="JSON object mapping job fields to export columns for --import")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile CPU and memory per phase and write the results under profiles/")
+    args = parser.parse_args()
+    
     # Configuration
     config = {
         "email": "your.email@example.com",  # Replace with your email
@@ -1562,34 +4880,217 @@ def main():
             "manager", 
             "director", 
             "principal",
-            "staff",
-            "10+ years",
-            "5+ years"
+            "staff"
         ],
+        "requirement_filters": {
+            "max_years": 2,  # Reject postings asking for more years of experience
+            "min_salary": None,  # Reject postings whose stated range tops out below this (USD/year)
+            "remote_only": False
+        },
+        "profiles": [],  # Several resumes/roles scored against one search; see README
         "headless": False,  # Set to True for background operation
-        "max_applications": 10  # Maximum applications per run
+        "max_applications": 10,  # Maximum applications per run
+        "time_limit_minutes": None,  # Stop searching and applying after this long
+        "platform_quotas": {},  # Optional per-platform caps, e.g. {"linkedin": 5}
+        "platforms": {
+            "enabled": ["linkedin", "indeed", "glassdoor"],  # Only these adapters are loaded
+            "adapters": {}  # Extra platforms, e.g. {"wellfound": "my_adapters.wellfound:WellfoundAdapter"}
+        },
+        "background_workers": 2,  # Threads parsing and scoring postings beside the browser
+        "circuit_breaker": {
+            "failure_rate": 0.6,  # Share of recent searches/applications failing that trips a platform
+            "min_attempts": 4,
+            "window": 10,
+            "cooldown_minutes": None  # None keeps a tripped platform off for the rest of the run
+        },
+        "browser_watchdog": {
+            "enabled": True,  # On by default; False leaves driver calls without deadlines or recycling
+            "command_timeout": 120,  # Seconds before any hung driver call raises
+            "page_load_timeout": 60,
+            "script_timeout": 30,
+            "recycle_after": 40,  # Fresh browser (sessions restored from cookies) after this many applications
+            "max_memory_mb": 1024,  # ...or once the page's renderer JS heap grows past this
+            "memory_check_every": 5  # Applications between memory readings
+        },
+        "resource_policy": {
+            "enabled": True,  # On by default; False loads every asset on every page
+            "page_load_strategy": "eager",  # Return from page loads once the DOM is ready
+            "block": ["image", "font", "media"],  # Asset types skipped on pages read only for text
+            "pages": {"login": []}  # Per page type (login, search, detail); login keeps captcha images
+        },
+        "outcome_model": {
+            "path": "application_outcomes.jsonl",  # Every attempt with its step count and failure reason
+            "skip_threshold": 0.9,  # Skip postings at least this likely to fail
+            "min_outcomes": 30,  # Recorded attempts before the model is trusted
+            "min_feature_count": 5,  # Observations of the posting's company or a title word needed to skip it
+            "explore_rate": 0.1  # Share of would-be skips attempted anyway so the model keeps learning
+        },
+        "retries": {
+            "attempts": 3,  # Tries per search page on dropped connections and re-rendered elements
+            "backoff_seconds": 5,
+            "max_backoff_seconds": 60
+        },
+        "failure_artifacts": {
+            "directory": "error_artifacts",  # Screenshot + gzipped DOM per distinct failure page
+            "max_mb": 200,
+            "max_age_days": 14
+        },
+        "logging": {
+            "level": "INFO",
+            "levels": {"selenium": "WARNING", "urllib3": "WARNING", "WDM": "WARNING"},  # Per-logger overrides
+            "path": "job_bot.log",  # JSON lines; rotated and gzipped at max_bytes
+            "max_bytes": 10 * 1024 * 1024,
+            "backups": 5,
+            "json_file": True
+        },
+        "profiling": {
+            "sample_rate": 0.0,  # Share of runs profiled without --profile
+            "directory": "profiles",
+            "top_allocations": 15,  # Allocation sites kept per phase
+            "frames": 1  # Traceback depth recorded per allocation; more is slower
+        },
+        "analytics_export": False,  # Append run data to analytics/ as Parquet (needs pyarrow)
+        "skill_taxonomy": None,  # Optional {"skill": ["alias", ...]} replacing the built-in taxonomy
+        "browser_daemon": {
+            "enabled": False,  # Attach to a long-lived browser instead of launching one per run
+            "port": 9222,
+            "profile_dir": "chrome_profile"
+        },
+        "benchmark": {
+            "jobs_per_page": 25,
+            "pages": 2,
+            "latency": 0.2,  # Seconds added to every mock response
+            "latency_jitter": 0.1,
+            "form_steps": 3,
+            "failure_rate": 0.05,  # Share of job pages that return HTTP 500
+            "complex_rate": 0.1,  # Share of applications ending in a long-form question
+            "external_rate": 0.1,  # Share of postings without Easy Apply
+            "assets": True,  # Serve logos, a web font and videos with the pages
+            "pace_scale": 0,  # 1 keeps the normal human-like delays
+            "keywords": ["software engineer"],
+            "locations": ["Remote"]
+        }
     }
     
+    configure_logging(**config["logging"])
+    
+    if config["skill_taxonomy"]:
+        Job.taxonomy = SkillTaxonomy(config["skill_taxonomy"])
+    
+    # Daemon management commands
+    if args.daemon:
+        daemon = _build_browser_daemon(config) or BrowserDaemon(headless=config["headless"])
+        if args.daemon == "start":
+            daemon.ensure_running()
+        elif args.daemon == "stop":
+            daemon.stop()
+        elif args.daemon == "restart":
+            daemon.stop()
+            daemon.start()
+        print(json.dumps(daemon.status(), indent=2))
+        return
+    
+    # Per-phase CPU and memory profiling for --profile and a sampled share of runs
+    profiling = dict(config["profiling"])
+    sample_rate = profiling.pop("sample_rate")
+    profiler = PhaseProfiler(enabled=args.profile or random.random() < sample_rate, **profiling).start()
+    
+    # Benchmark against the local mock job board
+    if args.bench:
+        bench_config = config["benchmark"]
+        bot = JobApplicationBot(
+            email=config["email"],
+            resume_path=config["resume_path"],
+            keywords=bench_config["keywords"],
+            locations=bench_config["locations"],
+            exclude_keywords=config["exclude_keywords"],
+            headless=True,
+            requirement_filters=config["requirement_filters"],
+            platforms=config["platforms"],
+            resource_policy=config["resource_policy"],
+            profiler=profiler
+        )
+        bot.pace_scale = bench_config["pace_scale"]
+        server = MockJobBoardServer(
+            jobs_per_page=bench_config["jobs_per_page"],
+            pages=bench_config["pages"],
+            latency=bench_config["latency"],
+            latency_jitter=bench_config["latency_jitter"],
+            form_steps=bench_config["form_steps"],
+            failure_rate=bench_config["failure_rate"],
+            complex_rate=bench_config["complex_rate"],
+            external_rate=bench_config["external_rate"],
+            assets=bench_config["assets"]
+        )
+        results = run_benchmark(bot, server, max_applications=config["max_applications"])
+        profiler.finish()
+        print(json.dumps(results, indent=2))
+        return
+    
     # Initialize job bot
-    bot = JobApplicationBot(
-        email=config["email"],
-        resume_path=config["resume_path"],
-        keywords=config["keywords"],
-        locations=config["locations"],
-        exclude_keywords=config["exclude_keywords"],
-        headless=config["headless"]
-    )
+    with profiler.phase("startup"):
+        bot = JobApplicationBot(
+            email=config["email"],
+            resume_path=config["resume_path"],
+            keywords=config["keywords"],
+            locations=config["locations"],
+            exclude_keywords=config["exclude_keywords"],
+            headless=config["headless"],
+            browser_daemon=_build_browser_daemon(config),
+            record_path=args.record,
+            replay_path=args.replay,
+            platform_quotas=config["platform_quotas"],
+            time_limit_minutes=config["time_limit_minutes"],
+            requirement_filters=config["requirement_filters"],
+            background_workers=config["background_workers"],
+            failure_artifacts=config["failure_artifacts"],
+            circuit_breaker=config["circuit_breaker"],
+            retry_policy=config["retries"],
+            outcome_model=config["outcome_model"],
+            browser_watchdog=config["browser_watchdog"],
+            resource_policy=config["resource_policy"],
+            platforms=config["platforms"],
+            profiles=config["profiles"],
+            profiler=profiler
+        )
+    
+    # Bulk import needs no browser either
+    if args.import_path:
+        mapping = json.loads(args.mapping) if args.mapping else None
+        try:
+            with log_context(phase="import"), profiler.phase("import"):
+                counts = PostingImporter(bot, mapping=mapping).import_file(args.import_path)
+        finally:
+            bot.close()
+        profiler.finish()
+        print(json.dumps(counts, indent=2))
+        return
+    
+    # Offline rescoring needs no browser
+    if args.rescore:
+        try:
+            with log_context(phase="rescore"), profiler.phase("rescore"):
+                rankings = bot.rescore_history(workers=args.workers)
+        finally:
+            bot.close()
+        profiler.finish()
+        logger.info("Top ranked: %s", ', '.join(r['title'] for r in rankings[:5]))
+        return
+    
+    start_time = time.time()
+    start_cpu = time.process_time()
     
     try:
         # Initialize browser and authenticate
         logger.info("Initializing browser and authenticating...")
-        auth_results = bot.initialize()
+        with log_context(phase="auth"), profiler.phase("auth"):
+            auth_results = bot.initialize()
         
         # Check authentication results
         all_authenticated = all(auth_results.values())
         if not all_authenticated:
             failed_platforms = [p for p, r in auth_results.items() if not r]
-            logger.warning(f"Failed to authenticate with: {', '.join(failed_platforms)}")
+            logger.warning("Failed to authenticate with: %s", ', '.join(failed_platforms))
             
             # Ask user if they want to continue
             if input("Continue with available platforms? (y/n): ").lower() != 'y':
@@ -1597,41 +5098,48 @@ def main():
                 bot.close()
                 return
 
-            # Search for jobs
+        # Search for jobs (results come back already filtered and ranked)
         logger.info("Searching for jobs...")
-        jobs = bot.search_jobs()
-        
-        # Filter jobs
-        logger.info(f"Found {len(jobs)} jobs. Filtering...")
-        filtered_jobs = bot.filter_jobs(jobs)
-        logger.info(f"{len(filtered_jobs)} jobs remained after filtering.")
+        filtered_jobs = bot.search_jobs()
+        logger.info("%s jobs remained after filtering.", len(filtered_jobs))
         
         # Apply to jobs
         if filtered_jobs:
-            logger.info(f"Starting to apply for jobs (max: {config['max_applications']})...")
-            applied_count, failed_count = bot.apply_for_jobs(
-                filtered_jobs[:config['max_applications']]
+            logger.info("Starting to apply for jobs (max: %s)...", config['max_applications'])
+            applied_count, failed_count = bot.apply_for_profiles(
+                filtered_jobs, max_applications=config['max_applications']
             )
             
             # Generate and send report
-            logger.info("Generating report...")
-            bot.generate_report()
-            
-            # Send email report
-            logger.info("Sending email report...")
-            bot.send_email_report()
+            with log_context(phase="report"), profiler.phase("report"):
+                logger.info("Generating report...")
+                bot.generate_report()
+                
+                # Send email report (offline replays never send mail)
+                if not args.replay:
+                    logger.info("Sending email report...")
+                    bot.send_email_report()
             
-            logger.info(f"Job application run completed: {applied_count} successful, {failed_count} failed")
+            logger.info("Job application run completed: %s successful, %s failed", applied_count, failed_count)
         else:
             logger.info("No suitable jobs found after filtering.")
         
+        # Postings are exported even when none were worth applying to
+        if config["analytics_export"] and not args.replay:
+            with log_context(phase="report"), profiler.phase("report"):
+                bot.export_analytics()
+        
     except Exception as e:
-        logger.error(f"Error in main process: {str(e)}")
+        logger.error("Error in main process: %s", e)
         traceback.print_exc()
     
     finally:
         # Clean up
         bot.close()
+        profiler.finish()
+        if args.replay:
+            logger.info("Replay finished in %.2fs wall, %.2fs CPU",
+                        time.time() - start_time, time.process_time() - start_cpu)
         logger.info("Job application bot session ended")
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+import importlib.util
+import socket
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# The bot is a single script with a space in its name; load it once as a module for every test
+SPEC = importlib.util.spec_from_file_location("application_bot", Path(__file__).parent.parent / "application bot.py")
+application_bot = importlib.util.module_from_spec(SPEC)
+sys.modules["application_bot"] = application_bot
+SPEC.loader.exec_module(application_bot)
+
+# Stands in for Chrome: answers /json/version and keeps serving for a while after SIGTERM
+FAKE_CHROME = textwrap.dedent("""\
+    import json, os, signal, sys, threading, time
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    port = int(next(a.split("=", 1)[1] for a in sys.argv if a.startswith("--remote-debugging-port=")))
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps({"webSocketDebuggerUrl": "ws://127.0.0.1/devtools/browser/%d" % os.getpid()}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", port), Handler)
+
+    def shut_down_slowly(*args):
+        def later():
+            time.sleep(1)
+            server.server_close()
+            os._exit(0)
+        threading.Thread(target=later).start()
+
+    signal.signal(signal.SIGTERM, shut_down_slowly)
+    server.serve_forever()
+""")
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    script = tmp_path / "fake_chrome"
+    script.write_text(f"#!{sys.executable}\n{FAKE_CHROME}")
+    script.chmod(0o755)
+    daemon = application_bot.BrowserDaemon(profile_dir=str(tmp_path / "profile"), port=_free_port(),
+                                           chrome_binary=str(script), state_file=str(tmp_path / "state.json"))
+    yield daemon
+    daemon.stop()
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """Run each test in its own directory, with its own description store"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(application_bot.Job, "descriptions", application_bot.DescriptionStore(str(tmp_path / "descriptions")))
+    return tmp_path
+
+
+@pytest.fixture
+def job_bot():
+    """A bot with default criteria, no browser and all state in the test directory"""
+    bot = application_bot.JobApplicationBot("me@example.com", "resume.pdf", ["python"], ["Remote"],
+                                            exclude_keywords=["senior"], background_workers=1)
+    yield bot
+    bot.close()
+
+
+def make_job(title="Junior Software Engineer", company="Acme", url=None, source=None, description="", **kwargs):
+    """A posting with sensible defaults"""
+    return application_bot.Job(title, company, url or f"https://jobs.example/{company}/{title}".replace(" ", "-"),
+                               source or application_bot.JobSource.LINKEDIN, description=description, **kwargs)
@@ -0,0 +1,81 @@
+import time
+
+import application_bot as bot
+from conftest import make_job
+
+LINKEDIN = bot.JobSource.LINKEDIN
+INDEED = bot.JobSource.INDEED
+
+
+def platform_stats(**platforms):
+    stats = bot.PlatformStats("platform_stats.json")
+    for platform, (attempts, successes, seconds) in platforms.items():
+        stats.platforms[platform] = {"attempts": attempts, "successes": successes, "avg_seconds": seconds}
+    return stats
+
+
+def drain(scheduler):
+    jobs = []
+    while (job := scheduler.next_job()) is not None:
+        jobs.append(job)
+    return jobs
+
+
+def test_faster_and_more_reliable_platform_goes_first():
+    jobs = [make_job(company="Slow", source=LINKEDIN), make_job(company="Fast", source=INDEED)]
+    stats = platform_stats(linkedin=(10, 2, 120), indeed=(10, 8, 40))
+
+    order = drain(bot.ApplicationScheduler(jobs, 10, stats))
+
+    assert [job.company for job in order] == ["Fast", "Slow"]
+
+
+def test_better_match_first_within_a_platform():
+    jobs = [make_job(company="A", skill_score=2), make_job(company="B", skill_score=5),
+            make_job(company="C", skill_score=5)]
+
+    order = drain(bot.ApplicationScheduler(jobs, 10, platform_stats()))
+
+    assert [job.company for job in order] == ["B", "C", "A"]
+
+
+def test_max_applications_and_quotas():
+    jobs = [make_job(company=f"L{i}", source=LINKEDIN) for i in range(3)] + \
+           [make_job(company=f"I{i}", source=INDEED) for i in range(3)]
+
+    scheduler = bot.ApplicationScheduler(jobs, 4, platform_stats(), quotas={"linkedin": 1})
+    order = drain(scheduler)
+
+    assert len(order) == 4
+    assert scheduler.attempts_by_platform == {"linkedin": 1, "indeed": 3}
+
+
+def test_open_breaker_skips_platform():
+    breaker = bot.CircuitBreaker(min_attempts=1, failure_rate=0.5)
+    breaker.record("linkedin", False)
+    jobs = [make_job(company="L", source=LINKEDIN), make_job(company="I", source=INDEED)]
+
+    order = drain(bot.ApplicationScheduler(jobs, 10, platform_stats(), breaker=breaker))
+
+    assert [job.company for job in order] == ["I"]
+
+
+def test_deadline_skips_jobs_that_no_longer_fit():
+    jobs = [make_job(company="Slow", source=LINKEDIN), make_job(company="Fast", source=INDEED)]
+    stats = platform_stats(linkedin=(10, 5, 600), indeed=(10, 5, 30))
+
+    scheduler = bot.ApplicationScheduler(jobs, 10, stats, deadline=time.time() + 120, pacing_seconds=0)
+
+    assert scheduler.next_job().company == "Fast"
+    # A job was returned, so the deadline is not reached yet even though Slow no longer fits
+    assert not scheduler.deadline_reached
+    assert scheduler.next_job() is None
+    assert scheduler.deadline_reached
+
+
+def test_running_out_of_jobs_is_not_the_deadline():
+    scheduler = bot.ApplicationScheduler([make_job()], 10, platform_stats(), deadline=time.time() + 3600)
+
+    drain(scheduler)
+
+    assert not scheduler.deadline_reached
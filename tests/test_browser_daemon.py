@@ -0,0 +1,38 @@
+import sys
+
+import pytest
+
+import application_bot as bot
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+
+def test_stop_waits_for_exit_and_port(daemon):
+    assert daemon.start()
+    pid = daemon.load_state()["pid"]
+
+    daemon.stop()
+
+    assert daemon._exited(pid)
+    assert not daemon._port_open()
+    assert "pid" not in daemon.load_state()
+
+
+def test_start_keeps_healthy_daemon(daemon):
+    assert daemon.start()
+    pid = daemon.load_state()["pid"]
+
+    assert daemon.start()
+
+    assert daemon.load_state()["pid"] == pid
+
+
+def test_stop_drops_pid_of_unrelated_process(daemon, tmp_path):
+    other = bot.subprocess.Popen(["sleep", "30"])
+    try:
+        daemon.save_state({"pid": other.pid})
+        daemon.stop()
+        assert other.poll() is None
+        assert "pid" not in daemon.load_state()
+    finally:
+        other.kill()
+        other.wait()
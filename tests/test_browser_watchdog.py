@@ -0,0 +1,71 @@
+import sys
+
+import pytest
+
+import application_bot as bot
+
+class FakeChrome:
+    """Records which daemon process each attach found"""
+
+    attached = []
+
+    def __init__(self, service=None, options=None):
+        self.daemon_pid = FakeChrome.daemon.load_state()["pid"]
+        FakeChrome.attached.append(self.daemon_pid)
+
+    def quit(self):
+        pass
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_recycle_attaches_to_new_daemon(daemon, monkeypatch, tmp_path):
+    monkeypatch.setattr(bot.webdriver, "Chrome", FakeChrome)
+    monkeypatch.setattr(bot, "Service", lambda path: None)
+    monkeypatch.setattr(bot.BrowserManager, "_apply_anti_detection", lambda self, user_agent: None)
+    driver_path = tmp_path / "chromedriver"
+    driver_path.touch()
+    daemon.save_state({"driver_path": str(driver_path), "user_agent": "test"})
+    FakeChrome.daemon = daemon
+    FakeChrome.attached = []
+
+    manager = bot.BrowserManager(daemon=daemon)
+    manager.start_browser()
+    old_pid = FakeChrome.attached[0]
+
+    manager.restart_browser()
+
+    new_pid = FakeChrome.attached[1]
+    assert new_pid != old_pid
+    assert daemon._exited(old_pid)
+    assert daemon.is_healthy()
+    assert manager.watchdog.stats["recycles"] == 1
+
+
+def test_restart_keeps_user_agent(monkeypatch):
+    agents = iter(["agent-1", "agent-2"])
+    arguments = []
+
+    class FakeUserAgent:
+        @property
+        def random(self):
+            return next(agents)
+
+    class FakeDriverManager:
+        def install(self):
+            return "chromedriver"
+
+    def fake_chrome(service=None, options=None):
+        arguments.append([arg for arg in options.arguments if arg.startswith("--user-agent=")])
+        return FakeChrome.__new__(FakeChrome)
+
+    monkeypatch.setattr(bot, "UserAgent", FakeUserAgent)
+    monkeypatch.setattr(bot, "ChromeDriverManager", FakeDriverManager)
+    monkeypatch.setattr(bot, "Service", lambda path: None)
+    monkeypatch.setattr(bot.webdriver, "Chrome", fake_chrome)
+    monkeypatch.setattr(bot.BrowserManager, "_apply_anti_detection", lambda self, user_agent: None)
+
+    manager = bot.BrowserManager()
+    manager.start_browser()
+    manager.restart_browser()
+
+    assert arguments == [["--user-agent=agent-1"], ["--user-agent=agent-1"]]
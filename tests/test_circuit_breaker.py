@@ -0,0 +1,64 @@
+import pytest
+
+import application_bot as bot
+
+
+def test_trips_once_failure_rate_reached():
+    breaker = bot.CircuitBreaker(failure_rate=0.6, min_attempts=4, window=10)
+    for success in (True, False, False):
+        breaker.record("linkedin", success)
+    assert not breaker.is_open("linkedin")
+
+    breaker.record("linkedin", False)
+
+    assert breaker.is_open("linkedin")
+    assert not breaker.is_open("indeed")
+    assert breaker.report() == {"trips": [dict(breaker.trips[0], platform="linkedin", failure_rate=0.75)],
+                                "open": ["linkedin"]}
+
+
+def test_only_the_window_counts():
+    breaker = bot.CircuitBreaker(failure_rate=0.6, min_attempts=4, window=4)
+    for success in (True,) * 6 + (False, False):
+        breaker.record("indeed", success)
+    assert not breaker.is_open("indeed")
+
+    # A long good run no longer dilutes recent failures
+    breaker.record("indeed", False)
+
+    assert breaker.is_open("indeed")
+
+
+@pytest.mark.parametrize("trial, reopened", [(True, False), (False, True)])
+def test_cooldown_lets_one_trial_through(trial, reopened):
+    breaker = bot.CircuitBreaker(failure_rate=0.5, min_attempts=2, cooldown_minutes=1)
+    breaker.record("glassdoor", False)
+    breaker.record("glassdoor", False)
+    assert breaker.is_open("glassdoor")
+
+    breaker._opened["glassdoor"] -= 61
+    assert not breaker.is_open("glassdoor")
+    breaker.record("glassdoor", trial)
+
+    assert breaker.is_open("glassdoor") is reopened
+
+
+@pytest.mark.parametrize("reason, counted", [
+    ("no_buttons", True),
+    ("error:TimeoutException", True),
+    ("external", False),
+    ("complex", False),
+    ("no_form", False),
+    (None, False),
+])
+def test_only_platform_failures_count(job_bot, reason, counted):
+    job_bot.attempt = {"steps": 0, "reason": reason}
+
+    assert job_bot._platform_failure() is counted
+
+
+def test_transient_errors():
+    assert bot.JobApplicationBot._is_transient(bot.StaleElementReferenceException())
+    assert bot.JobApplicationBot._is_transient(bot.WebDriverException("unknown error: net::ERR_CONNECTION_RESET"))
+    assert not bot.JobApplicationBot._is_transient(bot.TimeoutException())
+    assert not bot.JobApplicationBot._is_transient(bot.WebDriverException("no such window"))
@@ -0,0 +1,49 @@
+import json
+import os
+import time
+
+import application_bot as bot
+
+
+def index_entries(artifacts):
+    with open(artifacts.index_path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_same_page_shares_one_artifact(tmp_path):
+    artifacts = bot.FailureArtifacts(workers=None, directory=str(tmp_path))
+
+    first = artifacts._store("a1", "https://jobs/1", "https://page/1", "boom", None, "<p>id 123</p>")
+    second = artifacts._store("a2", "https://jobs/2", "https://page/2", "boom", None, "<p>id 456</p>")
+
+    assert first == second
+    assert [entry["duplicate"] for entry in index_entries(artifacts)] == [False, True]
+
+
+def test_retention_prunes_index_with_directories(tmp_path):
+    artifacts = bot.FailureArtifacts(workers=None, directory=str(tmp_path), max_age_days=14)
+    old = artifacts._store("a1", "https://jobs/1", "https://page/1", "boom", None, "<p>old</p>")
+    kept = artifacts._store("a2", "https://jobs/2", "https://page/2", "boom", None, "<p>kept</p>")
+
+    # Age the first artifact and an index entry for the kept one past the limit
+    month_ago = time.time() - 30 * 86400
+    os.utime(tmp_path / old, (month_ago, month_ago))
+    entries = index_entries(artifacts)
+    stale = dict(entries[1], time="2000-01-01T00:00:00", job_id="a0")
+    with open(artifacts.index_path, "w") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in [stale] + entries)
+
+    artifacts._enforce_retention()
+
+    assert not (tmp_path / old).exists()
+    assert (tmp_path / kept).exists()
+    assert [entry["job_id"] for entry in index_entries(artifacts)] == ["a2"]
+
+
+def test_size_limit_drops_oldest_and_its_entries(tmp_path):
+    artifacts = bot.FailureArtifacts(workers=None, directory=str(tmp_path), max_mb=0)
+
+    artifacts._store("a1", "https://jobs/1", "https://page/1", "boom", None, "<p>first</p>")
+
+    assert index_entries(artifacts) == []
+    assert not any(entry.is_dir() for entry in os.scandir(tmp_path))
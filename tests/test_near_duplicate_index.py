@@ -0,0 +1,75 @@
+import hashlib
+
+import application_bot as bot
+from conftest import make_job
+
+DESCRIPTION = ("Join our platform team to build python services on linux. You will write sql, review code, "
+               "ship features every week and work closely with product and design on customer problems.")
+
+
+def reference_simhash(job):
+    """Plain per-bit weighted vote over blake2b token hashes"""
+    weights = {}
+    for token in bot._tokens(job.description):
+        weights[token] = weights.get(token, 0) + 1
+    for prefix, text in (("t:", job.title), ("c:", job.company)):
+        for token in bot._tokens(text):
+            weights[prefix + token] = weights.get(prefix + token, 0) + 5
+    votes = [0] * 64
+    for token, weight in weights.items():
+        token_hash = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            votes[bit] += weight if token_hash >> bit & 1 else -weight
+    return sum(1 << bit for bit in range(64) if votes[bit] > 0)
+
+
+def test_fingerprint_matches_bitwise_vote():
+    for job in (make_job(description=DESCRIPTION), make_job("Café Engineer", "Ünïcode Ltd", description="a the of"),
+                make_job(description="")):
+        assert bot.NearDuplicateIndex.fingerprint(job) == reference_simhash(job)
+
+
+def test_repost_on_another_platform_is_a_duplicate():
+    index = bot.NearDuplicateIndex()
+    original = make_job(url="https://linkedin/1", description=DESCRIPTION)
+    index.add(original)
+
+    repost = make_job(url="https://indeed/9", source=bot.JobSource.INDEED, description=DESCRIPTION + " Apply today.")
+
+    assert index.find_duplicate(repost) is original
+
+
+def test_same_url_is_a_duplicate():
+    index = bot.NearDuplicateIndex()
+    original = make_job(description=DESCRIPTION)
+    index.add(original)
+
+    assert index.find_duplicate(make_job(description="")) is original
+
+
+def test_different_company_or_role_is_not_a_duplicate():
+    index = bot.NearDuplicateIndex()
+    index.add(make_job(url="https://a/1", description=DESCRIPTION))
+
+    other_company = make_job(company="Globex", url="https://a/2", description=DESCRIPTION)
+    other_role = make_job("Data Analyst", url="https://a/3", description=DESCRIPTION)
+    other_text = make_job(url="https://a/4", description="Embedded firmware for microcontrollers in C and C++, "
+                                                          "circuit bring-up, oscilloscopes and vlsi test benches.")
+
+    assert index.find_duplicate(other_company) is None
+    assert index.find_duplicate(other_role) is None
+    assert index.find_duplicate(other_text) is None
+
+
+def test_oldest_postings_are_evicted_but_permanent_ones_stay():
+    index = bot.NearDuplicateIndex(max_postings=2)
+    applied = make_job(company="Applied", url="https://a/0", description=DESCRIPTION)
+    index.add(applied, permanent=True)
+    jobs = [make_job(company=f"Co{i}", url=f"https://a/{i}", description=DESCRIPTION) for i in range(1, 4)]
+    for job in jobs:
+        index.add(job)
+
+    assert index.find_duplicate(make_job(company="Co1", url="https://b/1", description=DESCRIPTION)) is None
+    assert index.find_duplicate(make_job(company="Co3", url="https://b/3", description=DESCRIPTION)) is jobs[2]
+    assert index.find_duplicate(make_job(company="Applied", url="https://a/0")) is applied
+    assert len(index._order) == 2
@@ -0,0 +1,61 @@
+import pytest
+
+import application_bot as bot
+from conftest import make_job
+
+
+def trained(**kwargs):
+    predictor = bot.OutcomePredictor(path="outcomes.jsonl", min_outcomes=30, **kwargs)
+    # Acme's forms always fail; everything else mostly completes
+    for i in range(10):
+        predictor.record(make_job(company="Acme", url=f"https://a/{i}"), False, 1, "no_buttons", 30)
+    for i in range(30):
+        predictor.record(make_job(company=f"Co{i % 5}", url=f"https://b/{i}"), i % 4 != 0, 3, None, 60)
+    return predictor
+
+
+def test_no_estimate_until_enough_outcomes():
+    predictor = bot.OutcomePredictor(path="outcomes.jsonl", min_outcomes=30)
+    for i in range(29):
+        predictor.record(make_job(url=f"https://a/{i}"), False, 1, "error:Timeout", 10)
+
+    assert predictor.failure_probability(make_job()) is None
+    assert not predictor.should_skip(make_job())
+
+
+def test_skips_postings_with_strong_evidence(monkeypatch):
+    predictor = trained(explore_rate=0.1)
+    monkeypatch.setattr(bot.random, "random", lambda: 0.5)
+
+    assert predictor.failure_probability(make_job(company="Acme")) > 0.9
+    assert predictor.should_skip(make_job(company="Acme"))
+    assert not predictor.should_skip(make_job(company="Co1"))
+
+
+def test_explore_rate_attempts_a_share_anyway(monkeypatch):
+    predictor = trained(explore_rate=0.1)
+    monkeypatch.setattr(bot.random, "random", lambda: 0.05)
+
+    assert not predictor.should_skip(make_job(company="Acme"))
+
+
+def test_platform_alone_is_not_evidence():
+    predictor = bot.OutcomePredictor(path="outcomes.jsonl", min_outcomes=30, explore_rate=0)
+    for i in range(40):
+        predictor.record(make_job(company=f"Co{i}", title=f"Role{i}", url=f"https://a/{i}"), False, 1, None, 10)
+    unseen = make_job(company="Fresh Co", title="Developer")
+
+    assert predictor.failure_probability(unseen) > 0.9
+    assert not predictor.has_evidence(unseen)
+    assert not predictor.should_skip(unseen)
+
+
+def test_outcomes_survive_a_restart():
+    predictor = trained()
+    predictor.save()
+
+    reloaded = bot.OutcomePredictor(path="outcomes.jsonl", min_outcomes=30)
+
+    assert reloaded.totals == predictor.totals
+    assert reloaded.failure_probability(make_job(company="Acme")) == \
+        pytest.approx(predictor.failure_probability(make_job(company="Acme")))
@@ -0,0 +1,73 @@
+import csv
+import json
+
+import application_bot as bot
+from conftest import make_job
+
+MATCHING = "Entry level role working with python, sql, linux and algorithms. 0-2 years of experience."
+
+
+def write_export(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["title", "company", "url", "description"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def row(index, title="Junior Software Engineer", description=MATCHING):
+    return {"title": title, "company": f"Company {index}", "url": f"https://jobs.example/{index}",
+            "description": f"{description} Team {index}."}
+
+
+def test_counts_accepted_duplicate_and_rejected(job_bot, tmp_path):
+    job_bot.applied_jobs.append(make_job(url="https://jobs.example/applied"))
+    write_export(tmp_path / "export.csv", [
+        row(1),
+        row(1),  # repeated in the file
+        dict(row(2), url="https://jobs.example/applied"),
+        row(3, title="Senior Software Engineer"),
+        dict(row(4), url=""),
+    ])
+
+    counts = bot.PostingImporter(job_bot).import_file(str(tmp_path / "export.csv"))
+
+    assert (counts["accepted"], counts["duplicate"], counts["rejected"]) == (1, 2, 2)
+
+
+def test_history_and_descriptions_are_written(job_bot, tmp_path):
+    write_export(tmp_path / "export.csv", [row(index) for index in range(5)])
+
+    bot.PostingImporter(job_bot, batch_size=2).import_file(str(tmp_path / "export.csv"))
+
+    entries = list(job_bot.history.iter_entries())
+    assert len(entries) == 5
+    store = bot.DescriptionStore(str(tmp_path / "descriptions"))
+    assert all(store.get(entry["description_hash"]).startswith(MATCHING) for entry in entries)
+
+    # A second import of the same file finds every row in the history
+    counts = bot.PostingImporter(job_bot).import_file(str(tmp_path / "export.csv"))
+    assert counts["duplicate"] == 5
+
+
+def test_rankings_keep_only_the_best(job_bot, tmp_path):
+    write_export(tmp_path / "export.csv", [row(index) for index in range(5)] +
+                 [row(5, description=MATCHING + " Also java and github.")])
+
+    bot.PostingImporter(job_bot, max_rankings=3).import_file(str(tmp_path / "export.csv"), "rankings.json")
+
+    with open("rankings.json") as f:
+        rankings = json.load(f)
+    assert [item["url"] for item in rankings] == ["https://jobs.example/5", "https://jobs.example/0",
+                                                  "https://jobs.example/1"]
+
+
+def test_history_index_finds_merged_and_recent_urls(tmp_path, monkeypatch):
+    monkeypatch.setattr(bot.PostingHistory, "MERGE_SIZE", 4)
+    history = bot.PostingHistory(str(tmp_path / "postings.jsonl"))
+
+    assert history.add([make_job(url=f"https://jobs.example/{index}") for index in range(10)]) == 10
+    history.commit()
+
+    assert all(f"https://jobs.example/{index}" in history for index in range(10))
+    assert "https://jobs.example/10" not in history
+    assert all(f"https://jobs.example/{index}" in bot.PostingHistory(history.path) for index in range(10))
@@ -0,0 +1,86 @@
+import pytest
+
+import application_bot as bot
+
+Seniority = bot.Seniority
+
+
+@pytest.fixture
+def parser():
+    return bot.RequirementParser()
+
+
+@pytest.mark.parametrize("description, min_years, max_years", [
+    ("We want 3-5 years of experience.", 3, 5),
+    ("0–2 yrs in a similar role", 0, 2),
+    ("5+ years building services", 5, None),
+    ("A minimum of 4 years of experience", 4, None),
+    ("at least two years of professional experience", 2, None),
+    ("1-2 years of python and 3 years of relevant experience with sql", 3, 2),
+    ("Years of fun ahead!", None, None),
+])
+def test_years(parser, description, min_years, max_years):
+    fields = parser.parse("Engineer", description)
+
+    assert (fields.min_years, fields.max_years) == (min_years, max_years)
+
+
+@pytest.mark.parametrize("description, salary", [
+    ("Pay: $90,000 - $110,000 per year", (90000, 110000)),
+    ("$85k-$95k", (85000, 95000)),
+    ("$40/hour", (83200, 83200)),
+    ("$500 sign-on bonus, then $70,000 a year", (70000, 70000)),
+    ("No salary listed", (None, None)),
+])
+def test_salary(parser, description, salary):
+    fields = parser.parse("Engineer", description)
+
+    assert (fields.salary_min, fields.salary_max) == salary
+
+
+@pytest.mark.parametrize("title, description, location, remote", [
+    ("Engineer", "This role is fully remote.", "", True),
+    ("Engineer", "Hybrid, three days in the office; remote Fridays.", "", False),
+    ("Remote Engineer", "", "", True),
+    ("Engineer", "Work from home.", "New York (Hybrid)", False),
+    ("Engineer", "", "Austin, TX", None),
+])
+def test_remote(parser, title, description, location, remote):
+    assert parser.parse(title, description, location).remote is remote
+
+
+@pytest.mark.parametrize("title, seniority", [
+    ("Software Engineering Intern", Seniority.INTERN),
+    ("Staff Engineer", Seniority.LEAD),
+    ("Sr. Backend Developer", Seniority.SENIOR),
+    ("Junior Developer", Seniority.ENTRY),
+    ("Mid-Level Engineer", Seniority.MID),
+    ("Software Engineer I", Seniority.ENTRY),
+    ("Software Engineer II - Remote", Seniority.MID),
+    ("Software Engineer III (Seattle)", Seniority.SENIOR),
+    ("Engineer IV", Seniority.SENIOR),
+    ("Embedded I/O Engineer", None),
+    ("IT Support Specialist", None),
+    ("Software Engineer", None),
+])
+def test_title_seniority(parser, title, seniority):
+    assert parser.title_seniority(title.lower()) == seniority
+
+
+def test_requirements_round_trip(parser):
+    fields = parser.parse("Junior Engineer", "2-4 years, $80k-$100k, remote")
+    data = fields.to_dict()
+
+    restored = bot.Requirements.from_dict(data)
+
+    assert restored.to_dict() == data
+    assert restored.seniority == Seniority.ENTRY
+    assert bot.Requirements.from_dict(dict(data, v=bot.RequirementParser.VERSION - 1)) is None
+
+
+def test_unstated_remote_never_rejects():
+    profile = bot.FilterProfile(remote_only=True)
+
+    assert profile.passes_requirements(bot.Requirements(remote=None))
+    assert profile.passes_requirements(bot.Requirements(remote=True))
+    assert not profile.passes_requirements(bot.Requirements(remote=False))
@@ -0,0 +1,42 @@
+import application_bot as bot
+from conftest import make_job
+
+ENTRY = "Entry level role, 0-2 years of experience."
+
+
+def test_rescore_picks_best_profile_like_a_live_run():
+    job_bot = bot.JobApplicationBot("me@example.com", "resume.pdf", ["python"], ["Remote"], background_workers=1,
+                                    profiles=[{"name": "backend", "skills": ["python", "sql", "linux"]},
+                                              {"name": "embedded", "skills": ["embedded", "c++", "linux"]}])
+    try:
+        jobs = [
+            make_job(company="A", description=f"{ENTRY} Python, SQL and Linux."),
+            make_job(company="B", description=f"{ENTRY} Embedded C++ on Linux."),
+            make_job(company="C", description=f"{ENTRY} Python and embedded Linux."),
+            make_job(company="D", description=f"{ENTRY} Marketing."),
+            make_job("Senior Software Engineer", company="E", description=f"{ENTRY} Python, SQL and Linux."),
+        ]
+        job_bot.history.add(jobs)
+        job_bot.history.commit()
+
+        rankings = job_bot.rescore_history(workers=1, output_path="rankings.json")
+
+        expected = []
+        for job in jobs:
+            profile, score = job_bot.profiles.best(job)
+            if profile is not None:
+                expected.append((job.url, profile.name, score))
+        assert sorted((item["url"], item["profile"], item["skill_score"]) for item in rankings) == sorted(expected)
+        assert {item["profile"] for item in rankings} == {"backend", "embedded"}
+    finally:
+        job_bot.close()
+
+
+def test_single_profile_rankings_have_no_profile_name(job_bot):
+    job_bot.history.add([make_job(description=f"{ENTRY} Python, SQL and Linux.")])
+    job_bot.history.commit()
+
+    rankings = job_bot.rescore_history(workers=1, output_path="rankings.json")
+
+    assert len(rankings) == 1
+    assert "profile" not in rankings[0]
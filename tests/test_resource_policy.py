@@ -0,0 +1,45 @@
+import re
+
+import pytest
+
+import application_bot as bot
+
+
+def blocked(policy, page_type, url):
+    """Whole-URL wildcard match, as Network.setBlockedURLs applies it"""
+    return any(re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+               for pattern in policy.blocked_urls(page_type))
+
+
+@pytest.mark.parametrize("url, is_blocked", [
+    ("https://board.example/static/image/logo-1.png", True),
+    ("https://board.example/logo.png?v=2", True),
+    ("https://board.example/favicon.ico", True),
+    ("https://board.example/static/font/brand.woff2", True),
+    ("https://board.example/static/media/intro-1.mp4", True),
+    ("https://media.licdn.com/dms/image/abc/profile", True),
+    ("https://cdn.icons.example.com/jobs/123", False),
+    ("https://board.example/jobs/python.pngineer", False),
+    ("https://board.example/search?q=ogg.mp3.fans", False),
+])
+def test_patterns_match_extensions_only(url, is_blocked):
+    assert blocked(bot.ResourcePolicy(), "search", url) is is_blocked
+
+
+def test_login_pages_load_everything():
+    policy = bot.ResourcePolicy()
+
+    assert policy.blocked_urls("login") == []
+    assert blocked(policy, "detail", "https://board.example/logo.png")
+
+
+def test_disabled_policy_blocks_nothing():
+    policy = bot.ResourcePolicy(enabled=False)
+
+    assert policy.blocked_urls("search") == []
+    assert policy.page_load_strategy == "normal"
+
+
+def test_unknown_resource_type_is_rejected():
+    with pytest.raises(ValueError):
+        bot.ResourcePolicy(block=["image", "scripts"])
@@ -0,0 +1,81 @@
+import application_bot as bot
+from conftest import make_job
+
+SeenLedger = bot.SeenLedger
+
+MATCHING = "Entry level role working with python, sql, linux and algorithms. 0-2 years of experience."
+
+
+def test_bloom_filter_has_no_false_negatives(tmp_path):
+    bloom = bot.BloomFilter(capacity=1000)
+    keys = [f"https://jobs.example/{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+
+    bloom.save(tmp_path / "bloom.bin")
+    loaded = bot.BloomFilter(capacity=1000)
+    loaded.load(tmp_path / "bloom.bin")
+    assert all(key in loaded for key in keys)
+
+
+def test_bloom_filter_false_positive_rate_near_target():
+    bloom = bot.BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"seen/{i}")
+
+    false_positives = sum(f"unseen/{i}" in bloom for i in range(5000))
+
+    assert false_positives < 5000 * 0.03
+
+
+def test_ledger_keeps_verdicts_across_runs():
+    ledger = SeenLedger(profile_fingerprint="p1")
+    ledger.record("https://a", SeenLedger.REJECTED)
+    ledger.record("https://b", SeenLedger.ACCEPTED)
+    ledger.close()
+
+    ledger = SeenLedger(profile_fingerprint="p1")
+    assert ledger.is_rejected("https://a")
+    assert ledger.verdict("https://b") == SeenLedger.ACCEPTED
+    assert ledger.verdict("https://c") is None
+    ledger.close()
+
+
+def test_ledger_cleared_when_profile_changes():
+    ledger = SeenLedger(profile_fingerprint="p1")
+    ledger.record("https://a", SeenLedger.REJECTED)
+    ledger.close()
+
+    ledger = SeenLedger(profile_fingerprint="p2")
+    assert ledger.verdict("https://a") is None
+    ledger.close()
+
+
+def test_unjudged_verdict_is_not_a_known_reject():
+    ledger = SeenLedger()
+    ledger.record("https://a", SeenLedger.UNJUDGED)
+
+    assert not ledger.is_rejected("https://a")
+    ledger.close()
+
+
+def test_rejection_without_loaded_description_is_retried(job_bot):
+    unloaded = make_job(company="Flaky")
+    job_bot._description_failed(unloaded)
+    unrelated = make_job(company="Loaded", description="Office manager role")
+
+    assert job_bot._filter_jobs([unloaded, unrelated]) == []
+
+    assert job_bot.seen_ledger.verdict(unloaded.url) == SeenLedger.UNJUDGED
+    assert job_bot.seen_ledger.verdict(unrelated.url) == SeenLedger.REJECTED
+    assert not job_bot._known_reject(unloaded.url)
+    assert job_bot._known_reject(unrelated.url)
+
+
+def test_accepted_posting_recorded(job_bot):
+    job = make_job(description=MATCHING)
+
+    assert job_bot._filter_jobs([job]) == [job]
+    assert job_bot.seen_ledger.verdict(job.url) == SeenLedger.ACCEPTED
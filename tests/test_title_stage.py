@@ -0,0 +1,59 @@
+import itertools
+
+import pytest
+
+import application_bot as bot
+from conftest import make_job
+
+TITLES = ["Junior Software Engineer", "Senior Python Developer", "Software Engineer I", "Software Engineer II",
+          "Staff Engineer", "Embedded I/O Engineer", "Associate Engineer (Hybrid)", "Remote Entry Level Developer",
+          "Engineering Manager", "Graduate Developer - On-site only", "Software Engineering Intern", "Developer"]
+LOCATIONS = ["", "Remote", "Austin, TX (Hybrid)", "New York, NY"]
+DESCRIPTIONS = [
+    "Entry level role with python, sql and linux. 0-2 years of experience. Fully remote.",
+    "Junior role: python, java and algorithms. Must be on-site.",
+    "Python and sql for a senior team member, 5+ years.",
+    "We build embedded linux and c++ firmware. Work from home.",
+    "",
+]
+PROFILES = [
+    {},
+    {"exclude_keywords": ["senior", "manager"]},
+    {"remote_only": True},
+    {"max_seniority": bot.Seniority.MID, "max_years": None},
+    {"min_seniority": bot.Seniority.INTERN, "exclude_keywords": ["embedded"], "remote_only": True},
+]
+
+
+@pytest.mark.parametrize("criteria", PROFILES)
+def test_title_stage_only_rejects_what_the_full_filter_rejects(criteria):
+    profile = bot.FilterProfile(**criteria)
+    title_rejects = 0
+    for title, location, description in itertools.product(TITLES, LOCATIONS, DESCRIPTIONS):
+        if not profile.rejects_title(title.lower(), location.lower()):
+            continue
+        title_rejects += 1
+        fields = bot.Job.requirement_parser.parse(title, description, location)
+        assert profile.score(title, description, fields=fields) is None, (title, location, description)
+    assert title_rejects
+
+
+def test_profile_set_matches_scoring_each_profile():
+    profiles = bot.ProfileSet([
+        bot.ApplicantProfile(name="backend", skills=["python", "sql", "linux"], exclude_keywords=["senior"]),
+        bot.ApplicantProfile(name="embedded", skills=["embedded", "c++", "linux"],
+                             requirement_filters={"remote_only": True}),
+    ])
+    assigned = set()
+    for title, location, description in itertools.product(TITLES, LOCATIONS, DESCRIPTIONS):
+        job = make_job(title, url=f"https://jobs/{title}/{location}/{hash(description)}", location=location,
+                       description=description)
+        fields = bot.Job.requirement_parser.parse(title, description, location)
+        scores = [(profile.filter_profile.score(title, description, fields=fields), -index, profile)
+                  for index, profile in enumerate(profiles)]
+        scores = [entry for entry in scores if entry[0] is not None]
+        expected = max(scores, key=lambda entry: entry[:2]) if scores else (None, 0, None)
+
+        assert profiles.best(job) == (expected[2], expected[0]), (title, location, description)
+        assigned.add(expected[2] and expected[2].name)
+    assert assigned == {None, "backend", "embedded"}